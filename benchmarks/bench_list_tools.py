@@ -0,0 +1,55 @@
+"""Micro-benchmark for answering MCP ``tools/list``.
+
+Compares rebuilding every ``Tool`` model per request (the previous
+behaviour) with serving the catalog cached by the tool registry, both for
+the ``list_tools`` function alone and for the full low-level MCP request
+handler.
+
+Run with::
+
+    python benchmarks/bench_list_tools.py [iterations]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import mcp_webexcalling
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp.types import ListToolsRequest
+
+from mcp_webexcalling import server
+
+
+def rebuild_catalog():
+    return [spec.to_tool() for spec in server.registry]
+
+
+async def bench(label, func, iterations):
+    await func()  # warm up (builds the cached catalog on first use)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:<40} {per_call * 1e6:10.1f} us/request")
+    return per_call
+
+
+async def main(iterations):
+    handler = server.server.request_handlers[ListToolsRequest]
+    request = ListToolsRequest(method="tools/list")
+
+    async def rebuilt():
+        return rebuild_catalog()
+
+    print(f"{len(server.registry)} tools, {iterations} iterations\n")
+    before = await bench("rebuild Tool models per request", rebuilt, iterations)
+    after = await bench("cached catalog (list_tools)", server.list_tools, iterations)
+    await bench("cached catalog (MCP request handler)", lambda: handler(request), iterations)
+    print(f"\nlist_tools speed-up: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,67 @@
+"""Micro-benchmark for local people search.
+
+Builds a :class:`~mcp_webexcalling.search_index.TrigramIndex` over a
+synthetic directory and times typical ``search_users`` queries (a first
+name, a misspelt full name, name + location, an extension and a phone
+number). Each of these previously cost two sequential ``/people`` requests.
+
+Run with::
+
+    python benchmarks/bench_search.py [users]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import mcp_webexcalling
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_webexcalling.search_index import TrigramIndex
+
+FIRST = ["Ada", "Bob", "Carla", "Deepak", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jon",
+         "Kwame", "Lucia", "Mateo", "Nadia", "Oskar", "Priya", "Quinn", "Rosa", "Sven", "Tomas"]
+LAST = ["Smith", "Lovelace", "Nguyen", "Okafor", "Garcia", "Kowalski", "Tanaka", "Berg",
+        "Haddad", "Ivanova", "Jensen", "Khan", "Lindqvist", "Moreau", "Novak", "Olsen"]
+CITIES = ["Raleigh", "San Jose", "London", "Sydney", "Bangalore", "Krakow", "Toronto",
+          "Lisbon", "Nairobi", "Osaka"]
+
+
+def make_directory(count):
+    locations = {f"loc{i}": {"id": f"loc{i}", "name": name} for i, name in enumerate(CITIES)}
+    people = {}
+    for i in range(count):
+        # Vary the names with a suffix so the pool isn't a few hundred clones.
+        first = FIRST[i % len(FIRST)] + ("" if i % 3 else "ette"[: i % 4])
+        last = LAST[(i // len(FIRST)) % len(LAST)] + chr(ord("a") + i % 26) * (i % 2)
+        people[f"p{i}"] = {
+            "id": f"p{i}",
+            "displayName": f"{first} {last}",
+            "firstName": first,
+            "lastName": last,
+            "emails": [f"{first}.{last}{i}@example.com".lower()],
+            "extension": str(10000 + i),
+            "phoneNumbers": [{"type": "work", "value": f"+1415{i:07d}"}],
+            "locationId": f"loc{(i // 7) % len(CITIES)}",
+        }
+    return people, locations
+
+
+def main(count):
+    people, locations = make_directory(count)
+    start = time.perf_counter()
+    index = TrigramIndex(people, locations)
+    print(f"{count} people, built in {(time.perf_counter() - start) * 1000:.0f} ms, "
+          f"{index.stats()['trigrams']} trigrams\n")
+    for query in ("grace", "deepk okafr", "bob raleigh", "grace.berg@example.com",
+                  "10042", "+1 415 000 0042"):
+        best = float("inf")
+        for _ in range(20):
+            start = time.perf_counter()
+            hits = index.search(query, limit=20)
+            best = min(best, time.perf_counter() - start)
+        print(f"{query!r:<26} {best * 1000:8.3f} ms {len(hits):4d} hits")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,76 @@
+"""Micro-benchmark for serializing large tool responses.
+
+Compares the previous pretty-printed stdlib encoding with the compact
+output of :mod:`mcp_webexcalling.serializer`, using both the stdlib and
+(when installed) orjson, on a synthetic ``list_users(max_results=0)``-sized
+payload. Reports encode time and bytes on the wire.
+
+Run with::
+
+    python benchmarks/bench_serialization.py [users]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import mcp_webexcalling
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mcp_webexcalling import serializer
+
+
+def make_users(count):
+    return [
+        {
+            "id": f"Y2lzY29zcGFyazovL3VzL1BFT1BMRS97{i:08d}",
+            "emails": [f"user{i}@example.com"],
+            "phoneNumbers": [{"type": "work", "value": f"+1415555{i % 10000:04d}"}],
+            "extension": str(1000 + i),
+            "displayName": f"User Number {i}",
+            "firstName": "User",
+            "lastName": f"Number {i}",
+            "orgId": "Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9vcmcx",
+            "locationId": f"Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2xvYy{i % 20}",
+            "licenses": ["lic-calling", "lic-messaging"],
+            "created": "2024-01-01T00:00:00.000Z",
+            "status": "active",
+            "type": "person",
+        }
+        for i in range(count)
+    ]
+
+
+def bench(label, encode, payload, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = encode(payload)
+        best = min(best, time.perf_counter() - start)
+    size = len(text.encode("utf-8"))
+    print(f"{label:<32} {best * 1000:8.1f} ms {size / 1024:10.0f} KiB")
+    return best, size
+
+
+def main(count):
+    payload = {"items": make_users(count), "total": count}
+    print(f"{count} users\n")
+    before = bench("json indent=2 (previous)", lambda d: json.dumps(d, indent=2, default=str), payload)
+    orjson, serializer.orjson = serializer.orjson, None
+    try:
+        bench("json compact", serializer.dumps, payload)
+    finally:
+        serializer.orjson = orjson
+    if orjson is not None:
+        after = bench("orjson compact", serializer.dumps, payload)
+        print(
+            f"\norjson compact vs previous: {before[0] / after[0]:.0f}x faster, "
+            f"{100 * (1 - after[1] / before[1]):.0f}% fewer bytes"
+        )
+    else:
+        print("\norjson not installed; pip install orjson to compare")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -1,5 +1,8 @@
 """Area code to state mapping for call reporting"""
 
+from array import array
+from typing import Iterable, Optional
+
 # Comprehensive mapping of area codes to US states
 # Format: {area_code: state_name}
 AREA_CODE_TO_STATE = {
@@ -147,6 +150,15 @@ for area_code, state in AREA_CODE_TO_STATE.items():
         STATE_TO_AREA_CODES[state] = []
     STATE_TO_AREA_CODES[state].append(area_code)
 
+# Dense state IDs (1-based; 0 means "no US state") and a 1000-slot table
+# indexed by the numeric NPA, so "which state is this area code in" is a
+# single array read instead of a dict lookup or list scan.
+STATE_NAMES = [None] + sorted(STATE_TO_AREA_CODES)
+STATE_IDS = {name: state_id for state_id, name in enumerate(STATE_NAMES) if name}
+NPA_TO_STATE_ID = array("B", bytes(1000))
+for area_code, state in AREA_CODE_TO_STATE.items():
+    NPA_TO_STATE_ID[int(area_code)] = STATE_IDS[state]
+
 # Normalize state names (handle variations)
 STATE_NORMALIZATION = {
     "nc": "North Carolina",
@@ -284,42 +296,79 @@ def get_area_codes_for_state(state: str) -> list[str]:
     return STATE_TO_AREA_CODES.get(normalized_state, [])
 
 
+# Formatting characters dropped before parsing a number.
+_NUMBER_PUNCTUATION = str.maketrans("", "", "-(). ")
+
+
 def extract_area_code(phone_number: str) -> str:
     """Extract area code from a phone number string (handles E.164 format)"""
+    npa = npa_for_number(phone_number)
+    return "%03d" % npa if npa >= 0 else None
+
+
+def npa_for_number(phone_number) -> int:
+    """Return the area code of ``phone_number`` as an int, or -1 if none.
+
+    Accepts E.164 (``+1XXXXXXXXXX``), 11-digit ``1XXXXXXXXXX`` and local
+    formats with ``-().`` / space separators; other international numbers
+    have no area code.
+    """
     if not phone_number:
-        return None
-    
-    # Convert to string and remove whitespace
-    cleaned = str(phone_number).strip()
+        return -1
     
-    if not cleaned:
-        return None
-    
-    # Handle E.164 format: +1XXXXXXXXXX or +1-XXX-XXX-XXXX
-    # Remove common formatting characters
-    cleaned = cleaned.replace("-", "").replace("(", "").replace(")", "").replace(".", "").replace(" ", "").strip()
+    # Remove common formatting characters in one pass
+    cleaned = str(phone_number).strip().translate(_NUMBER_PUNCTUATION)
     
     # Handle E.164 format with +1 prefix
     if cleaned.startswith("+1"):
-        cleaned = cleaned[2:]  # Remove "+1"
+        cleaned = cleaned[2:]
+    elif cleaned.startswith("+"):
+        # Not a US number format
+        return -1
     elif cleaned.startswith("1") and len(cleaned) == 11:
         # US number starting with 1 (country code without +)
         cleaned = cleaned[1:]
-    elif cleaned.startswith("+"):
-        # International format, try to extract US number
-        # E.164 for US: +1 followed by 10 digits
-        if cleaned.startswith("+1") and len(cleaned) >= 12:
-            cleaned = cleaned[2:]
-        else:
-            # Not a US number format
-            return None
     
-    # At this point, cleaned should be 10 digits for US numbers
     # Extract first 3 digits as area code
-    if len(cleaned) >= 3 and cleaned[:3].isdigit():
-        return cleaned[:3]
-    
-    return None
+    head = cleaned[:3]
+    if len(head) == 3 and head.isdigit() and head.isascii():
+        return int(head)
+    return -1
+
+
+def state_id_for_npa(npa: int) -> int:
+    """Return the state ID for a numeric area code (0 if not a US state)."""
+    return NPA_TO_STATE_ID[npa] if 0 <= npa < 1000 else 0
+
+
+def state_for_area_code(area_code) -> Optional[str]:
+    """Return the state name for an area code (str or int), or None."""
+    try:
+        npa = int(area_code)
+    except (TypeError, ValueError):
+        return None
+    return STATE_NAMES[state_id_for_npa(npa)]
+
+
+def state_for_number(phone_number: str) -> Optional[str]:
+    """Return the US state a phone number's area code belongs to, or None."""
+    return STATE_NAMES[state_id_for_npa(npa_for_number(phone_number))]
+
+
+def classify_numbers(phone_numbers: Iterable) -> array:
+    """Classify a column of phone numbers into state IDs in one pass.
+
+    Returns an ``array('B')`` aligned with the input where each entry is the
+    number's state ID (see :data:`STATE_NAMES`), or 0 when the number has no
+    US area code. Bucketing by the result answers "which state" for every
+    state at once instead of re-scanning per state query.
+    """
+    table = NPA_TO_STATE_ID
+    out = array("B")
+    for number in phone_numbers:
+        npa = npa_for_number(number)
+        out.append(table[npa] if npa >= 0 else 0)
+    return out
 
 
 def is_number_from_state(phone_number: str, state: str) -> bool:
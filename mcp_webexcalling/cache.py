@@ -0,0 +1,255 @@
+"""In-memory TTL + LRU cache for read-only Webex API responses.
+
+The cache is opt-in (``WEBEX_CACHE_ENABLED``) and lives inside
+:class:`~mcp_webexcalling.webex_client.WebexClient`. Entries are keyed by the
+full request URL plus normalised query params, and remember the resource
+*path* they were read from so that a PUT/POST/DELETE on the same resource can
+invalidate them.
+
+Time-to-live is chosen per endpoint family by longest matching path prefix
+(see :data:`DEFAULT_TTLS`); a TTL of ``0`` means "never cache". The cache is
+bounded by entry count and evicts the least recently used entry first.
+
+Entries stored with an ``ETag`` or ``Last-Modified`` validator outlive their
+TTL as *stale* entries: the client revalidates them with ``If-None-Match`` /
+``If-Modified-Since`` and, on ``304 Not Modified``, :meth:`ResponseCache.revalidate`
+makes them fresh again without re-transferring or re-decoding the body.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+# Seconds to keep responses per endpoint family, matched by longest path
+# prefix. Slowly changing configuration gets long TTLs; anything real-time or
+# time-windowed is never cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/organizations": 3600.0,
+    "/licenses": 600.0,
+    "/locations": 600.0,
+    "/telephony/config/queues": 300.0,
+    "/telephony/config/huntGroups": 300.0,
+    "/telephony/config/autoAttendants": 300.0,
+    "/telephony/config/trunkGroups": 300.0,
+    "/telephony/config/callPark": 300.0,
+    "/telephony/config/numbers": 120.0,
+    "/people": 60.0,
+    "/devices": 60.0,
+    "/webhooks": 30.0,
+    "/telephony/calls": 0.0,
+    "/telephony/voicemail": 0.0,
+    "/telephony/config/availableNumbers": 0.0,
+    "/cdr_feed": 0.0,
+}
+
+# Different API paths that address the same underlying resource. A write to
+# the first prefix also invalidates reads cached under the second (and vice
+# versa), e.g. ``PUT /telephony/config/people/{id}`` changes ``/people/{id}``.
+INVALIDATION_ALIASES: List[Tuple[str, str]] = [
+    ("/telephony/config/people/", "/people/"),
+]
+
+
+class _CacheEntry:
+    __slots__ = ("value", "path", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        value: Any,
+        path: str,
+        expires_at: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.value = value
+        self.path = path
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+def _normalise_path(path: str) -> str:
+    path = "/" + path.strip("/")
+    return path.split("?", 1)[0]
+
+
+class ResponseCache:
+    """Bounded LRU cache with per-endpoint-family TTLs and path invalidation.
+
+    Args:
+        max_entries: Maximum number of cached responses before LRU eviction.
+        default_ttl: TTL (seconds) for paths matching no rule in ``ttls``.
+        ttls: Path-prefix -> TTL overrides merged over :data:`DEFAULT_TTLS`.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        rules = dict(DEFAULT_TTLS)
+        rules.update(ttls or {})
+        # Longest prefix first so the most specific rule wins.
+        self._ttl_rules = sorted(
+            ((_normalise_path(p), float(t)) for p, t in rules.items()),
+            key=lambda rule: len(rule[0]),
+            reverse=True,
+        )
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL that applies to ``path`` (0 means uncacheable)."""
+        path = _normalise_path(path)
+        for prefix, ttl in self._ttl_rules:
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a fresh cached value for ``key``, or None on a miss.
+
+        Expired entries that carry validators are kept for revalidation;
+        expired entries without them are dropped.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None and not (entry.etag or entry.last_modified):
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def conditional_headers(self, key: Hashable) -> Dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for ``key``.
+
+        Empty when there is no cached entry or it has no validators.
+        """
+        entry = self._entries.get(key)
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidate(
+        self,
+        key: Hashable,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Mark a stale entry fresh again after a ``304 Not Modified``.
+
+        Returns the cached value, or None if the entry has since been evicted
+        or invalidated (the caller must then refetch unconditionally). A
+        successful revalidation turns the lookup's earlier miss into a hit.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.misses = max(0, self.misses - 1)
+        self.hits += 1
+        entry.expires_at = self._clock() + self.ttl_for(entry.path)
+        if etag:
+            entry.etag = etag
+        if last_modified:
+            entry.last_modified = last_modified
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        path: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store ``value`` under ``key``; ``path`` is used for invalidation."""
+        if ttl is None:
+            ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        self._entries[key] = _CacheEntry(
+            value,
+            _normalise_path(path),
+            self._clock() + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _related_paths(self, path: str) -> Iterable[str]:
+        yield path
+        for a, b in INVALIDATION_ALIASES:
+            for src, dst in ((a, b), (b, a)):
+                if path.startswith(src):
+                    yield dst + path[len(src):]
+
+    def invalidate_path(self, path: str) -> int:
+        """Drop entries affected by a write to ``path``.
+
+        That is the resource itself, anything beneath it, and every collection
+        above it (so ``PUT /telephony/config/queues/Q1`` also drops the cached
+        ``/telephony/config/queues`` listing). Returns the number removed.
+        """
+        targets = list(self._related_paths(_normalise_path(path)))
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if any(
+                entry.path == t
+                or entry.path.startswith(t + "/")
+                or t.startswith(entry.path + "/")
+                for t in targets
+            )
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and occupancy as a JSON-friendly dict."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,382 @@
+"""Columnar, array-backed in-memory batch of call detail records.
+
+A list of raw CDR dicts costs roughly a kilobyte per record, and every
+aggregation over it pays dict lookups and field-alias fallbacks per call.
+:class:`CdrBatch` resolves the aliases once on load and keeps the hot fields
+in compact :mod:`array` columns:
+
+* start time as epoch milliseconds (``int64``), duration and wait time as
+  ``int32`` (wait ``-1`` means missing);
+* direction, location, location ID, person, queue and calling/called
+  country as dictionary-encoded ``uint32`` codes (``0`` means missing);
+* calling/called area codes as their 3-digit NPA value in a ``uint16``
+  (``0`` means missing, which no valid NPA uses).
+
+Raw records are not kept by default; aggregations never touch them. Tools
+that return a detail listing next to their aggregates ask for a bounded
+sample instead (``sample_size=100``): a record is kept only while it is
+among the first ``sample_size`` rows overall or among rows sharing its
+queue, location, person, calling or called area code — each counted for all
+rows and for answered rows. The first ``sample_size`` matches of a query
+filtering on one of those columns (optionally ``answered_only``) are always
+within that set, so :meth:`records_between` and
+:meth:`area_code_records` return the same rows as with every record kept,
+while memory stays bounded by the number of distinct keys rather than the
+number of records. ``keep_raw=True`` keeps everything.
+
+The query methods mirror :class:`~mcp_webexcalling.cdr_store.CdrStore`
+(``count``, ``duration_totals``, ``records_between``, ``area_code_totals``,
+``area_code_records``), so callers can aggregate over either.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .area_codes import NPA_TO_STATE_ID, STATE_NAMES
+from .cdr_store import cdr_fields
+
+
+class _Dictionary:
+    """Maps values to dense integer codes; code ``0`` is reserved for None."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values: List[Any] = [None]
+        self.codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        if value is None or value == "":
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Any) -> int:
+        """Return the code for ``value``, or -1 if it never occurs."""
+        return self.codes.get(value, -1)
+
+
+def _npa(area_code: Optional[str]) -> int:
+    try:
+        return int(area_code) if area_code else 0
+    except ValueError:
+        return 0
+
+
+class CdrBatch:
+    """Columnar CDR batch with tight-loop aggregations.
+
+    Args:
+        keep_raw: Retain every raw record.
+        sample_size: Otherwise, retain just enough raw records for
+            :meth:`records_between` and :meth:`area_code_records` to return
+            up to this many rows (see the module docstring). With neither,
+            those return ``[]``.
+    """
+
+    def __init__(self, keep_raw: bool = False, sample_size: int = 0):
+        self.start_ms = array("q")
+        self.duration = array("i")
+        self.direction = array("I")
+        self.answered = array("b")  # 1 / 0, -1 when unknown
+        self.location = array("I")
+        self.location_id = array("I")
+        self.person = array("I")
+        self.queue = array("I")
+        self.wait = array("i")
+        self.calling_country = array("I")
+        self.called_country = array("I")
+        self.calling_npa = array("H")
+        self.called_npa = array("H")
+
+        self.directions = _Dictionary()
+        self.locations = _Dictionary()
+        self.location_ids = _Dictionary()
+        self.people = _Dictionary()
+        self.queues = _Dictionary()
+        self.countries = _Dictionary()
+
+        self.keep_raw = keep_raw
+        self.sample_size = sample_size
+        # Row index -> raw record, for the rows retained (see above).
+        self._raw: Dict[int, Dict[str, Any]] = {}
+        self._sampled: Dict[Tuple[Any, ...], int] = {}
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Dict[str, Any]], keep_raw: bool = False, sample_size: int = 0
+    ) -> "CdrBatch":
+        batch = cls(keep_raw=keep_raw, sample_size=sample_size)
+        batch.extend(records)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        (
+            start_ms, duration, direction, answered, location, location_id,
+            person, _calling, _called, calling_ac, called_ac, queue, wait,
+            calling_country, called_country,
+        ) = cdr_fields(record)
+        # Records without a start time sort first and never match a window.
+        self.start_ms.append(start_ms if start_ms is not None else -1)
+        self.duration.append(max(-(2 ** 31), min(duration, 2 ** 31 - 1)))
+        self.direction.append(self.directions.encode(direction))
+        self.answered.append(-1 if answered is None else answered)
+        self.location.append(self.locations.encode(location))
+        self.location_id.append(self.location_ids.encode(location_id))
+        self.person.append(self.people.encode(person))
+        self.queue.append(self.queues.encode(queue))
+        self.wait.append(-1 if wait is None else max(0, min(wait, 2 ** 31 - 1)))
+        self.calling_country.append(self.countries.encode(calling_country))
+        self.called_country.append(self.countries.encode(called_country))
+        self.calling_npa.append(_npa(calling_ac))
+        self.called_npa.append(_npa(called_ac))
+        if self.keep_raw:
+            self._raw[len(self.start_ms) - 1] = record
+        elif self.sample_size > 0:
+            self._sample(record)
+
+    def _sample(self, record: Dict[str, Any]) -> None:
+        """Keep ``record`` (the last row) if some filter's first rows need it."""
+        row = len(self.start_ms) - 1
+        keys: List[Tuple[Any, ...]] = [("all",)]
+        for name, column in (
+            ("queue", self.queue), ("location", self.location),
+            ("location_id", self.location_id), ("person", self.person),
+            ("calling", self.calling_npa), ("called", self.called_npa),
+        ):
+            if column[row]:
+                keys.append((name, column[row]))
+        if self.duration[row] > 0:
+            keys += [key + ("answered",) for key in keys]
+        sampled = self._sampled
+        keep = False
+        for key in keys:
+            taken = sampled.get(key, 0)
+            if taken < self.sample_size:
+                sampled[key] = taken + 1
+                keep = True
+        if keep:
+            self._raw[row] = record
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def close(self) -> None:
+        """No-op, for interface parity with :class:`CdrStore`."""
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the typed columns (excluding raw)."""
+        columns = (
+            self.start_ms, self.duration, self.direction, self.answered,
+            self.location, self.location_id, self.person, self.queue, self.wait,
+            self.calling_country, self.called_country,
+            self.calling_npa, self.called_npa,
+        )
+        return sum(col.itemsize * len(col) for col in columns)
+
+    # ------------------------------------------------------------------ #
+    # Selection
+    # ------------------------------------------------------------------ #
+    def _select(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        location: Optional[str] = None,
+        person_id: Optional[str] = None,
+        queue_id: Optional[str] = None,
+        answered_only: bool = False,
+    ) -> Iterator[int]:
+        """Yield the row indexes matching the filters (same as CdrStore)."""
+        loc_code = loc_id_code = person_code = queue_code = None
+        if location:
+            loc_code = self.locations.lookup(location)
+            loc_id_code = self.location_ids.lookup(location)
+            if loc_code < 0 and loc_id_code < 0:
+                return
+        if person_id:
+            person_code = self.people.lookup(person_id)
+            if person_code < 0:
+                return
+        if queue_id:
+            queue_code = self.queues.lookup(queue_id)
+            if queue_code < 0:
+                return
+        bounded = start_ms is not None or end_ms is not None
+        lo = start_ms if start_ms is not None else 0
+        hi = end_ms if end_ms is not None else 2 ** 63 - 1
+
+        starts, durations = self.start_ms, self.duration
+        for i in range(len(starts)):
+            if bounded and not lo <= starts[i] <= hi:
+                continue
+            if answered_only and durations[i] <= 0:
+                continue
+            if loc_code is not None and not (
+                self.location[i] == loc_code or self.location_id[i] == loc_id_code
+            ):
+                continue
+            if person_code is not None and self.person[i] != person_code:
+                continue
+            if queue_code is not None and self.queue[i] != queue_code:
+                continue
+            yield i
+
+    def iter_fields(
+        self, start_ms: Optional[int] = None, end_ms: Optional[int] = None, **filters: Any
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Stream decoded typed rows in :data:`~mcp_webexcalling.cdr_store.FIELD_ROW` order."""
+        directions = self.directions.values
+        locations = self.locations.values
+        location_ids = self.location_ids.values
+        people = self.people.values
+        queues = self.queues.values
+        countries = self.countries.values
+        for i in self._select(start_ms, end_ms, **filters):
+            start = self.start_ms[i]
+            answered = self.answered[i]
+            calling, called = self.calling_npa[i], self.called_npa[i]
+            wait = self.wait[i]
+            yield (
+                start if start >= 0 else None,
+                self.duration[i],
+                directions[self.direction[i]],
+                None if answered < 0 else answered,
+                locations[self.location[i]],
+                location_ids[self.location_id[i]],
+                people[self.person[i]],
+                queues[self.queue[i]],
+                "%03d" % calling if calling else None,
+                "%03d" % called if called else None,
+                wait if wait >= 0 else None,
+                countries[self.calling_country[i]],
+                countries[self.called_country[i]],
+            )
+
+    def raw_count(self) -> int:
+        """Number of raw records retained."""
+        return len(self._raw)
+
+    def _raw_at(self, indexes: Iterable[int], limit: Optional[int]) -> List[Dict[str, Any]]:
+        raw = self._raw
+        if not raw:
+            return []
+        if not self.keep_raw and (limit is None or limit > self.sample_size):
+            limit = self.sample_size
+        out: List[Dict[str, Any]] = []
+        for i in indexes:
+            if limit is not None and len(out) >= limit:
+                break
+            record = raw.get(i)
+            if record is not None:
+                out.append(record)
+        return out
+
+    # ------------------------------------------------------------------ #
+    # Queries (CdrStore-compatible)
+    # ------------------------------------------------------------------ #
+    def count(
+        self, start_ms: Optional[int] = None, end_ms: Optional[int] = None, **filters: Any
+    ) -> int:
+        if start_ms is None and end_ms is None and not any(filters.values()):
+            return len(self)
+        return sum(1 for _ in self._select(start_ms, end_ms, **filters))
+
+    def duration_totals(
+        self, start_ms: Optional[int] = None, end_ms: Optional[int] = None, **filters: Any
+    ) -> Tuple[int, int]:
+        """Return ``(calls, seconds)`` over calls with a positive duration."""
+        durations = self.duration
+        calls = seconds = 0
+        for i in self._select(start_ms, end_ms, answered_only=True, **filters):
+            calls += 1
+            seconds += durations[i]
+        return calls, seconds
+
+    def records_between(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        return self._raw_at(self._select(start_ms, end_ms, **filters), limit)
+
+    def state_totals(
+        self, start_ms: Optional[int] = None, end_ms: Optional[int] = None, **filters: Any
+    ) -> Dict[str, Dict[str, int]]:
+        """Bucket calls by the US state of both ends, for every state at once."""
+        # Per state ID: [callsTo, secondsTo, callsFrom, secondsFrom]
+        acc = [[0, 0, 0, 0] for _ in STATE_NAMES]
+        table = NPA_TO_STATE_ID
+        called, calling, durations = self.called_npa, self.calling_npa, self.duration
+        for i in self._select(start_ms, end_ms, **filters):
+            seconds = durations[i] if durations[i] > 0 else 0
+            to_state = acc[table[called[i]]]
+            to_state[0] += 1
+            to_state[1] += seconds
+            from_state = acc[table[calling[i]]]
+            from_state[2] += 1
+            from_state[3] += seconds
+        return {
+            STATE_NAMES[state_id]: dict(zip(
+                ("callsTo", "secondsTo", "callsFrom", "secondsFrom"), values
+            ))
+            for state_id, values in enumerate(acc)
+            if state_id and (values[0] or values[2])
+        }
+
+    def area_code_totals(
+        self,
+        area_codes: Iterable[str],
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> Dict[str, int]:
+        """Count calls to/from a set of area codes and their positive seconds."""
+        wanted = {_npa(code) for code in area_codes} - {0}
+        calls_to = seconds_to = calls_from = seconds_from = 0
+        if wanted:
+            called, calling, durations = self.called_npa, self.calling_npa, self.duration
+            for i in self._select(start_ms, end_ms, **filters):
+                seconds = durations[i] if durations[i] > 0 else 0
+                if called[i] in wanted:
+                    calls_to += 1
+                    seconds_to += seconds
+                if calling[i] in wanted:
+                    calls_from += 1
+                    seconds_from += seconds
+        return {
+            "callsTo": calls_to,
+            "secondsTo": seconds_to,
+            "callsFrom": calls_from,
+            "secondsFrom": seconds_from,
+        }
+
+    def area_code_records(
+        self,
+        area_codes: Iterable[str],
+        column: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        limit: int = 100,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Records whose ``calling``/``called`` area code is in ``area_codes``."""
+        if column not in ("calling", "called"):
+            raise ValueError("column must be 'calling' or 'called'")
+        wanted = {_npa(code) for code in area_codes} - {0}
+        if not wanted or limit <= 0:
+            return []
+        npas = self.called_npa if column == "called" else self.calling_npa
+        matches = (i for i in self._select(start_ms, end_ms, **filters) if npas[i] in wanted)
+        return self._raw_at(matches, limit)
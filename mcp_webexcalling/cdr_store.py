@@ -0,0 +1,515 @@
+"""Local store of call detail records (CDRs).
+
+The Webex ``/cdr_feed`` only serves the last 48 hours and every analytics
+tool used to re-download the same window. :class:`CdrStore` keeps CDRs in an
+embedded SQLite database (stdlib ``sqlite3``, no server) so they can be
+queried repeatedly at zero API cost and retained beyond the feed's window.
+
+Each record is normalised into a typed row (start time as epoch ms, duration,
+direction, location, person, calling/called number and area code, queue,
+wait time) with
+indexes on the columns the analytics tools filter on, so their aggregations
+are SQL queries rather than loops over dicts; the raw JSON is kept alongside
+for detail listings.
+
+Records are de-duplicated on :func:`cdr_record_key` (the feed's
+``Report ID``, or the correlation/call IDs). The store also
+remembers which time intervals have been fully synced, so callers can tell
+whether a query window can be answered locally.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .area_codes import extract_area_code, state_for_area_code
+from .number_geo import country_for_number
+
+
+# Bump when the ``cdrs`` table layout changes; older stores are rebuilt
+# (the feed is re-synced on the next pass).
+_SCHEMA_VERSION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cdrs (
+    key TEXT PRIMARY KEY,
+    start_ms INTEGER,
+    duration INTEGER NOT NULL DEFAULT 0,
+    direction TEXT,
+    answered INTEGER,
+    location TEXT,
+    location_id TEXT,
+    person_id TEXT,
+    calling_number TEXT,
+    called_number TEXT,
+    calling_area_code TEXT,
+    called_area_code TEXT,
+    queue_id TEXT,
+    wait INTEGER,
+    calling_country TEXT,
+    called_country TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cdrs_start ON cdrs (start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_location ON cdrs (location, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_location_id ON cdrs (location_id, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_person ON cdrs (person_id, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_calling_ac ON cdrs (calling_area_code, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_called_ac ON cdrs (called_area_code, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_queue ON cdrs (queue_id, start_ms);
+CREATE INDEX IF NOT EXISTS idx_cdrs_called_country ON cdrs (called_country, start_ms);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "key", "start_ms", "duration", "direction", "answered", "location",
+    "location_id", "person_id", "calling_number", "called_number",
+    "calling_area_code", "called_area_code", "queue_id", "wait",
+    "calling_country", "called_country", "raw",
+)
+
+# Column order of the typed rows yielded by ``iter_fields`` (both here and on
+# :class:`~mcp_webexcalling.cdr_batch.CdrBatch`).
+FIELD_ROW = (
+    "start_ms", "duration", "direction", "answered", "location", "location_id",
+    "person_id", "queue_id", "calling_area_code", "called_area_code", "wait",
+    "calling_country", "called_country",
+)
+
+_STATE_TOTAL_KEYS = ("callsTo", "secondsTo", "callsFrom", "secondsFrom")
+
+# Field-name aliases seen across the CDR feed and the call history APIs, in
+# order of preference.
+CALLING_NUMBER_FIELDS = (
+    "Calling number", "calling_number", "Caller ID number", "caller_id_number",
+    "Calling line ID", "calling_line_id", "From", "from",
+)
+CALLED_NUMBER_FIELDS = (
+    "Called number", "called_number", "User number", "user_number",
+    "Called line ID", "called_line_id", "To", "to",
+)
+PERSON_FIELDS = ("User UUID", "personId", "person_id")
+QUEUE_FIELDS = ("queueId", "Queue ID", "Call queue ID")
+# How long the caller waited before the call was answered (seconds).
+WAIT_FIELDS = ("Queue time", "queueTime", "Ring duration", "ringDuration", "waitTime")
+
+
+def first_field(record: Dict[str, Any], names: Iterable[str]) -> Any:
+    """Return the first truthy value among ``names`` in ``record``."""
+    for name in names:
+        value = record.get(name)
+        if value:
+            return value
+    return None
+
+
+def _int_or_zero(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    return _int_or_zero(value) if value is not None else None
+
+
+def _bool_or_none(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return int(value.strip().lower() in ("true", "yes", "1"))
+    return int(bool(value))
+
+
+def parse_cdr_time(value: Any) -> Optional[int]:
+    """Parse a CDR/ISO-8601 timestamp into epoch milliseconds (UTC)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def record_start_ms(record: Dict[str, Any]) -> Optional[int]:
+    """Return a CDR's start time in epoch milliseconds, if it has one."""
+    return parse_cdr_time(record.get("Start time") or record.get("startTime"))
+
+
+def cdr_record_key(record: Dict[str, Any]) -> str:
+    """Return a stable identity for a CDR, used to de-duplicate records.
+
+    Prefers the feed's unique ``Report ID``; otherwise combines the
+    correlation/call identifiers with the start time and direction, and as a
+    last resort falls back to the record's canonical JSON.
+    """
+    report_id = record.get("Report ID") or record.get("reportId")
+    if report_id:
+        return f"report:{report_id}"
+    correlation = record.get("Correlation ID") or record.get("correlationId")
+    call_id = (
+        record.get("Local call ID")
+        or record.get("Call ID")
+        or record.get("callId")
+    )
+    if correlation or call_id:
+        return "call:{}|{}|{}|{}".format(
+            correlation or "",
+            call_id or "",
+            record.get("Start time") or record.get("startTime") or "",
+            record.get("Direction") or record.get("direction") or "",
+        )
+    return "json:" + json.dumps(record, sort_keys=True, default=str)
+
+
+def cdr_fields(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Extract the typed analytics fields from a raw CDR.
+
+    Returns ``(start_ms, duration, direction, answered, location,
+    location_id, person_id, calling_number, called_number,
+    calling_area_code, called_area_code, queue_id, wait, calling_country,
+    called_country)``, resolving the field-name aliases once per record.
+    Countries are ISO codes from :func:`~.number_geo.country_for_number`.
+    """
+    calling = first_field(record, CALLING_NUMBER_FIELDS)
+    called = first_field(record, CALLED_NUMBER_FIELDS)
+    person = first_field(record, PERSON_FIELDS)
+    if person is None:
+        for side in ("from", "to"):
+            party = record.get(side)
+            if isinstance(party, dict) and party.get("personId"):
+                person = party["personId"]
+                break
+    return (
+        record_start_ms(record),
+        _int_or_zero(record.get("Duration") or record.get("duration")),
+        record.get("Direction") or record.get("direction"),
+        _bool_or_none(record.get("Answered", record.get("answered"))),
+        record.get("Location"),
+        record.get("Site UUID") or record.get("locationId"),
+        person,
+        str(calling) if calling else None,
+        str(called) if called else None,
+        extract_area_code(str(calling)) if calling else None,
+        extract_area_code(str(called)) if called else None,
+        first_field(record, QUEUE_FIELDS),
+        _int_or_none(first_field(record, WAIT_FIELDS)),
+        country_for_number(calling) if calling else None,
+        country_for_number(called) if called else None,
+    )
+
+
+def normalize_cdr(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Flatten a raw CDR into a row of the typed ``cdrs`` table."""
+    return (
+        (cdr_record_key(record),)
+        + cdr_fields(record)
+        + (json.dumps(record, default=str),)
+    )
+
+
+def _merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class CdrStore:
+    """Append-only, de-duplicated CDR store backed by SQLite.
+
+    Each record is normalised into typed, indexed columns (start time,
+    duration, direction, location, person, calling/called number and area
+    code and country, queue, wait time) next to its raw JSON, so aggregations run as SQL without
+    materialising the records.
+
+    Args:
+        path: Database file path, or ``":memory:"`` for a throwaway store.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            # Older layouts only held raw JSON; rebuild and let sync refill.
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS cdrs; DROP TABLE IF EXISTS meta;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ------------------------------------------------------------------ #
+    # Metadata
+    # ------------------------------------------------------------------ #
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def covered_intervals(self) -> List[Tuple[int, int]]:
+        """Return the merged ``[start_ms, end_ms]`` intervals fully synced."""
+        raw = self._get_meta("covered")
+        return [tuple(pair) for pair in json.loads(raw)] if raw else []
+
+    def mark_covered(self, start_ms: int, end_ms: int) -> None:
+        """Record that every CDR in ``[start_ms, end_ms]`` has been stored."""
+        intervals = _merge_intervals(self.covered_intervals() + [(start_ms, end_ms)])
+        self._set_meta("covered", json.dumps(intervals))
+        self._conn.commit()
+
+    def covers(self, start_ms: int, end_ms: int) -> bool:
+        """Whether ``[start_ms, end_ms]`` lies within one synced interval."""
+        return any(s <= start_ms and end_ms <= e for s, e in self.covered_intervals())
+
+    @property
+    def high_water_mark(self) -> Optional[int]:
+        """End of the most recent synced interval (epoch ms), if any."""
+        intervals = self.covered_intervals()
+        return intervals[-1][1] if intervals else None
+
+    # ------------------------------------------------------------------ #
+    # Records
+    # ------------------------------------------------------------------ #
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert records, skipping ones already stored. Returns rows added."""
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO cdrs ({}) VALUES ({})".format(
+                ", ".join(_COLUMNS), ", ".join("?" * len(_COLUMNS))
+            ),
+            (normalize_cdr(r) for r in records),
+        )
+        self._conn.commit()
+        return self._conn.total_changes - before
+
+    @staticmethod
+    def _where(
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        location: Optional[str] = None,
+        person_id: Optional[str] = None,
+        queue_id: Optional[str] = None,
+        answered_only: bool = False,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if start_ms is not None:
+            clauses.append("start_ms >= ?")
+            params.append(start_ms)
+        if end_ms is not None:
+            clauses.append("start_ms <= ?")
+            params.append(end_ms)
+        if location:
+            clauses.append("(location = ? OR location_id = ?)")
+            params.extend([location, location])
+        if person_id:
+            clauses.append("person_id = ?")
+            params.append(person_id)
+        if queue_id:
+            clauses.append("queue_id = ?")
+            params.append(queue_id)
+        if answered_only:
+            clauses.append("duration > 0")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def records_between(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Return stored records starting within ``[start_ms, end_ms]``.
+
+        ``filters`` are ``location`` (name or ID), ``person_id``,
+        ``queue_id`` and ``answered_only`` (duration > 0).
+        """
+        where, params = self._where(start_ms, end_ms, **filters)
+        sql = "SELECT raw FROM cdrs" + where + " ORDER BY start_ms"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(raw) for (raw,) in self._conn.execute(sql, params)]
+
+    def iter_fields(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Stream the typed fields of matching records (see :data:`FIELD_ROW`)."""
+        where, params = self._where(start_ms, end_ms, **filters)
+        yield from self._conn.execute(
+            "SELECT {} FROM cdrs{} ORDER BY start_ms".format(", ".join(FIELD_ROW), where),
+            params,
+        )
+
+    def duration_totals(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> Tuple[int, int]:
+        """Return ``(calls, seconds)`` over calls with a positive duration."""
+        where, params = self._where(start_ms, end_ms, answered_only=True, **filters)
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(duration), 0) FROM cdrs" + where, params
+        ).fetchone()
+        return row[0], row[1]
+
+    def state_totals(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> Dict[str, Dict[str, int]]:
+        """Bucket calls by the US state of both ends, for every state at once.
+
+        Returns ``{state: {"callsTo", "secondsTo", "callsFrom", "secondsFrom"}}``
+        (positive durations only), from one indexed GROUP BY per side mapped
+        through the area-code lookup table.
+        """
+        where, params = self._where(start_ms, end_ms, **filters)
+        totals: Dict[str, Dict[str, int]] = {}
+        for column, calls_key, seconds_key in (
+            ("called_area_code", "callsTo", "secondsTo"),
+            ("calling_area_code", "callsFrom", "secondsFrom"),
+        ):
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*), "
+                f"COALESCE(SUM(CASE WHEN duration > 0 THEN duration ELSE 0 END), 0) "
+                f"FROM cdrs{where} GROUP BY {column}",
+                params,
+            )
+            for area_code, calls, seconds in rows:
+                state = state_for_area_code(area_code)
+                if state is None:
+                    continue
+                bucket = totals.setdefault(state, dict.fromkeys(_STATE_TOTAL_KEYS, 0))
+                bucket[calls_key] += calls
+                bucket[seconds_key] += seconds
+        return totals
+
+    def area_code_totals(
+        self,
+        area_codes: Iterable[str],
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> Dict[str, int]:
+        """Count calls to/from a set of area codes and their positive seconds.
+
+        A call whose both ends match counts once in each direction.
+        """
+        codes = list(area_codes)
+        if not codes:
+            return {"callsTo": 0, "secondsTo": 0, "callsFrom": 0, "secondsFrom": 0}
+        marks = ", ".join("?" * len(codes))
+        where, params = self._where(start_ms, end_ms, **filters)
+        where += (" AND " if where else " WHERE ") + (
+            f"(called_area_code IN ({marks}) OR calling_area_code IN ({marks}))"
+        )
+        row = self._conn.execute(
+            f"""
+            SELECT
+                COALESCE(SUM(called_area_code IN ({marks})), 0),
+                COALESCE(SUM(CASE WHEN called_area_code IN ({marks}) AND duration > 0
+                                  THEN duration ELSE 0 END), 0),
+                COALESCE(SUM(calling_area_code IN ({marks})), 0),
+                COALESCE(SUM(CASE WHEN calling_area_code IN ({marks}) AND duration > 0
+                                  THEN duration ELSE 0 END), 0)
+            FROM cdrs{where}
+            """,
+            codes * 4 + params + codes * 2,
+        ).fetchone()
+        return {
+            "callsTo": row[0],
+            "secondsTo": row[1],
+            "callsFrom": row[2],
+            "secondsFrom": row[3],
+        }
+
+    def area_code_records(
+        self,
+        area_codes: Iterable[str],
+        column: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        *,
+        limit: int = 100,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Records whose ``calling``/``called`` area code is in ``area_codes``."""
+        if column not in ("calling", "called"):
+            raise ValueError("column must be 'calling' or 'called'")
+        codes = list(area_codes)
+        if not codes or limit <= 0:
+            return []
+        where, params = self._where(start_ms, end_ms, **filters)
+        where += (" AND " if where else " WHERE ") + (
+            f"{column}_area_code IN ({', '.join('?' * len(codes))})"
+        )
+        rows = self._conn.execute(
+            "SELECT raw FROM cdrs" + where + " ORDER BY start_ms LIMIT ?",
+            params + codes + [limit],
+        )
+        return [json.loads(raw) for (raw,) in rows]
+
+    def count(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        **filters: Any,
+    ) -> int:
+        where, params = self._where(start_ms, end_ms, **filters)
+        return self._conn.execute("SELECT COUNT(*) FROM cdrs" + where, params).fetchone()[0]
+
+    def prune_before(self, cutoff_ms: int) -> int:
+        """Delete records older than ``cutoff_ms`` (retention). Returns rows removed."""
+        cur = self._conn.execute("DELETE FROM cdrs WHERE start_ms < ?", (cutoff_ms,))
+        intervals = [
+            (max(s, cutoff_ms), e) for s, e in self.covered_intervals() if e > cutoff_ms
+        ]
+        self._set_meta("covered", json.dumps(intervals))
+        self._conn.commit()
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        def iso(ms: Optional[int]) -> Optional[str]:
+            if ms is None:
+                return None
+            return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
+        return {
+            "path": self.path,
+            "records": self.count(),
+            "highWaterMark": iso(self.high_water_mark),
+            "coveredIntervals": [[iso(s), iso(e)] for s, e in self.covered_intervals()],
+        }
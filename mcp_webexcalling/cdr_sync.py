@@ -0,0 +1,187 @@
+"""Incremental synchronisation of call detail records into a local store.
+
+:class:`CdrSyncEngine` pulls only CDRs newer than the store's high-water mark
+from ``/cdr_feed`` and appends them to a :class:`~mcp_webexcalling.cdr_store.CdrStore`.
+It can run as a background task (see :meth:`CdrSyncEngine.start`) and is also
+driven on demand by the analytics methods of
+:class:`~mcp_webexcalling.webex_client.WebexClient` when a query window is
+not yet covered locally.
+
+The feed only serves records between 5 minutes and 48 hours old, so each pass
+requests ``[max(high-water mark - overlap, now - 48h), now - 5min]``. The small
+overlap re-reads records that reached the feed late; duplicates are dropped by
+the store.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .cdr_store import CdrStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .webex_client import WebexClient
+
+
+logger = logging.getLogger("mcp_webexcalling")
+
+# The feed's availability window.
+_FEED_MIN_AGE = timedelta(minutes=5)
+_FEED_MAX_AGE = timedelta(hours=48)
+# Keep a little slack inside the 48h limit so the request isn't rejected by
+# the time it reaches the API.
+_FEED_MAX_AGE_SLACK = timedelta(minutes=5)
+
+
+def _ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _from_ms(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+class CdrSyncEngine:
+    """Keeps a :class:`CdrStore` up to date with the Webex CDR feed.
+
+    Args:
+        client: The client used to fetch CDRs.
+        store: Destination store.
+        interval: Seconds between background sync passes.
+        overlap: How far before the high-water mark each pass re-reads.
+        retention_days: Records older than this are pruned (0 keeps all).
+    """
+
+    def __init__(
+        self,
+        client: "WebexClient",
+        store: CdrStore,
+        *,
+        interval: float = 300.0,
+        overlap: timedelta = timedelta(minutes=15),
+        retention_days: int = 90,
+    ):
+        self.client = client
+        self.store = store
+        self.interval = interval
+        self.overlap = overlap
+        self.retention_days = retention_days
+
+        self._lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.last_sync: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+
+    async def sync_once(self) -> Dict[str, Any]:
+        """Fetch CDRs newer than the high-water mark and store them."""
+        async with self._lock:
+            return await self._sync_locked()
+
+    async def _sync_locked(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        window_end = now - _FEED_MIN_AGE
+        oldest = now - _FEED_MAX_AGE + _FEED_MAX_AGE_SLACK
+
+        hwm = self.store.high_water_mark
+        window_start = oldest
+        if hwm is not None:
+            window_start = max(oldest, _from_ms(hwm) - self.overlap)
+        if window_start >= window_end:
+            return {"added": 0, "skipped": True}
+
+        started = time.perf_counter()
+        records = await self.client.get_call_detail_records(
+            start_time=window_start,
+            end_time=window_end,
+            max_results=0,
+        )
+        added = self.store.add_records(records)
+        self.store.mark_covered(_ms(window_start), _ms(window_end))
+        if self.retention_days > 0:
+            self.store.prune_before(_ms(now - timedelta(days=self.retention_days)))
+
+        self.last_sync = {
+            "at": now.isoformat(),
+            "windowStart": window_start.isoformat(),
+            "windowEnd": window_end.isoformat(),
+            "fetched": len(records),
+            "added": added,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+        self.last_error = None
+        logger.info(
+            "CDR sync: %d fetched, %d new (window %s .. %s)",
+            len(records), added, window_start.isoformat(), window_end.isoformat(),
+        )
+        return self.last_sync
+
+    def _covers(self, start_ms: int, end_ms: int) -> bool:
+        if self.store.covers(start_ms, end_ms):
+            return True
+        # The parts of the window the feed can't serve (older than 48 hours or
+        # newer than 5 minutes) would be missing from an API pull too, so only
+        # the reachable part has to be covered.
+        now = datetime.now(timezone.utc)
+        start_ms = max(start_ms, _ms(now - _FEED_MAX_AGE + _FEED_MAX_AGE_SLACK))
+        end_ms = min(end_ms, _ms(now - _FEED_MIN_AGE))
+        return start_ms < end_ms and self.store.covers(start_ms, end_ms)
+
+    async def ensure_covered(self, start_ms: int, end_ms: int) -> bool:
+        """Sync if needed so ``[start_ms, end_ms]`` can be answered locally.
+
+        Returns True when the store covers the window afterwards. Windows
+        older than the feed's 48 hours can only be answered if they were
+        synced back when they were available.
+        """
+        if self._covers(start_ms, end_ms):
+            return True
+        async with self._lock:
+            if self._covers(start_ms, end_ms):
+                return True
+            try:
+                await self._sync_locked()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("On-demand CDR sync failed: %s", e)
+                return False
+        return self._covers(start_ms, end_ms)
+
+    # ------------------------------------------------------------------ #
+    # Background loop
+    # ------------------------------------------------------------------ #
+    def start(self) -> None:
+        """Start periodic background syncing (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task, if running."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Background CDR sync failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "intervalSeconds": self.interval,
+            "lastSync": self.last_sync,
+            "lastError": self.last_error,
+            "store": self.store.stats(),
+        }
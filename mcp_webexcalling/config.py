@@ -13,7 +13,7 @@ are always honoured.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,6 +49,72 @@ class Settings(BaseSettings):
     webex_retry_backoff: float = Field(default=0.5)
     webex_max_connections: int = Field(default=20)
 
+    # Adaptive client-side rate limiting, one token bucket per API host.
+    # ``webex_rate_limit`` is the starting rate in requests/second (0 disables
+    # limiting); it shrinks on 429/Retry-After and probes back up to the max.
+    webex_rate_limit: float = Field(default=10.0)
+    webex_rate_limit_min: float = Field(default=0.2)
+    webex_rate_limit_max: float = Field(default=50.0)
+    webex_rate_limit_burst: float = Field(default=20.0)
+
+    # Opt-in response cache for read-only endpoints. TTLs are chosen per
+    # endpoint family; ``webex_cache_ttls`` overrides them by path prefix,
+    # e.g. WEBEX_CACHE_TTLS='{"/people": 300, "/licenses": 0}'.
+    webex_cache_enabled: bool = Field(default=False)
+    webex_cache_max_entries: int = Field(default=1024)
+    webex_cache_default_ttl: float = Field(default=60.0)
+    webex_cache_ttls: Dict[str, float] = Field(default_factory=dict)
+
+    # Detailed call history (CDR) fetching: large time ranges are split into
+    # shards of this many minutes (0 disables sharding) and fetched with at
+    # most ``webex_cdr_max_concurrency`` requests in flight.
+    webex_cdr_shard_minutes: int = Field(default=120)
+    webex_cdr_max_concurrency: int = Field(default=4)
+
+    # Optional local CDR store (SQLite) kept current by an incremental sync;
+    # analytics tools then answer from it without re-downloading the feed.
+    # ``webex_cdr_store_path`` defaults to <state dir>/cdr.sqlite3.
+    webex_cdr_store_enabled: bool = Field(default=False)
+    webex_cdr_store_path: str = Field(default="")
+    webex_cdr_sync_interval: float = Field(default=300.0)
+    webex_cdr_retention_days: int = Field(default=90)
+
+    # Tool responses are compact JSON by default; a positive indent
+    # pretty-prints them. ``webex_json_indent_overrides`` sets the indent per
+    # tool name, e.g. WEBEX_JSON_INDENT_OVERRIDES='{"get_client_stats": 2}'.
+    webex_json_indent: int = Field(default=0)
+    webex_json_indent_overrides: Dict[str, int] = Field(default_factory=dict)
+
+    # Optional in-memory directory snapshot (people, numbers, devices,
+    # queues, hunt groups) answering email/extension/number/MAC lookups
+    # locally; rebuilt in the background once older than the max age and
+    # persisted to ``webex_directory_path`` (default
+    # <state dir>/directory.snapshot) for warm restarts.
+    webex_directory_enabled: bool = Field(default=False)
+    webex_directory_max_age: float = Field(default=3600.0)
+    webex_directory_path: str = Field(default="")
+
+    # Budgeted list pages park their crawl behind a continuation cursor;
+    # idle cursors expire after ``webex_cursor_ttl`` seconds and at most
+    # ``webex_max_cursors`` are kept (least recently used dropped first).
+    webex_cursor_ttl: float = Field(default=600.0)
+    webex_max_cursors: int = Field(default=64)
+
+    # Optional local receiver for webhook events. Verified events
+    # (X-Spark-Signature = HMAC-SHA1 of the body keyed with the secret)
+    # directory change notices from your own tooling invalidate the matching
+    # cache entries and patch the directory index; Webex's own events are
+    # ignored. Not started without a secret.
+    webex_webhook_enabled: bool = Field(default=False)
+    webex_webhook_host: str = Field(default="127.0.0.1")
+    webex_webhook_port: int = Field(default=8765)
+    webex_webhook_path: str = Field(default="/webex/events")
+    webex_webhook_secret: str = Field(default="")
+
+    # Directory for state persisted across restarts (learned API quirks,
+    # local stores). Unset -> ~/.cache/mcp-webexcalling; empty -> disabled.
+    webex_state_dir: Optional[str] = Field(default=None)
+
     # Logging: one of CRITICAL/ERROR/WARNING/INFO/DEBUG
     webex_log_level: str = Field(default="INFO")
 
@@ -0,0 +1,193 @@
+"""Budgeted pages with server-side continuation cursors.
+
+A list tool asked for a row or byte budget returns one page plus an opaque
+``nextCursor``. The cursor names a live async iterator (usually an
+:meth:`WebexClient.iter_items` crawl) parked in a :class:`CursorStore`, so a
+follow-up call resumes from the exact item where the previous page stopped:
+no page is fetched twice and nothing past the budget is fetched early.
+
+A cursor remembers the budget of the page that created it, so a follow-up
+call that passes only the cursor gets pages of the same size; passing a
+budget again replaces the saved one.
+
+If the source fails part-way through a page, the items already read are
+returned with a cursor that retries from the failed point, provided the
+error carries a ``resume_url`` (see :class:`WebexPaginationError`) and the
+page was started with a ``resume`` factory; otherwise the listing ends there
+and the error is reported with the partial page.
+
+Cursors expire after ``ttl`` seconds of inactivity and at most
+``max_cursors`` are kept; the least recently used is dropped first. Dropped
+cursors close their iterators, which stops the crawls behind them.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .serializer import dumps
+
+# Builds a replacement iterator from a failed page's ``resume_url`` and the
+# number of items already taken from the source.
+Resume = Callable[[str, int], AsyncIterator[Any]]
+
+
+class _Cursor:
+    """A parked iterator, the item read past the previous page's budget, the
+    budget itself, and how to restart the iterator after a failed page."""
+
+    __slots__ = ("iterator", "pending", "expires", "max_rows", "max_bytes", "resume", "taken")
+
+    def __init__(
+        self,
+        iterator: AsyncIterator[Any],
+        expires: float,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        resume: Optional[Resume] = None,
+    ):
+        self.iterator = iterator
+        self.pending: List[Any] = []
+        self.expires = expires
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.resume = resume
+        self.taken = 0
+
+
+async def _close(state: _Cursor) -> None:
+    if hasattr(state.iterator, "aclose"):
+        await state.iterator.aclose()
+
+
+class CursorStore:
+    """Holds the iterators behind outstanding continuation cursors.
+
+    Args:
+        ttl: Seconds a cursor stays valid after its last use.
+        max_cursors: Maximum number of cursors kept at once.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_cursors: int = 64):
+        self.ttl = ttl
+        self.max_cursors = max_cursors
+        self._cursors: "OrderedDict[str, _Cursor]" = OrderedDict()
+        self.pages_served = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    async def _prune(self, now: float) -> None:
+        pruned = []
+        for token in [t for t, c in self._cursors.items() if c.expires <= now]:
+            pruned.append(self._cursors.pop(token))
+        while len(self._cursors) > self.max_cursors:
+            pruned.append(self._cursors.popitem(last=False)[1])
+        self.expired += len(pruned)
+        for state in pruned:
+            await _close(state)
+
+    async def read_page(
+        self,
+        source: Optional[AsyncIterator[Any]] = None,
+        *,
+        cursor: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        resume: Optional[Resume] = None,
+    ) -> Dict[str, Any]:
+        """Read one budgeted page from ``source`` or from a saved ``cursor``.
+
+        The page ends after ``max_rows`` items or before the compact JSON of
+        its items would exceed ``max_bytes`` (a page always holds at least one
+        item). When resuming a ``cursor`` without either budget, the budget
+        saved with the cursor applies. Returns ``{"items", "count", "nextCursor"}``; ``nextCursor`` is
+        None once the iterator is exhausted.
+
+        ``resume`` is called with a failed page's ``resume_url`` and the
+        number of items already taken from ``source`` to build the iterator
+        that carries on from there. If reading fails after some items, the
+        page so far is returned with the error message under ``"error"``.
+
+        Raises:
+            ValueError: If ``cursor`` is unknown, expired, or already in use,
+                or a budget is below 1.
+            Exception: Whatever ``source`` raised before the page had any
+                items; a resumable cursor stays valid for a retry.
+        """
+        for name, budget in (("page_size", max_rows), ("max_bytes", max_bytes)):
+            if budget is not None and budget < 1:
+                raise ValueError(f"{name} must be at least 1")
+        now = time.monotonic()
+        await self._prune(now)
+        if cursor is not None:
+            state = self._cursors.pop(cursor, None)
+            if state is None:
+                raise ValueError(
+                    "Unknown or expired cursor; repeat the original request "
+                    "without a cursor to start over"
+                )
+            if max_rows is None and max_bytes is None:
+                max_rows, max_bytes = state.max_rows, state.max_bytes
+        elif source is not None:
+            state = _Cursor(source, now + self.ttl, resume=resume)
+        else:
+            raise ValueError("Either a source iterator or a cursor is required")
+        state.max_rows, state.max_bytes = max_rows, max_bytes
+
+        items: List[Any] = []
+        size = 2  # the enclosing brackets
+        exhausted = False
+        error: Optional[Exception] = None
+        while max_rows is None or len(items) < max_rows:
+            if state.pending:
+                item = state.pending.pop()
+            else:
+                try:
+                    item = await state.iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                except Exception as e:
+                    error = e
+                    resume_url = getattr(e, "resume_url", None)
+                    if resume_url and state.resume is not None:
+                        state.iterator = state.resume(resume_url, state.taken)
+                    else:
+                        exhausted = True
+                    break
+                state.taken += 1
+            if max_bytes is not None:
+                item_size = len(dumps(item).encode("utf-8")) + (1 if items else 0)
+                if items and size + item_size > max_bytes:
+                    state.pending.append(item)
+                    break
+                size += item_size
+            items.append(item)
+        if error is not None and not items:
+            # Nothing to hand back: keep a resumable cursor for the retry.
+            if cursor is not None and not exhausted:
+                state.expires = time.monotonic() + self.ttl
+                self._cursors[cursor] = state
+            raise error
+        self.pages_served += 1
+
+        next_cursor = None
+        if not exhausted:
+            next_cursor = cursor or secrets.token_urlsafe(12)
+            state.expires = time.monotonic() + self.ttl
+            self._cursors[next_cursor] = state
+            await self._prune(time.monotonic())
+        page = {"items": items, "count": len(items), "nextCursor": next_cursor}
+        if error is not None:
+            page["error"] = str(error)
+        return page
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "openCursors": len(self._cursors),
+            "pagesServed": self.pages_served,
+            "expiredCursors": self.expired,
+        }
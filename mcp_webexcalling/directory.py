@@ -0,0 +1,667 @@
+"""In-memory snapshot of the org directory with secondary indexes.
+
+:class:`DirectoryIndex` crawls people (with calling data), locations, phone
+numbers, devices, call queues (with their agents) and hunt groups, then
+builds hash indexes so the lookups agents make constantly — who owns this
+email / extension / number, which device has this MAC, who is at this
+location — are dictionary reads instead of API round trips:
+
+* ``by_email``: lower-cased email -> person id
+* ``by_extension``: extension -> owners (people, queues, hunt groups, ...)
+* ``by_number``: E.164 digits -> owner
+* ``by_mac``: normalised MAC -> device id
+* ``by_location``: location id -> member ids by kind
+* ``queues_by_agent``: person id -> call queue ids
+* ``search``: trigram index over people for fuzzy ``search_users`` (see
+  :mod:`mcp_webexcalling.search_index`)
+
+Owners are reported as ``{"ownerType", "ownerId", "locationId", "owner"}``
+using the Webex number-owner types (``PEOPLE``, ``CALL_QUEUE``,
+``HUNT_GROUP``, ...), with ``owner`` the full object when it is in the
+snapshot.
+
+A snapshot is built all at once and swapped in atomically, so readers never
+see a half-built index. It is considered stale after ``max_age`` seconds;
+:meth:`DirectoryIndex.refresh_in_background` rebuilds it without blocking
+callers, who keep reading the previous snapshot meanwhile. Single-object
+changes pushed between crawls (:meth:`DirectoryIndex.apply_change`) patch
+just that object's index entries.
+
+Snapshots are persisted (see :func:`write_snapshot_file`) so a restarted
+server starts warm: :meth:`DirectoryIndex.warm_start` loads the last file off
+the event loop and only then schedules a refresh if it is stale.
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import mmap
+import time
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from .number_geo import e164_digits
+from .search_index import TrigramIndex
+from .serializer import dumps, loads
+from .state import atomic_write_bytes
+
+logger = logging.getLogger("mcp_webexcalling")
+
+# Queue details (for the agent lists) are fetched with at most this many
+# requests in flight; the client's rate limiter still paces them.
+_DETAIL_CONCURRENCY = 8
+
+PEOPLE = "PEOPLE"
+CALL_QUEUE = "CALL_QUEUE"
+HUNT_GROUP = "HUNT_GROUP"
+
+# Snapshot collections in crawl order.
+COLLECTIONS = ("people", "locations", "numbers", "devices", "call_queues", "hunt_groups")
+
+
+def normalize_mac(mac: Any) -> str:
+    """Return ``mac`` as 12 upper-case hex digits (separators removed)."""
+    return "".join(ch for ch in str(mac or "").upper() if ch in "0123456789ABCDEF")
+
+
+def number_key(phone_number: Any) -> Optional[str]:
+    """Index key for a phone number: its E.164 digits, or None."""
+    return e164_digits(phone_number)
+
+
+def _location_of(item: Dict[str, Any]) -> Optional[str]:
+    location = item.get("location")
+    if isinstance(location, dict) and location.get("id"):
+        return location["id"]
+    return item.get("locationId")
+
+
+async def _collect(items: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [item async for item in items]
+
+
+_Ref = Tuple[str, str, Optional[str]]
+
+# Call queue / hunt group collections -> (by_location kind, owner type).
+_GROUPS = {"call_queues": ("callQueues", CALL_QUEUE), "hunt_groups": ("huntGroups", HUNT_GROUP)}
+
+
+class _Indexes:
+    """The secondary indexes of one snapshot, maintained object by object.
+
+    ``people`` is the snapshot's people dict (devices without a location
+    inherit their owner's). Every ``add_*`` has a matching ``remove_*``
+    taking the object as it was added, so a change touches only that
+    object's keys.
+    """
+
+    def __init__(self, people: Dict[str, Dict[str, Any]]):
+        self.people = people
+        self.by_email: Dict[str, str] = {}
+        self.by_extension: Dict[str, List[_Ref]] = {}
+        self.by_number: Dict[str, _Ref] = {}
+        self.by_mac: Dict[str, str] = {}
+        self.by_location: Dict[str, Dict[str, List[str]]] = {}
+        self.queues_by_agent: Dict[str, List[str]] = {}
+        self.devices_by_person: Dict[str, List[str]] = {}
+        # Entries taken from the numbers inventory, which object changes
+        # never remove.
+        self._inventory_numbers: Set[str] = set()
+        self._inventory_extensions: Set[Tuple[str, _Ref]] = set()
+
+    def add_number_record(self, record: Dict[str, Any]) -> None:
+        owner = record.get("owner") or {}
+        if not owner.get("id"):
+            return
+        ref = (owner.get("type") or "UNKNOWN", owner["id"], _location_of(record))
+        key = number_key(record.get("phoneNumber"))
+        if key is not None and key not in self.by_number:
+            self.by_number[key] = ref
+            self._inventory_numbers.add(key)
+        extension = record.get("extension")
+        if extension:
+            self._inventory_extensions.add((str(extension), ref))
+            self._add_extension(extension, ref)
+
+    def add_person(self, person_id: str, person: Dict[str, Any]) -> None:
+        ref = (PEOPLE, person_id, person.get("locationId"))
+        for email in person.get("emails") or []:
+            self.by_email.setdefault(str(email).lower(), person_id)
+        self._add_extension(person.get("extension"), ref)
+        for phone in person.get("phoneNumbers") or []:
+            if isinstance(phone, dict):
+                self._add_number(phone.get("value"), ref)
+        self._add_member(ref[2], "people", person_id)
+
+    def remove_person(self, person_id: str, person: Dict[str, Any]) -> None:
+        ref = (PEOPLE, person_id, person.get("locationId"))
+        for email in person.get("emails") or []:
+            if self.by_email.get(str(email).lower()) == person_id:
+                del self.by_email[str(email).lower()]
+        self._remove_extension(person.get("extension"), ref)
+        for phone in person.get("phoneNumbers") or []:
+            if isinstance(phone, dict):
+                self._remove_number(phone.get("value"), ref)
+        self._remove_member(ref[2], "people", person_id)
+
+    def add_group(self, collection: str, item_id: str, item: Dict[str, Any]) -> None:
+        kind, owner_type = _GROUPS[collection]
+        ref = (owner_type, item_id, item.get("locationId"))
+        self._add_extension(item.get("extension"), ref)
+        self._add_number(item.get("phoneNumber"), ref)
+        self._add_member(ref[2], kind, item_id)
+        for agent_id in _agent_ids(collection, item):
+            self.queues_by_agent.setdefault(agent_id, []).append(item_id)
+
+    def remove_group(self, collection: str, item_id: str, item: Dict[str, Any]) -> None:
+        kind, owner_type = _GROUPS[collection]
+        ref = (owner_type, item_id, item.get("locationId"))
+        self._remove_extension(item.get("extension"), ref)
+        self._remove_number(item.get("phoneNumber"), ref)
+        self._remove_member(ref[2], kind, item_id)
+        for agent_id in _agent_ids(collection, item):
+            _remove_from(self.queues_by_agent, agent_id, item_id)
+
+    def add_device(self, device_id: str, device: Dict[str, Any]) -> None:
+        mac = normalize_mac(device.get("mac"))
+        if mac:
+            self.by_mac[mac] = device_id
+        person_id = device.get("personId")
+        if person_id:
+            self.devices_by_person.setdefault(person_id, []).append(device_id)
+        self._add_member(self._device_location(device), "devices", device_id)
+
+    def remove_device(self, device_id: str, device: Dict[str, Any]) -> None:
+        mac = normalize_mac(device.get("mac"))
+        if mac and self.by_mac.get(mac) == device_id:
+            del self.by_mac[mac]
+        person_id = device.get("personId")
+        if person_id:
+            _remove_from(self.devices_by_person, person_id, device_id)
+        self._remove_member(self._device_location(device), "devices", device_id)
+
+    def _device_location(self, device: Dict[str, Any]) -> Optional[str]:
+        location_id = device.get("locationId")
+        if not location_id and device.get("personId") in self.people:
+            location_id = self.people[device["personId"]].get("locationId")
+        return location_id
+
+    def _add_extension(self, extension: Any, ref: _Ref) -> None:
+        if extension:
+            refs = self.by_extension.setdefault(str(extension), [])
+            if ref not in refs:
+                refs.append(ref)
+
+    def _remove_extension(self, extension: Any, ref: _Ref) -> None:
+        if extension and (str(extension), ref) not in self._inventory_extensions:
+            _remove_from(self.by_extension, str(extension), ref)
+
+    def _add_number(self, number: Any, ref: _Ref) -> None:
+        key = number_key(number)
+        if key is not None:
+            self.by_number.setdefault(key, ref)
+
+    def _remove_number(self, number: Any, ref: _Ref) -> None:
+        key = number_key(number)
+        if key not in self._inventory_numbers and self.by_number.get(key) == ref:
+            del self.by_number[key]
+
+    def _add_member(self, location_id: Optional[str], kind: str, item_id: str) -> None:
+        if location_id:
+            self.by_location.setdefault(location_id, {}).setdefault(kind, []).append(item_id)
+
+    def _remove_member(self, location_id: Optional[str], kind: str, item_id: str) -> None:
+        if location_id and location_id in self.by_location:
+            _remove_from(self.by_location[location_id], kind, item_id)
+
+
+def _agent_ids(collection: str, item: Dict[str, Any]) -> List[str]:
+    if collection != "call_queues":
+        return []
+    agents = (agent.get("id") or agent.get("personId") for agent in item.get("agents") or [])
+    return [agent_id for agent_id in agents if agent_id]
+
+
+def _remove_from(lists: Dict[Any, List[Any]], key: Any, value: Any) -> None:
+    """Remove ``value`` from ``lists[key]``, dropping the key once empty."""
+    values = lists.get(key)
+    if values and value in values:
+        values.remove(value)
+        if not values:
+            del lists[key]
+
+
+# ---------------------------------------------------------------------- #
+# On-disk snapshot format
+# ---------------------------------------------------------------------- #
+# A magic line, one line of JSON header, then one zlib-compressed compact
+# JSON array per collection. The header records the format version, the
+# snapshot's build time and ETag (a hash of the uncompressed sections) and
+# each section's (offset, length) relative to the end of the header, so a
+# reader can map the file and decode only what it needs.
+SNAPSHOT_MAGIC = b"WXDIR\n"
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot_file(
+    path: Path, snapshot: Dict[str, List[Dict[str, Any]]], built_at: Optional[float]
+) -> str:
+    """Atomically write ``snapshot`` to ``path`` and return its ETag."""
+    digest = hashlib.sha256()
+    sections: Dict[str, List[int]] = {}
+    blobs = []
+    offset = 0
+    for name in COLLECTIONS:
+        raw = dumps(snapshot.get(name, [])).encode("utf-8")
+        digest.update(raw)
+        blob = zlib.compress(raw, 6)
+        sections[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+    etag = digest.hexdigest()[:32]
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "etag": etag,
+        "builtAt": built_at,
+        "counts": {name: len(snapshot.get(name, [])) for name in COLLECTIONS},
+        "sections": sections,
+    }
+    atomic_write_bytes(
+        path, SNAPSHOT_MAGIC + dumps(header).encode("utf-8") + b"\n" + b"".join(blobs)
+    )
+    return etag
+
+
+def read_snapshot_file(
+    path: Path,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]]:
+    """Return ``(header, snapshot)`` from ``path``, or None if absent/unusable."""
+    try:
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if view[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                logger.warning("Ignoring directory snapshot %s: not a snapshot file", path)
+                return None
+            header_end = view.find(b"\n", len(SNAPSHOT_MAGIC))
+            header = loads(view[len(SNAPSHOT_MAGIC):header_end])
+            if header.get("version") != SNAPSHOT_VERSION:
+                logger.info("Ignoring directory snapshot %s: format version changed", path)
+                return None
+            base = header_end + 1
+            snapshot = {}
+            for name, (offset, length) in header["sections"].items():
+                start = base + offset
+                snapshot[name] = loads(zlib.decompress(view[start:start + length]))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, zlib.error) as e:
+        logger.warning("Ignoring unreadable directory snapshot %s: %s", path, e)
+        return None
+    return header, snapshot
+
+
+class DirectoryIndex:
+    """Org directory snapshot with hash indexes for point lookups.
+
+    Args:
+        max_age: Seconds after which the snapshot is considered stale.
+        path: Optional snapshot file, written after every refresh and read
+            by :meth:`warm_start`.
+    """
+
+    def __init__(self, max_age: float = 3600.0, path: Optional[Path] = None):
+        self.max_age = max_age
+        self.path = path
+        self.etag: Optional[str] = None
+        self.loaded_from_disk = False
+        self.built_at: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.changes_applied = 0
+        self.last_error: Optional[str] = None
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        self.load({name: [] for name in COLLECTIONS}, built_at=None)
+
+    # ------------------------------------------------------------------ #
+    # Building
+    # ------------------------------------------------------------------ #
+    def load(
+        self,
+        snapshot: Dict[str, List[Dict[str, Any]]],
+        built_at: Optional[float] = None,
+        search: Optional[TrigramIndex] = None,
+    ) -> None:
+        """Replace the snapshot and rebuild every index from ``snapshot``.
+
+        ``snapshot`` maps each name in :data:`COLLECTIONS` to a list of API
+        objects; call queues may carry an ``agents`` list. ``search`` reuses
+        an already up-to-date people search index instead of rebuilding it.
+        """
+        people = {p["id"]: p for p in snapshot.get("people", []) if p.get("id")}
+        locations = {
+            location["id"]: location
+            for location in snapshot.get("locations", []) if location.get("id")
+        }
+        devices = {d["id"]: d for d in snapshot.get("devices", []) if d.get("id")}
+        queues = {q["id"]: q for q in snapshot.get("call_queues", []) if q.get("id")}
+        hunt_groups = {h["id"]: h for h in snapshot.get("hunt_groups", []) if h.get("id")}
+        numbers = list(snapshot.get("numbers", []))
+        owners = {PEOPLE: people, CALL_QUEUE: queues, HUNT_GROUP: hunt_groups}
+
+        # The numbers inventory is authoritative for ownership, so it goes
+        # first; object fields only fill in what it doesn't list.
+        indexes = _Indexes(people)
+        for record in numbers:
+            indexes.add_number_record(record)
+        for person_id, person in people.items():
+            indexes.add_person(person_id, person)
+        for queue_id, queue in queues.items():
+            indexes.add_group("call_queues", queue_id, queue)
+        for hunt_group_id, hunt_group in hunt_groups.items():
+            indexes.add_group("hunt_groups", hunt_group_id, hunt_group)
+        for device_id, device in devices.items():
+            indexes.add_device(device_id, device)
+
+        if search is None:
+            search = TrigramIndex(people, locations)
+
+        # Swap everything in at once.
+        self.people, self.locations, self.devices = people, locations, devices
+        self.call_queues, self.hunt_groups, self.numbers = queues, hunt_groups, numbers
+        self._owners = owners
+        self._indexes = indexes
+        self.by_email, self.by_extension = indexes.by_email, indexes.by_extension
+        self.by_number, self.by_mac = indexes.by_number, indexes.by_mac
+        self.by_location, self.queues_by_agent = indexes.by_location, indexes.queues_by_agent
+        self.search = search
+        self.built_at = built_at
+
+    def apply_change(
+        self, collection: str, item_id: str, item: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Insert/replace (``item`` given) or remove one object in place.
+
+        Used for event-driven updates between crawls: only the changed
+        object's index entries are removed and re-added (plus the device
+        and search entries that inherit a changed person's or location's
+        data), and the build time is kept. A number or email that two
+        objects claim stays with whichever the index picked until the next
+        crawl. Returns False when the snapshot isn't built yet or
+        ``collection`` has no ids.
+        """
+        if not self.ready or collection not in COLLECTIONS or collection == "numbers":
+            return False
+        indexes = self._indexes
+        items = {
+            "people": self.people,
+            "locations": self.locations,
+            "devices": self.devices,
+            "call_queues": self.call_queues,
+            "hunt_groups": self.hunt_groups,
+        }[collection]
+        old = items.get(item_id)
+
+        # Devices without a location of their own follow their owner's, so
+        # a person's devices come out while the old record is still in place.
+        owned = []
+        if collection == "people":
+            owned = [
+                (device_id, self.devices[device_id])
+                for device_id in indexes.devices_by_person.get(item_id, [])
+            ]
+            for device_id, device in owned:
+                indexes.remove_device(device_id, device)
+        if old is not None:
+            if collection == "people":
+                indexes.remove_person(item_id, old)
+            elif collection == "devices":
+                indexes.remove_device(item_id, old)
+            elif collection != "locations":
+                indexes.remove_group(collection, item_id, old)
+
+        if item is None:
+            items.pop(item_id, None)
+        else:
+            items[item_id] = item
+            if collection == "people":
+                indexes.add_person(item_id, item)
+            elif collection == "devices":
+                indexes.add_device(item_id, item)
+            elif collection != "locations":
+                indexes.add_group(collection, item_id, item)
+        for device_id, device in owned:
+            indexes.add_device(device_id, device)
+
+        if collection == "people":
+            if item is None:
+                self.search.discard(item_id)
+            else:
+                location = self.locations.get(item.get("locationId")) or {}
+                self.search.add(item_id, item, location.get("name"))
+        elif collection == "locations":
+            # Location names are indexed with the people there.
+            name = (item or {}).get("name")
+            for person_id in self.by_location.get(item_id, {}).get("people", []):
+                self.search.add(person_id, self.people[person_id], name)
+        self.changes_applied += 1
+        return True
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the raw collections the indexes were built from."""
+        return {
+            "people": list(self.people.values()),
+            "locations": list(self.locations.values()),
+            "numbers": list(self.numbers),
+            "devices": list(self.devices.values()),
+            "call_queues": list(self.call_queues.values()),
+            "hunt_groups": list(self.hunt_groups.values()),
+        }
+
+    async def crawl(self, client: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch every collection (concurrently) plus each queue's agents."""
+        people, locations, numbers, devices, queues, hunt_groups = await asyncio.gather(
+            _collect(client.iter_items("/people", {"callingData": "true"})),
+            _collect(client.iter_locations()),
+            _collect(client.iter_phone_numbers()),
+            _collect(client.iter_devices()),
+            _collect(client.iter_call_queues()),
+            _collect(client.iter_hunt_groups()),
+        )
+
+        semaphore = asyncio.Semaphore(_DETAIL_CONCURRENCY)
+
+        async def with_agents(queue: Dict[str, Any]) -> Dict[str, Any]:
+            if "agents" in queue:
+                return queue
+            try:
+                async with semaphore:
+                    details = await client.get_call_queue_details(queue["id"])
+            except Exception as e:
+                # Membership is a bonus; one unreadable queue shouldn't sink
+                # the whole snapshot.
+                logger.debug("Skipping agents of queue %s: %s", queue["id"], e)
+                return queue
+            return {**queue, "agents": details.get("agents") or []}
+
+        queues = await asyncio.gather(*(with_agents(q) for q in queues if q.get("id")))
+        return {
+            "people": people,
+            "locations": locations,
+            "numbers": numbers,
+            "devices": devices,
+            "call_queues": list(queues),
+            "hunt_groups": hunt_groups,
+        }
+
+    async def refresh(self, client: Any) -> None:
+        """Crawl the org and swap in the new snapshot."""
+        started = time.monotonic()
+        try:
+            snapshot = await self.crawl(client)
+        except Exception as e:
+            self.refresh_errors += 1
+            self.last_error = str(e)
+            raise
+        self.load(snapshot, built_at=time.time())
+        self.build_seconds = round(time.monotonic() - started, 3)
+        self.refreshes += 1
+        self.last_error = None
+        self.loaded_from_disk = False
+        if self.path is not None:
+            try:
+                self.etag = await asyncio.to_thread(
+                    write_snapshot_file, self.path, snapshot, self.built_at
+                )
+            except OSError as e:
+                logger.warning("Could not persist directory snapshot to %s: %s", self.path, e)
+        logger.info(
+            "Directory index refreshed: %d people, %d numbers, %d devices in %.1fs",
+            len(self.people), len(self.numbers), len(self.devices), self.build_seconds,
+        )
+
+    def refresh_in_background(self, client: Any) -> None:
+        """Start a refresh unless one is already running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def run() -> None:
+            try:
+                await self.refresh(client)
+            except Exception as e:
+                logger.warning("Directory refresh failed: %s", e)
+
+        self._refresh_task = asyncio.create_task(run())
+
+    def load_file(self) -> bool:
+        """Load the persisted snapshot, if any; returns whether one was loaded."""
+        if self.path is None:
+            return False
+        result = read_snapshot_file(self.path)
+        if result is None:
+            return False
+        header, snapshot = result
+        self.load(snapshot, built_at=header.get("builtAt"))
+        self.etag = header.get("etag")
+        self.loaded_from_disk = True
+        return True
+
+    async def warm_start(self, client: Any) -> None:
+        """Load the persisted snapshot off the event loop, then refresh if stale.
+
+        Lookups fall back to the API until the file is loaded, so the server
+        can answer immediately however large the org is.
+        """
+        if not self.ready:
+            started = time.monotonic()
+            if await asyncio.to_thread(self.load_file):
+                logger.info(
+                    "Directory index warm-started from %s in %.0f ms (%d people)",
+                    self.path, (time.monotonic() - started) * 1000, len(self.people),
+                )
+        if self.stale:
+            self.refresh_in_background(client)
+
+    async def stop(self) -> None:
+        """Cancel a running background refresh."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at is not None
+
+    @property
+    def stale(self) -> bool:
+        return self.built_at is None or time.time() - self.built_at > self.max_age
+
+    # ------------------------------------------------------------------ #
+    # Lookups
+    # ------------------------------------------------------------------ #
+    # Results are deep copies: callers may edit them without touching the
+    # snapshot or leaving the hash indexes out of step with it.
+    def _owner(self, ref: Tuple[str, str, Optional[str]]) -> Dict[str, Any]:
+        owner_type, owner_id, location_id = ref
+        return {
+            "ownerType": owner_type,
+            "ownerId": owner_id,
+            "locationId": location_id,
+            "owner": copy.deepcopy(self._owners.get(owner_type, {}).get(owner_id)),
+        }
+
+    def person_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        person_id = self.by_email.get(str(email).strip().lower())
+        return copy.deepcopy(self.people.get(person_id)) if person_id else None
+
+    def owners_by_extension(
+        self, extension: str, location_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        refs = self.by_extension.get(str(extension).strip(), [])
+        return [self._owner(ref) for ref in refs if not location_id or ref[2] == location_id]
+
+    def owner_by_number(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        key = number_key(phone_number)
+        ref = self.by_number.get(key) if key else None
+        return self._owner(ref) if ref else None
+
+    def device_by_mac(self, mac: str) -> Optional[Dict[str, Any]]:
+        device_id = self.by_mac.get(normalize_mac(mac))
+        return copy.deepcopy(self.devices.get(device_id)) if device_id else None
+
+    def location_members(self, location_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        members = self.by_location.get(location_id, {})
+        sources = {
+            "people": self.people,
+            "devices": self.devices,
+            "callQueues": self.call_queues,
+            "huntGroups": self.hunt_groups,
+        }
+        return {
+            kind: [copy.deepcopy(items[i]) for i in members.get(kind, []) if i in items]
+            for kind, items in sources.items()
+        }
+
+    def queue_agents(self, queue_id: str) -> Optional[List[Dict[str, Any]]]:
+        queue = self.call_queues.get(queue_id)
+        if queue is None or "agents" not in queue:
+            return None
+        return copy.deepcopy(queue["agents"])
+
+    def search_people(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Fuzzy-search people by name, email, extension, number or location."""
+        return [
+            copy.deepcopy(self.people[person_id])
+            for person_id, _ in self.search.search(query, limit)
+        ]
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "stale": self.stale,
+            "builtAt": self.built_at,
+            "ageSeconds": round(time.time() - self.built_at, 1) if self.built_at else None,
+            "buildSeconds": self.build_seconds,
+            "refreshes": self.refreshes,
+            "refreshErrors": self.refresh_errors,
+            "changesApplied": self.changes_applied,
+            "lastError": self.last_error,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done(),
+            "path": str(self.path) if self.path is not None else None,
+            "etag": self.etag,
+            "loadedFromDisk": self.loaded_from_disk,
+            "counts": {
+                "people": len(self.people),
+                "locations": len(self.locations),
+                "numbers": len(self.numbers),
+                "devices": len(self.devices),
+                "callQueues": len(self.call_queues),
+                "huntGroups": len(self.hunt_groups),
+            },
+            "searchIndex": self.search.stats(),
+        }
@@ -0,0 +1,451 @@
+"""Phone number geolocation by E.164 country code and NANP area code.
+
+:func:`locate_number` maps a phone number to its country (ISO 3166-1
+alpha-2), world region and, inside the North American Numbering Plan, the
+US state, Canadian province or territory / Caribbean country of its area
+code. Classification is a longest-prefix walk over a digit trie, so it costs
+O(digits) per number.
+
+The trie is built lazily on first lookup, so importing this module costs
+nothing at server startup. Numbers in ``+1`` whose area code isn't listed
+(toll-free, non-geographic, or not yet in :data:`~.area_codes.AREA_CODE_TO_STATE`)
+resolve to the ``NANP`` pseudo-country.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .area_codes import AREA_CODE_TO_STATE
+
+
+class NumberLocation(NamedTuple):
+    country_code: str
+    """E.164 country calling code, e.g. ``"44"`` or ``"1"``."""
+    country: str
+    """ISO 3166-1 alpha-2 code (``"NANP"`` / ``"INTL"`` for shared plans)."""
+    country_name: str
+    region: str
+    subdivision: Optional[str] = None
+    """US state, Canadian province, or None."""
+
+
+# E.164 country calling codes: "code ISO region|name", one per line.
+_COUNTRY_CODES = """
+1 NANP North America|North American Numbering Plan
+20 EG Africa|Egypt
+211 SS Africa|South Sudan
+212 MA Africa|Morocco
+213 DZ Africa|Algeria
+216 TN Africa|Tunisia
+218 LY Africa|Libya
+220 GM Africa|Gambia
+221 SN Africa|Senegal
+222 MR Africa|Mauritania
+223 ML Africa|Mali
+224 GN Africa|Guinea
+225 CI Africa|Cote d'Ivoire
+226 BF Africa|Burkina Faso
+227 NE Africa|Niger
+228 TG Africa|Togo
+229 BJ Africa|Benin
+230 MU Africa|Mauritius
+231 LR Africa|Liberia
+232 SL Africa|Sierra Leone
+233 GH Africa|Ghana
+234 NG Africa|Nigeria
+235 TD Africa|Chad
+236 CF Africa|Central African Republic
+237 CM Africa|Cameroon
+238 CV Africa|Cape Verde
+239 ST Africa|Sao Tome and Principe
+240 GQ Africa|Equatorial Guinea
+241 GA Africa|Gabon
+242 CG Africa|Republic of the Congo
+243 CD Africa|Democratic Republic of the Congo
+244 AO Africa|Angola
+245 GW Africa|Guinea-Bissau
+247 AC Africa|Ascension Island
+248 SC Africa|Seychelles
+249 SD Africa|Sudan
+250 RW Africa|Rwanda
+251 ET Africa|Ethiopia
+252 SO Africa|Somalia
+253 DJ Africa|Djibouti
+254 KE Africa|Kenya
+255 TZ Africa|Tanzania
+256 UG Africa|Uganda
+257 BI Africa|Burundi
+258 MZ Africa|Mozambique
+260 ZM Africa|Zambia
+261 MG Africa|Madagascar
+262 RE Africa|Reunion
+263 ZW Africa|Zimbabwe
+264 NA Africa|Namibia
+265 MW Africa|Malawi
+266 LS Africa|Lesotho
+267 BW Africa|Botswana
+268 SZ Africa|Eswatini
+269 KM Africa|Comoros
+27 ZA Africa|South Africa
+290 SH Africa|Saint Helena
+291 ER Africa|Eritrea
+297 AW Caribbean|Aruba
+298 FO Europe|Faroe Islands
+299 GL North America|Greenland
+30 GR Europe|Greece
+31 NL Europe|Netherlands
+32 BE Europe|Belgium
+33 FR Europe|France
+34 ES Europe|Spain
+350 GI Europe|Gibraltar
+351 PT Europe|Portugal
+352 LU Europe|Luxembourg
+353 IE Europe|Ireland
+354 IS Europe|Iceland
+355 AL Europe|Albania
+356 MT Europe|Malta
+357 CY Europe|Cyprus
+358 FI Europe|Finland
+359 BG Europe|Bulgaria
+36 HU Europe|Hungary
+370 LT Europe|Lithuania
+371 LV Europe|Latvia
+372 EE Europe|Estonia
+373 MD Europe|Moldova
+374 AM Asia|Armenia
+375 BY Europe|Belarus
+376 AD Europe|Andorra
+377 MC Europe|Monaco
+378 SM Europe|San Marino
+380 UA Europe|Ukraine
+381 RS Europe|Serbia
+382 ME Europe|Montenegro
+383 XK Europe|Kosovo
+385 HR Europe|Croatia
+386 SI Europe|Slovenia
+387 BA Europe|Bosnia and Herzegovina
+389 MK Europe|North Macedonia
+39 IT Europe|Italy
+40 RO Europe|Romania
+41 CH Europe|Switzerland
+420 CZ Europe|Czechia
+421 SK Europe|Slovakia
+423 LI Europe|Liechtenstein
+43 AT Europe|Austria
+44 GB Europe|United Kingdom
+45 DK Europe|Denmark
+46 SE Europe|Sweden
+47 NO Europe|Norway
+48 PL Europe|Poland
+49 DE Europe|Germany
+500 FK South America|Falkland Islands
+501 BZ Central America|Belize
+502 GT Central America|Guatemala
+503 SV Central America|El Salvador
+504 HN Central America|Honduras
+505 NI Central America|Nicaragua
+506 CR Central America|Costa Rica
+507 PA Central America|Panama
+508 PM North America|Saint Pierre and Miquelon
+509 HT Caribbean|Haiti
+51 PE South America|Peru
+52 MX North America|Mexico
+53 CU Caribbean|Cuba
+54 AR South America|Argentina
+55 BR South America|Brazil
+56 CL South America|Chile
+57 CO South America|Colombia
+58 VE South America|Venezuela
+590 GP Caribbean|Guadeloupe
+591 BO South America|Bolivia
+592 GY South America|Guyana
+593 EC South America|Ecuador
+594 GF South America|French Guiana
+595 PY South America|Paraguay
+596 MQ Caribbean|Martinique
+597 SR South America|Suriname
+598 UY South America|Uruguay
+599 CW Caribbean|Curacao
+60 MY Asia|Malaysia
+61 AU Oceania|Australia
+62 ID Asia|Indonesia
+63 PH Asia|Philippines
+64 NZ Oceania|New Zealand
+65 SG Asia|Singapore
+66 TH Asia|Thailand
+670 TL Asia|Timor-Leste
+672 NF Oceania|Norfolk Island
+673 BN Asia|Brunei
+674 NR Oceania|Nauru
+675 PG Oceania|Papua New Guinea
+676 TO Oceania|Tonga
+677 SB Oceania|Solomon Islands
+678 VU Oceania|Vanuatu
+679 FJ Oceania|Fiji
+680 PW Oceania|Palau
+681 WF Oceania|Wallis and Futuna
+682 CK Oceania|Cook Islands
+683 NU Oceania|Niue
+685 WS Oceania|Samoa
+686 KI Oceania|Kiribati
+687 NC Oceania|New Caledonia
+688 TV Oceania|Tuvalu
+689 PF Oceania|French Polynesia
+690 TK Oceania|Tokelau
+691 FM Oceania|Micronesia
+692 MH Oceania|Marshall Islands
+7 RU Europe|Russia
+76 KZ Asia|Kazakhstan
+77 KZ Asia|Kazakhstan
+800 INTL International|International Freephone
+808 INTL International|International Shared Cost
+81 JP Asia|Japan
+82 KR Asia|South Korea
+84 VN Asia|Vietnam
+850 KP Asia|North Korea
+852 HK Asia|Hong Kong
+853 MO Asia|Macau
+855 KH Asia|Cambodia
+856 LA Asia|Laos
+86 CN Asia|China
+870 INTL International|Inmarsat
+880 BD Asia|Bangladesh
+881 INTL International|Global Mobile Satellite System
+882 INTL International|International Networks
+883 INTL International|International Networks
+886 TW Asia|Taiwan
+90 TR Europe|Turkey
+91 IN Asia|India
+92 PK Asia|Pakistan
+93 AF Asia|Afghanistan
+94 LK Asia|Sri Lanka
+95 MM Asia|Myanmar
+960 MV Asia|Maldives
+961 LB Middle East|Lebanon
+962 JO Middle East|Jordan
+963 SY Middle East|Syria
+964 IQ Middle East|Iraq
+965 KW Middle East|Kuwait
+966 SA Middle East|Saudi Arabia
+967 YE Middle East|Yemen
+968 OM Middle East|Oman
+970 PS Middle East|Palestine
+971 AE Middle East|United Arab Emirates
+972 IL Middle East|Israel
+973 BH Middle East|Bahrain
+974 QA Middle East|Qatar
+975 BT Asia|Bhutan
+976 MN Asia|Mongolia
+977 NP Asia|Nepal
+979 INTL International|International Premium Rate
+98 IR Middle East|Iran
+992 TJ Asia|Tajikistan
+993 TM Asia|Turkmenistan
+994 AZ Asia|Azerbaijan
+995 GE Asia|Georgia
+996 KG Asia|Kyrgyzstan
+998 UZ Asia|Uzbekistan
+"""
+
+# NANP area codes outside the 50 US states: "NPA ISO region|name|subdivision".
+_NANP_AREA_CODES = """
+204 CA North America|Canada|Manitoba
+431 CA North America|Canada|Manitoba
+584 CA North America|Canada|Manitoba
+226 CA North America|Canada|Ontario
+249 CA North America|Canada|Ontario
+289 CA North America|Canada|Ontario
+343 CA North America|Canada|Ontario
+365 CA North America|Canada|Ontario
+382 CA North America|Canada|Ontario
+416 CA North America|Canada|Ontario
+437 CA North America|Canada|Ontario
+519 CA North America|Canada|Ontario
+548 CA North America|Canada|Ontario
+613 CA North America|Canada|Ontario
+647 CA North America|Canada|Ontario
+683 CA North America|Canada|Ontario
+705 CA North America|Canada|Ontario
+742 CA North America|Canada|Ontario
+753 CA North America|Canada|Ontario
+807 CA North America|Canada|Ontario
+905 CA North America|Canada|Ontario
+236 CA North America|Canada|British Columbia
+250 CA North America|Canada|British Columbia
+257 CA North America|Canada|British Columbia
+604 CA North America|Canada|British Columbia
+672 CA North America|Canada|British Columbia
+778 CA North America|Canada|British Columbia
+263 CA North America|Canada|Quebec
+354 CA North America|Canada|Quebec
+367 CA North America|Canada|Quebec
+418 CA North America|Canada|Quebec
+438 CA North America|Canada|Quebec
+450 CA North America|Canada|Quebec
+468 CA North America|Canada|Quebec
+514 CA North America|Canada|Quebec
+579 CA North America|Canada|Quebec
+581 CA North America|Canada|Quebec
+819 CA North America|Canada|Quebec
+873 CA North America|Canada|Quebec
+306 CA North America|Canada|Saskatchewan
+474 CA North America|Canada|Saskatchewan
+639 CA North America|Canada|Saskatchewan
+368 CA North America|Canada|Alberta
+403 CA North America|Canada|Alberta
+587 CA North America|Canada|Alberta
+780 CA North America|Canada|Alberta
+825 CA North America|Canada|Alberta
+428 CA North America|Canada|New Brunswick
+506 CA North America|Canada|New Brunswick
+782 CA North America|Canada|Nova Scotia and Prince Edward Island
+902 CA North America|Canada|Nova Scotia and Prince Edward Island
+709 CA North America|Canada|Newfoundland and Labrador
+879 CA North America|Canada|Newfoundland and Labrador
+867 CA North America|Canada|Yukon, Northwest Territories and Nunavut
+600 CA North America|Canada|
+622 CA North America|Canada|
+787 PR Caribbean|Puerto Rico|
+939 PR Caribbean|Puerto Rico|
+340 VI Caribbean|U.S. Virgin Islands|
+671 GU Oceania|Guam|
+670 MP Oceania|Northern Mariana Islands|
+684 AS Oceania|American Samoa|
+242 BS Caribbean|Bahamas|
+246 BB Caribbean|Barbados|
+264 AI Caribbean|Anguilla|
+268 AG Caribbean|Antigua and Barbuda|
+284 VG Caribbean|British Virgin Islands|
+345 KY Caribbean|Cayman Islands|
+441 BM North America|Bermuda|
+473 GD Caribbean|Grenada|
+649 TC Caribbean|Turks and Caicos Islands|
+658 JM Caribbean|Jamaica|
+876 JM Caribbean|Jamaica|
+664 MS Caribbean|Montserrat|
+721 SX Caribbean|Sint Maarten|
+758 LC Caribbean|Saint Lucia|
+767 DM Caribbean|Dominica|
+784 VC Caribbean|Saint Vincent and the Grenadines|
+809 DO Caribbean|Dominican Republic|
+829 DO Caribbean|Dominican Republic|
+849 DO Caribbean|Dominican Republic|
+868 TT Caribbean|Trinidad and Tobago|
+869 KN Caribbean|Saint Kitts and Nevis|
+"""
+
+# Longest country code (3) + NANP area code: deepest prefix in the trie.
+_MAX_PREFIX = 4
+_MAX_E164_DIGITS = 15
+_NUMBER_PUNCTUATION = str.maketrans("", "", "-(). ")
+
+# Built on first use by _trie(): digit -> child node; the "" key of a node
+# holds the NumberLocation for the prefix ending there.
+_TRIE: Optional[Dict[str, dict]] = None
+# ISO code -> (display name, region), built alongside the trie.
+_COUNTRIES: Dict[str, Tuple[str, str]] = {}
+
+
+def _insert(root: Dict[str, dict], prefix: str, location: NumberLocation) -> None:
+    node = root
+    for digit in prefix:
+        node = node.setdefault(digit, {})
+    node[""] = location
+
+
+def _trie() -> Dict[str, dict]:
+    global _TRIE
+    if _TRIE is None:
+        root: Dict[str, dict] = {}
+        for line in _COUNTRY_CODES.strip().splitlines():
+            head, name = line.split("|", 1)
+            code, iso, region = head.split(" ", 2)
+            _insert(root, code, NumberLocation(code, iso, name, region))
+            _COUNTRIES.setdefault(iso, (name, region))
+        for area_code, state in AREA_CODE_TO_STATE.items():
+            _insert(root, "1" + area_code, NumberLocation(
+                "1", "US", "United States", "North America", state
+            ))
+        _COUNTRIES["US"] = ("United States", "North America")
+        for line in _NANP_AREA_CODES.strip().splitlines():
+            head, name, subdivision = line.split("|")
+            npa, iso, region = head.split(" ", 2)
+            _insert(root, "1" + npa, NumberLocation(
+                "1", iso, name, region, subdivision or None
+            ))
+            _COUNTRIES.setdefault(iso, (name, region))
+        _TRIE = root
+    return _TRIE
+
+
+def e164_digits(phone_number) -> Optional[str]:
+    """Return the number's E.164 digits (no ``+``), or None if not dialable.
+
+    International formats (``+``, ``00`` or NANP ``011`` prefixes) are taken
+    as-is; 10-digit and ``1``-prefixed 11-digit numbers are assumed to be
+    NANP. Anything else (extensions, short codes) returns None.
+    """
+    if not phone_number:
+        return None
+    cleaned = str(phone_number).strip().translate(_NUMBER_PUNCTUATION)
+    if cleaned.startswith("+"):
+        digits = cleaned[1:]
+    elif cleaned.startswith("011"):
+        digits = cleaned[3:]
+    elif cleaned.startswith("00"):
+        digits = cleaned[2:]
+    elif len(cleaned) == 11 and cleaned.startswith("1"):
+        digits = cleaned
+    elif len(cleaned) == 10:
+        digits = "1" + cleaned
+    else:
+        return None
+    if not digits or len(digits) > _MAX_E164_DIGITS or not (digits.isdigit() and digits.isascii()):
+        return None
+    return digits
+
+
+def locate_number(phone_number) -> Optional[NumberLocation]:
+    """Return where ``phone_number`` is registered, or None if unknown."""
+    digits = e164_digits(phone_number)
+    if digits is None:
+        return None
+    node = _trie()
+    found = None
+    for digit in digits[:_MAX_PREFIX]:
+        node = node.get(digit)
+        if node is None:
+            break
+        found = node.get("", found)
+    return found
+
+
+def locate_numbers(phone_numbers: Iterable) -> List[Optional[NumberLocation]]:
+    """Batch :func:`locate_number`; repeated numbers are classified once."""
+    memo: Dict[str, Optional[NumberLocation]] = {}
+    out: List[Optional[NumberLocation]] = []
+    for number in phone_numbers:
+        key = str(number) if number else ""
+        if key not in memo:
+            memo[key] = locate_number(number)
+        out.append(memo[key])
+    return out
+
+
+def country_for_number(phone_number) -> Optional[str]:
+    """Return the ISO country code of ``phone_number``, or None."""
+    location = locate_number(phone_number)
+    return location.country if location else None
+
+
+def region_for_country(country: Optional[str]) -> Optional[str]:
+    """Return the world region of an ISO country code from the tables."""
+    _trie()
+    entry = _COUNTRIES.get(country) if country else None
+    return entry[1] if entry else None
+
+
+def country_name(country: Optional[str]) -> Optional[str]:
+    """Return a display name for an ISO country code from the tables."""
+    _trie()
+    entry = _COUNTRIES.get(country) if country else None
+    return entry[0] if entry else None
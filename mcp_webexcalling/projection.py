@@ -0,0 +1,57 @@
+"""Field projection for API objects.
+
+Tools that return whole people or device objects can be asked for just the
+fields a query needs (``fields=["id", "displayName", "emails"]``).
+Projection is applied to each page as it is decoded, before items are
+collected, so the discarded fields never accumulate in memory or reach the
+serializer.
+
+Field names are top-level keys; a dotted name (``"location.id"``,
+``"phoneNumbers.value"``) selects inside a nested object or inside every
+object of a nested list.
+"""
+
+from typing import Any, Iterable, Optional, Tuple, Union
+
+
+def parse_fields(fields: Union[str, Iterable[str], None]) -> Optional[Tuple[str, ...]]:
+    """Normalise a field list (sequence or comma-separated string).
+
+    Returns None when no fields were given, meaning "everything".
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    names = tuple(dict.fromkeys(name.strip() for name in fields if name and name.strip()))
+    return names or None
+
+
+def top_level_fields(fields: Iterable[str]) -> set:
+    """Top-level keys named by ``fields`` (``"location.id"`` -> ``"location"``)."""
+    return {name.partition(".")[0] for name in fields}
+
+
+def project(item: Any, fields: Optional[Tuple[str, ...]]) -> Any:
+    """Return a copy of ``item`` holding only ``fields`` (missing ones are skipped)."""
+    if fields is None or not isinstance(item, dict):
+        return item
+    nested = {}
+    result = {}
+    for name in fields:
+        head, _, rest = name.partition(".")
+        if head not in item:
+            continue
+        if rest:
+            nested.setdefault(head, []).append(rest)
+        else:
+            result[head] = item[head]
+    for head, rests in nested.items():
+        if head in result:
+            continue  # the whole value was asked for as well
+        value = item[head]
+        if isinstance(value, list):
+            result[head] = [project(element, tuple(rests)) for element in value]
+        elif isinstance(value, dict):
+            result[head] = project(value, tuple(rests))
+    return result
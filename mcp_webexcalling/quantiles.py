@@ -0,0 +1,109 @@
+"""Mergeable streaming quantile sketch for call durations and wait times.
+
+:class:`QuantileSketch` follows the DDSketch design: values are counted in
+logarithmically sized buckets, so any quantile is reported within a fixed
+*relative* error (1% by default) regardless of how many values were added.
+Memory grows only with the logarithm of the value range (a few hundred
+buckets cover 1 second to 10 days), not with the number of calls.
+
+Sketches built over different time shards or by parallel workers combine
+exactly with :meth:`QuantileSketch.merge` — the result is identical to a
+single sketch fed every value.
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Sequence
+
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch over non-negative values.
+
+    Args:
+        relative_accuracy: Maximum relative error of reported quantiles.
+    """
+
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "_bins", "_zeros",
+                 "count", "min", "max", "sum")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sum = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add ``value`` (negative values are treated as 0) ``count`` times."""
+        if count <= 0:
+            return
+        value = max(0.0, float(value))
+        if value == 0.0:
+            self._zeros += count
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[index] = self._bins.get(index, 0) + count
+        self.count += count
+        self.sum += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold ``other`` into this sketch (same accuracy required)."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for index, count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the value at quantile ``q`` (0..1), or None if empty."""
+        if not self.count:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        rank = q * (self.count - 1)
+        if rank < self._zeros:
+            return 0.0
+        seen = self._zeros
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if seen > rank:
+                # Bucket midpoint (in the relative sense), clamped to the
+                # exact extremes.
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def percentiles(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES, digits: int = 2
+    ) -> Optional[Dict[str, float]]:
+        """Return ``{"p50": ..., "p95": ..., ...}``, or None if empty."""
+        if not self.count:
+            return None
+        return {
+            f"p{p:g}": round(self.quantile(p / 100.0), digits) for p in percentiles
+        }
@@ -0,0 +1,126 @@
+"""Adaptive client-side rate limiting for the Webex APIs.
+
+Each API host gets one :class:`AdaptiveRateLimiter` shared by every
+coroutine using the :class:`~mcp_webexcalling.webex_client.WebexClient`, so
+concurrent tool calls draw from a single budget instead of each backing off
+on its own.
+
+The limiter is a token bucket whose refill rate follows an AIMD
+(additive-increase / multiplicative-decrease) policy:
+
+* every successful response nudges the rate up by ``increase_step``
+  requests/second, probing for headroom;
+* every 429 (or any response carrying ``Retry-After``) multiplies the rate by
+  ``decrease_factor`` and pauses the whole host until the server's
+  ``Retry-After`` deadline has passed.
+
+The result converges on the highest rate the API tolerates rather than
+repeatedly bouncing off the throttle.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class AdaptiveRateLimiter:
+    """Token bucket with an AIMD-controlled refill rate.
+
+    Args:
+        rate: Initial refill rate in requests per second.
+        min_rate: Floor the rate never drops below.
+        max_rate: Ceiling the rate never probes above.
+        burst: Bucket capacity, i.e. how many requests may go out back to
+            back after an idle period.
+        increase_step: Requests/second added after each success.
+        decrease_factor: Multiplier applied to the rate on throttling.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        min_rate: float = 0.2,
+        max_rate: float = 50.0,
+        burst: float = 10.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(burst, 1.0)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.throttle_events = 0
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+        self.last_retry_after: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            waited = 0.0
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    break
+                else:
+                    delay = (1.0 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+            self.total_acquired += 1
+            self.total_wait_seconds += waited
+
+    def on_success(self) -> None:
+        """Additive increase: probe for more headroom after a success."""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease, plus a host-wide pause for ``Retry-After``."""
+        now = self._clock()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        # Drain the bucket so queued callers don't burst straight back in.
+        self._tokens = min(self._tokens, 0.0)
+        self.throttle_events += 1
+        self.last_retry_after = retry_after
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the limiter's current state as a JSON-friendly dict."""
+        now = self._clock()
+        self._refill(now)
+        return {
+            "rate": round(self.rate, 3),
+            "minRate": self.min_rate,
+            "maxRate": self.max_rate,
+            "burst": self.burst,
+            "availableTokens": round(self._tokens, 3),
+            "pausedForSeconds": round(max(0.0, self._paused_until - now), 3),
+            "throttleEvents": self.throttle_events,
+            "lastRetryAfter": self.last_retry_after,
+            "totalAcquired": self.total_acquired,
+            "totalWaitSeconds": round(self.total_wait_seconds, 3),
+        }
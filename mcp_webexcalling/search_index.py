@@ -0,0 +1,230 @@
+"""Trigram inverted index for fuzzy people search.
+
+:class:`TrigramIndex` is built from the directory snapshot (see
+:mod:`mcp_webexcalling.directory`) and answers ``search_users`` locally.
+Each person contributes weighted terms — display/first/last name, email
+local parts, extension, phone numbers (as digits) and, more weakly, the
+location name — split into words and padded trigrams (``"bob"`` ->
+``"  b"``, ``" bo"``, ``"bob"``, ``"ob "``). A query is split the same way
+and scored against the postings:
+
+* the base score is the weighted fraction of the query's trigrams a person
+  has, so typos, partial words and word order barely matter
+  (``"jon smyth"`` still finds ``John Smith``);
+* an exact email/extension/number/name match adds 1, a prefix match 0.5,
+  so ``"bob"`` ranks ``Bob Smith`` above ``Robert Bobson``.
+
+Digit-only queries (extensions, phone numbers in any format) are matched as
+substrings of each person's extension and E.164 digits instead: digit
+trigrams are too unselective (there are only a thousand of them) for the
+inverted index to narrow anything down.
+
+A multi-word query can mix fields: ``"bob raleigh"`` scores the name and
+location words of each person together.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .number_geo import e164_digits
+
+# Term weights by field: a match on a name counts fully, on a location only
+# partly (it narrows a search but rarely identifies someone on its own).
+NAME = 1.0
+EMAIL = 0.9
+LOCATION = 0.6
+
+# Fraction of the query (weighted trigrams) a person must match to be a hit.
+DEFAULT_MIN_SCORE = 0.5
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+_PHONE_LIKE = re.compile(r"^[\d\s().+\-]+$")
+
+
+def normalize(text: Any) -> str:
+    """Case-fold, strip accents and reduce punctuation to single spaces."""
+    text = str(text or "")
+    if text.isascii():
+        text = text.lower()
+    else:
+        text = unicodedata.normalize("NFKD", text).casefold()
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def normalize_query(query: str) -> str:
+    """Normalise a search query.
+
+    Phone-looking input becomes its digits and an email address its local
+    part (emails are indexed by local part; the domain is usually shared).
+    """
+    query = str(query or "").strip()
+    if _PHONE_LIKE.match(query) and any(ch.isdigit() for ch in query):
+        return "".join(ch for ch in query if ch.isdigit())
+    return normalize(query.partition("@")[0] if "@" in query else query)
+
+
+def trigrams(text: str) -> Set[str]:
+    """Padded trigrams of every word in (normalised) ``text``."""
+    grams: Set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _person_terms(
+    person: Dict[str, Any], location_name: Optional[str]
+) -> List[Tuple[str, float]]:
+    terms: List[Tuple[str, float]] = []
+    for key in ("displayName", "firstName", "lastName", "nickName"):
+        if person.get(key):
+            terms.append((normalize(person[key]), NAME))
+    for email in person.get("emails") or []:
+        terms.append((normalize(str(email).partition("@")[0]), EMAIL))
+    if location_name:
+        terms.append((normalize(location_name), LOCATION))
+    return [(text, weight) for text, weight in terms if text]
+
+
+def _person_digits(person: Dict[str, Any]) -> Tuple[str, ...]:
+    """The person's extension and phone numbers as digit strings."""
+    values = [str(person.get("extension") or "")]
+    for phone in person.get("phoneNumbers") or []:
+        value = phone.get("value") if isinstance(phone, dict) else phone
+        values.append(e164_digits(value) or "".join(ch for ch in str(value or "") if ch.isdigit()))
+    return tuple(dict.fromkeys(v for v in values if v.isdigit()))
+
+
+def _exact_keys(person: Dict[str, Any]) -> Set[str]:
+    """Names and emails a query can match exactly (for the ranking bonus)."""
+    keys = {normalize(person.get(k)) for k in ("displayName", "firstName", "lastName")}
+    for email in person.get("emails") or []:
+        email = str(email).strip().lower()
+        keys.update((email, normalize(email.partition("@")[0])))
+    keys.discard("")
+    return keys
+
+
+class TrigramIndex:
+    """Inverted index from trigram to the people containing it.
+
+    Args:
+        people: Person objects keyed by id.
+        locations: Location objects keyed by id, for location-name terms.
+    """
+
+    def __init__(
+        self,
+        people: Optional[Dict[str, Dict[str, Any]]] = None,
+        locations: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        # Document number -> person id (None once discarded).
+        self.ids: List[Optional[str]] = []
+        self._doc_of: Dict[str, int] = {}
+        self._exact: List[Set[str]] = []
+        # (digits, document number) for every extension and phone number
+        self._digits: List[Tuple[str, int]] = []
+        # trigram -> {document number: best weight of a field holding it}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        locations = locations or {}
+        for person_id, person in (people or {}).items():
+            location = locations.get(person.get("locationId")) or {}
+            self.add(person_id, person, location.get("name"))
+
+    def add(
+        self, person_id: str, person: Dict[str, Any], location_name: Optional[str] = None
+    ) -> None:
+        """Index ``person`` (replacing any earlier entry for ``person_id``)."""
+        self.discard(person_id)
+        doc = len(self.ids)
+        self.ids.append(person_id)
+        self._doc_of[person_id] = doc
+        self._exact.append(_exact_keys(person))
+        self._digits.extend((digits, doc) for digits in _person_digits(person))
+        weights: Dict[str, float] = {}
+        for text, weight in _person_terms(person, location_name):
+            for gram in trigrams(text):
+                if weights.get(gram, 0.0) < weight:
+                    weights[gram] = weight
+        postings = self.postings
+        for gram, weight in weights.items():
+            docs = postings.get(gram)
+            if docs is None:
+                docs = postings[gram] = {}
+            docs[doc] = weight
+
+    def discard(self, person_id: str) -> None:
+        """Drop ``person_id`` from results (its postings linger until a rebuild)."""
+        doc = self._doc_of.pop(person_id, None)
+        if doc is not None:
+            self.ids[doc] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def search(
+        self, query: str, limit: int = 20, min_score: float = DEFAULT_MIN_SCORE
+    ) -> List[Tuple[str, float]]:
+        """Return ``(person id, score)`` pairs, best first (``limit`` <= 0: all)."""
+        text = normalize_query(query)
+        if text.isdigit():
+            hits = self._search_digits(text, e164_digits(query))
+        else:
+            hits = self._search_text(text, str(query).strip().lower(), min_score)
+        hits.sort(key=lambda hit: -hit[1])
+        return hits[:limit] if limit > 0 else hits
+
+    def _search_digits(self, digits: str, e164: Optional[str]) -> List[Tuple[str, float]]:
+        best: Dict[int, float] = {}
+        for value, doc in self._digits:
+            if digits in value and self.ids[doc] is not None:
+                # Exact (extension or full number) first, then by how much
+                # of the number the query covers.
+                score = 2.0 if value in (digits, e164) else len(digits) / len(value)
+                if score > best.get(doc, 0.0):
+                    best[doc] = score
+        return [(self.ids[doc], round(score, 3)) for doc, score in best.items()]
+
+    def _search_text(self, text: str, raw: str, min_score: float) -> List[Tuple[str, float]]:
+        grams = trigrams(text)
+        if not grams:
+            return []
+        # Prefix filter: weights are at most 1, so a hit must appear in at
+        # least one of the ``len(grams) - needed + 1`` rarest trigrams.
+        # Candidates come from those short posting lists only; the common
+        # trigrams are then probed per candidate, dropping any that can no
+        # longer reach ``needed``.
+        needed = min_score * len(grams)
+        lists = sorted((self.postings.get(gram, {}) for gram in grams), key=len)
+        seed = int(len(lists) - needed) + 1
+        scores: Dict[int, float] = {}
+        for docs in lists[:seed]:
+            for doc, weight in docs.items():
+                scores[doc] = scores.get(doc, 0.0) + weight
+        remaining = len(lists) - seed
+        for docs in lists[seed:]:
+            remaining -= 1
+            for doc, total in list(scores.items()):
+                total += docs.get(doc, 0.0)
+                if total + remaining < needed:
+                    del scores[doc]
+                else:
+                    scores[doc] = total
+        hits: List[Tuple[str, float]] = []
+        for doc, total in scores.items():
+            if total < needed or self.ids[doc] is None:
+                continue
+            score = total / len(grams)
+            exact = self._exact[doc]
+            if text in exact or raw in exact:
+                score += 1.0
+            elif any(key.startswith(text) for key in exact):
+                score += 0.5
+            hits.append((self.ids[doc], round(score, 3)))
+        return hits
+
+    def stats(self) -> Dict[str, int]:
+        return {"documents": len(self), "trigrams": len(self.postings)}
+
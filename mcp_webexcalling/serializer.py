@@ -0,0 +1,58 @@
+"""JSON serialization for tool responses.
+
+Tool results are sent compact by default: pretty-printing a
+``list_users(max_results=0)`` or CDR dump roughly doubles its size and the
+time spent encoding it, and the consumer is a model, not a human. Set
+``WEBEX_JSON_INDENT`` (or a per-tool entry in ``WEBEX_JSON_INDENT_OVERRIDES``)
+to get indented output back.
+
+When `orjson <https://github.com/ijl/orjson>`_ is installed
+(``pip install mcp-webexcalling[fast]``) it is used for compact and 2-space
+output; otherwise, or for values orjson rejects (e.g. integers wider than
+64 bits), the stdlib encoder is used. Both backends render non-JSON values
+(datetimes, dataclasses, sets, ...) with ``str()`` so the output does not
+depend on which one ran.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _orjson_options(indent: int) -> int:
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if indent:
+        options |= orjson.OPT_INDENT_2
+    return options
+
+
+def dumps(data: Any, indent: int = 0) -> str:
+    """Serialize ``data`` to JSON; compact unless ``indent`` is positive."""
+    if orjson is not None and indent in (0, 2):
+        try:
+            return orjson.dumps(data, default=str, option=_orjson_options(indent)).decode()
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(data, indent=indent, default=str, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), default=str, ensure_ascii=False)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes (with orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def backend() -> str:
+    """Name of the preferred encoder (``"orjson"`` or ``"json"``)."""
+    return "orjson" if orjson is not None else "json"
@@ -0,0 +1,97 @@
+"""Small on-disk state that should survive server restarts.
+
+Claude Desktop and other MCP launchers restart the server often, so anything
+the client learns about the API (e.g. which ``/cdr_feed`` parameter shape an
+org accepts) is kept under a per-user state directory:
+
+* ``WEBEX_STATE_DIR`` when set (an empty value disables persistence);
+* otherwise ``$XDG_CACHE_HOME/mcp-webexcalling`` or
+  ``~/.cache/mcp-webexcalling``.
+
+Persistence is best effort: read or write failures are logged and the caller
+carries on with in-memory state.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import get_settings
+
+
+logger = logging.getLogger("mcp_webexcalling")
+
+
+def state_dir() -> Optional[Path]:
+    """Return the directory for persisted state, or None if disabled."""
+    configured = get_settings(require_token=False).webex_state_dir
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "mcp-webexcalling"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file + rename (no torn files)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class JsonStateFile:
+    """A tiny persistent key/value map stored as one JSON file.
+
+    The file is read lazily on first access and rewritten atomically on every
+    change. With persistence disabled (``path`` is None) it behaves as a
+    plain in-memory dict.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._data: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def in_state_dir(cls, filename: str) -> "JsonStateFile":
+        directory = state_dir()
+        return cls(directory / filename if directory is not None else None)
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = {}
+            if self.path is not None and self.path.exists():
+                try:
+                    loaded = json.loads(self.path.read_text(encoding="utf-8"))
+                    if isinstance(loaded, dict):
+                        self._data = loaded
+                except (OSError, ValueError) as e:
+                    logger.warning("Ignoring unreadable state file %s: %s", self.path, e)
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        data = self._load()
+        if data.get(key) == value:
+            return
+        data[key] = value
+        if self.path is None:
+            return
+        try:
+            atomic_write_bytes(
+                self.path, json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+            )
+        except OSError as e:
+            logger.warning("Could not persist state to %s: %s", self.path, e)
@@ -0,0 +1,160 @@
+"""Registry of MCP tools: name -> handler, input schema and metadata.
+
+Each tool is declared once, next to its handler, with the :meth:`ToolRegistry.tool`
+decorator::
+
+    @registry.tool(
+        name="get_user_details",
+        description="Get details of a specific user",
+        input_schema={...},
+    )
+    async def get_user_details(client, arguments):
+        return await client.get_user_details(arguments["person_id"])
+
+The registry then serves both MCP entry points: :meth:`ToolRegistry.list_tools`
+returns the ``list_tools`` catalog in declaration order, built once on first
+use and reused for every later ``tools/list`` request, and
+:meth:`ToolRegistry.get` gives ``call_tool`` a constant-time lookup instead
+of a chain of string comparisons. Every call goes through
+:meth:`ToolSpec.invoke`, the single place for per-tool concerns: timing and
+error counters (see :meth:`ToolRegistry.stats`) and an optional concurrency
+limit.
+
+Handlers take ``(client, arguments)``. A ``str`` return value is sent as-is;
+anything else is serialised as JSON by the server.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from mcp.types import Tool
+
+
+ToolHandler = Callable[[Any, Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class ToolSpec:
+    """One registered tool.
+
+    Attributes:
+        name: Tool name exposed over MCP.
+        description: Human/LLM-facing description.
+        input_schema: JSON Schema for the tool's arguments.
+        handler: ``async (client, arguments) -> result``.
+        max_concurrency: Optional cap on simultaneous invocations.
+        json_indent: Optional JSON indent for this tool's responses,
+            overriding ``WEBEX_JSON_INDENT``.
+    """
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: ToolHandler
+    max_concurrency: Optional[int] = None
+    json_indent: Optional[int] = None
+
+    calls: int = field(default=0, init=False)
+    errors: int = field(default=0, init=False)
+    total_seconds: float = field(default=0.0, init=False)
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, init=False, repr=False)
+
+    def to_tool(self) -> Tool:
+        return Tool(name=self.name, description=self.description, inputSchema=self.input_schema)
+
+    async def invoke(self, client: Any, arguments: Dict[str, Any]) -> Any:
+        """Run the handler, applying the concurrency limit and recording timing."""
+        if self.max_concurrency and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+        try:
+            if self._semaphore is not None:
+                async with self._semaphore:
+                    return await self.handler(client, arguments)
+            return await self.handler(client, arguments)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.calls += 1
+            self.total_seconds += time.perf_counter() - started
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "totalSeconds": round(self.total_seconds, 3),
+            "averageSeconds": round(self.total_seconds / self.calls, 3) if self.calls else 0.0,
+        }
+
+
+class ToolRegistry:
+    """Ordered mapping of tool name to :class:`ToolSpec`."""
+
+    def __init__(self):
+        self._specs: Dict[str, ToolSpec] = {}
+        self._catalog: Optional[Tuple[Tool, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._specs.values())
+
+    def register(self, spec: ToolSpec) -> ToolSpec:
+        if spec.name in self._specs:
+            raise ValueError(f"Tool already registered: {spec.name}")
+        self._specs[spec.name] = spec
+        self._catalog = None
+        return spec
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        *,
+        max_concurrency: Optional[int] = None,
+        json_indent: Optional[int] = None,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        """Decorator registering ``handler`` under ``name``."""
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.register(ToolSpec(
+                name=name,
+                description=description,
+                input_schema=input_schema,
+                handler=handler,
+                max_concurrency=max_concurrency,
+                json_indent=json_indent,
+            ))
+            return handler
+
+        return decorator
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        return self._specs.get(name)
+
+    def catalog(self) -> Tuple[Tool, ...]:
+        """Return the cached, immutable tool catalog, building it on first use.
+
+        Building ~90 ``Tool`` models (and validating their nested schemas) is
+        by far the most expensive part of answering ``tools/list``; the
+        catalog only changes when a tool is registered, so it is built once.
+        """
+        if self._catalog is None:
+            self._catalog = tuple(spec.to_tool() for spec in self._specs.values())
+        return self._catalog
+
+    def list_tools(self) -> List[Tool]:
+        """Return the MCP tool catalog in registration order."""
+        return list(self.catalog())
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool call/error/timing counters for tools that have run."""
+        return {spec.name: spec.stats() for spec in self._specs.values() if spec.calls}
@@ -1,14 +1,34 @@
 """Webex API Client for interacting with Webex Calling APIs"""
 
 import asyncio
+import base64
+import binascii
+import contextlib
+import copy
 import logging
 import random
+import re
+import time
 import urllib.parse
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, AsyncIterator, Hashable, Sequence, Tuple, Union
 
 import httpx
 
+from .cache import ResponseCache
+from .cdr_aggregate import aggregate, parse_dimensions
+from .cdr_batch import CdrBatch
+from .cdr_store import PERSON_FIELDS, CdrStore, cdr_record_key, first_field, parse_cdr_time
+from .cdr_sync import CdrSyncEngine
 from .config import get_settings
+from .cursors import CursorStore
+from .directory import DirectoryIndex, normalize_mac
+from .number_geo import country_name, e164_digits
+from .projection import parse_fields, project, top_level_fields
+from .rate_limit import AdaptiveRateLimiter
+from .state import JsonStateFile, state_dir
+from .webhooks import WebhookReceiver
 
 
 logger = logging.getLogger("mcp_webexcalling")
@@ -21,6 +41,123 @@ _RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 # satisfied by following pagination ``Link`` headers.
 _WEBEX_PAGE_LIMIT = 100
 
+# Page size cap for the analytics ``/cdr_feed`` endpoint.
+_CDR_PAGE_LIMIT = 500
+
+# Raw CDRs kept per query shape for the detail listings next to aggregates.
+_CDR_SAMPLE_SIZE = 100
+
+# Person fields the /people API only returns with ``callingData=true``.
+_CALLING_DATA_FIELDS = frozenset({"extension", "locationId", "phoneNumbers", "sipAddresses"})
+
+
+def _format_cdr_time(dt: datetime) -> str:
+    """Format a datetime as the CDR feed requires: YYYY-MM-DDTHH:MM:SS.mmmZ."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def _extract_cdr_records(response: Any) -> List[Dict[str, Any]]:
+    """Pull the record list out of a ``/cdr_feed`` response body."""
+    # The API returns a list of call records directly
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        # Try common response structures
+        for key in ("items", "data", "calls", "cdr"):
+            if key in response:
+                return list(response.get(key) or [])
+        # Return the response as a single-item list if unexpected structure
+        return [response] if response else []
+    return []
+
+
+def _needs_calling_data(fields: Optional[Tuple[str, ...]]) -> bool:
+    """Whether a projected /people read must ask for ``callingData=true``."""
+    return fields is None or bool(top_level_fields(fields) & _CALLING_DATA_FIELDS)
+
+
+def _number_owner(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe the owner of a ``/telephony/config/numbers`` record."""
+    owner = record.get("owner") or {}
+    location = record.get("location") or {}
+    return {
+        "ownerType": owner.get("type"),
+        "ownerId": owner.get("id"),
+        "locationId": location.get("id") if isinstance(location, dict) else None,
+        "owner": owner,
+    }
+
+
+# search_users strategies, in the order their results are listed.
+_SEARCH_STRATEGIES = ("id", "email", "extension", "phoneNumber", "displayName")
+
+_PHONE_LIKE = re.compile(r"^[\d\s().+\-]+$")
+_UUID = re.compile(r"^[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}$")
+_WEBEX_ID_PREFIX = "ciscospark://"
+
+
+def _webex_person_id(query: str) -> Optional[str]:
+    """The Webex person ID ``query`` refers to, if it looks like one.
+
+    Accepts an encoded Webex ID as-is and turns the bare UUID other systems
+    usually store (e.g. from SCIM or a CRM) into the encoded form.
+    """
+    if _UUID.match(query):
+        raw = f"{_WEBEX_ID_PREFIX}us/PEOPLE/{query.lower()}".encode()
+        return base64.b64encode(raw).decode().rstrip("=")
+    if len(query) < 24 or not query.isalnum():
+        return None
+    try:
+        decoded = base64.b64decode(query + "=" * (-len(query) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    return query if decoded.startswith(_WEBEX_ID_PREFIX.encode()) else None
+
+
+def _search_strategies(query: str) -> List[str]:
+    """Pick the ``search_users`` lookups that make sense for ``query``."""
+    if _webex_person_id(query):
+        return ["id"]
+    if _PHONE_LIKE.match(query):
+        digits = "".join(ch for ch in query if ch.isdigit())
+        strategies = []
+        if 2 <= len(digits) <= 10 and "+" not in query:
+            strategies.append("extension")
+        if len(digits) >= 7:
+            strategies.append("phoneNumber")
+        if strategies:
+            return strategies
+    if "@" in query:
+        return ["email"]
+    return ["displayName"]
+
+
+def _cdr_matches_person(record: Dict[str, Any], person_id: str) -> bool:
+    """Whether a CDR involves ``person_id`` (the feed can't filter by person)."""
+    # Check various fields where person_id might appear
+    from_person = record.get("from", {}).get("personId") if isinstance(record.get("from"), dict) else None
+    to_person = record.get("to", {}).get("personId") if isinstance(record.get("to"), dict) else None
+    record_person_id = first_field(record, PERSON_FIELDS)
+    return person_id in [from_person, to_person, record_person_id]
+
+
+def _merge_cdr_records(shards: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge per-window CDR lists, dropping duplicates at window boundaries."""
+    seen = set()
+    merged: List[Dict[str, Any]] = []
+    for shard in shards:
+        for record in shard:
+            key = cdr_record_key(record)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(record)
+    merged.sort(key=lambda r: str(r.get("Start time") or r.get("startTime") or ""))
+    return merged
+
 
 class WebexApiError(Exception):
     """Raised when the Webex API returns an error response.
@@ -34,6 +171,38 @@ class WebexApiError(Exception):
         self.status_code = status_code
 
 
+class WebexPaginationError(WebexApiError):
+    """Raised when a paginated crawl fails after its retries are exhausted.
+
+    ``resume_url`` is the absolute URL of the page that failed (the last good
+    ``next`` link), which can be passed back to :meth:`WebexClient.iter_items`
+    or :meth:`WebexClient._get_items` to continue where the crawl stopped.
+    ``partial_items`` holds whatever :meth:`WebexClient._get_items` had
+    collected before the failure.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        *,
+        resume_url: Optional[str] = None,
+    ):
+        super().__init__(message, status_code=status_code)
+        self.resume_url = resume_url
+        self.partial_items: List[Dict[str, Any]] = []
+
+
+class _Flight:
+    """An in-flight GET shared by every caller that asked for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
 class WebexClient:
     """Client for interacting with Webex APIs.
 
@@ -50,6 +219,8 @@ class WebexClient:
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
         retry_backoff: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+        cache_enabled: Optional[bool] = None,
     ):
         # Only consult settings for values the caller did not supply. This lets
         # ``WebexClient(access_token="...")`` work without a .env file.
@@ -73,6 +244,41 @@ class WebexClient:
             retry_backoff if retry_backoff is not None else settings.webex_retry_backoff
         )
         self._max_connections = settings.webex_max_connections
+        self.cdr_shard_minutes = settings.webex_cdr_shard_minutes
+        self.cdr_max_concurrency = settings.webex_cdr_max_concurrency
+        # Which /cdr_feed parameter shape each (host, org) accepts, learned on
+        # first success and persisted so restarts go straight to it.
+        self._cdr_variations = JsonStateFile.in_state_dir("cdr_variations.json")
+        self._org_id: Optional[str] = None
+
+        # Optional local CDR store kept current by an incremental sync engine;
+        # analytics methods answer from it instead of re-downloading the feed.
+        self.cdr_store: Optional[CdrStore] = None
+        self.cdr_sync: Optional[CdrSyncEngine] = None
+        if settings.webex_cdr_store_enabled:
+            store_path = settings.webex_cdr_store_path
+            if not store_path:
+                directory = state_dir()
+                store_path = str(directory / "cdr.sqlite3") if directory else ":memory:"
+            if store_path != ":memory:":
+                Path(store_path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+                store_path = str(Path(store_path).expanduser())
+            self.cdr_store = CdrStore(store_path)
+            self.cdr_sync = CdrSyncEngine(
+                self,
+                self.cdr_store,
+                interval=settings.webex_cdr_sync_interval,
+                retention_days=settings.webex_cdr_retention_days,
+            )
+
+        # One adaptive limiter per API host, shared by all concurrent calls.
+        self.rate_limit = rate_limit if rate_limit is not None else settings.webex_rate_limit
+        self._rate_limit_min = settings.webex_rate_limit_min
+        self._rate_limit_max = settings.webex_rate_limit_max
+        self._rate_limit_burst = settings.webex_rate_limit_burst
+        self._rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+        for root in (self.base_url, self.analytics_base_url):
+            self._limiter_for(root)
 
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
@@ -81,6 +287,61 @@ class WebexClient:
 
         self._client: Optional[httpx.AsyncClient] = None
 
+        # Identical concurrent GETs share one round trip (single-flight).
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], _Flight] = {}
+        self.coalesced_requests = 0
+        # Per-strategy counters for search_users (see get_client_stats).
+        self.search_stats: Dict[str, Dict[str, Any]] = {}
+
+        # Opt-in TTL + LRU cache for read-only endpoints.
+        if cache_enabled is None:
+            cache_enabled = settings.webex_cache_enabled
+        self.cache: Optional[ResponseCache] = (
+            ResponseCache(
+                max_entries=settings.webex_cache_max_entries,
+                default_ttl=settings.webex_cache_default_ttl,
+                ttls=settings.webex_cache_ttls,
+            )
+            if cache_enabled
+            else None
+        )
+
+        # Iterators behind the continuation cursors of budgeted list pages.
+        self.cursors = CursorStore(
+            ttl=settings.webex_cursor_ttl, max_cursors=settings.webex_max_cursors
+        )
+
+        # Optional in-memory directory snapshot answering email, extension,
+        # number and MAC lookups without an API round trip.
+        self.directory: Optional[DirectoryIndex] = None
+        if settings.webex_directory_enabled:
+            directory_path: Optional[Path] = None
+            if settings.webex_directory_path:
+                directory_path = Path(settings.webex_directory_path).expanduser()
+            elif state_dir() is not None:
+                directory_path = state_dir() / "directory.snapshot"
+            self.directory = DirectoryIndex(
+                max_age=settings.webex_directory_max_age, path=directory_path
+            )
+
+        # Optional local listener for webhook events that invalidate the
+        # cache and patch the directory (started by the server's main()).
+        self.webhooks: Optional[WebhookReceiver] = None
+        if settings.webex_webhook_enabled:
+            if settings.webex_webhook_secret:
+                self.webhooks = WebhookReceiver(
+                    self,
+                    settings.webex_webhook_secret,
+                    host=settings.webex_webhook_host,
+                    port=settings.webex_webhook_port,
+                    path=settings.webex_webhook_path,
+                )
+            else:
+                logger.warning(
+                    "WEBEX_WEBHOOK_ENABLED is set but WEBEX_WEBHOOK_SECRET is empty; "
+                    "the webhook receiver is disabled"
+                )
+
     # ------------------------------------------------------------------ #
     # Connection lifecycle
     # ------------------------------------------------------------------ #
@@ -100,6 +361,12 @@ class WebexClient:
 
     async def aclose(self) -> None:
         """Close the underlying HTTP connection pool."""
+        if self.cdr_sync is not None:
+            await self.cdr_sync.stop()
+        if self.directory is not None:
+            await self.directory.stop()
+        if self.webhooks is not None:
+            await self.webhooks.stop()
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
         self._client = None
@@ -110,6 +377,72 @@ class WebexClient:
     async def __aexit__(self, *exc_info) -> None:
         await self.aclose()
 
+    # ------------------------------------------------------------------ #
+    # Rate limiting
+    # ------------------------------------------------------------------ #
+    def _limiter_for(self, url: str) -> Optional[AdaptiveRateLimiter]:
+        """Return the shared rate limiter for ``url``'s host (None if disabled)."""
+        if not self.rate_limit or self.rate_limit <= 0:
+            return None
+        host = httpx.URL(url).host
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                self.rate_limit,
+                min_rate=self._rate_limit_min,
+                max_rate=self._rate_limit_max,
+                burst=self._rate_limit_burst,
+            )
+            self._rate_limiters[host] = limiter
+        return limiter
+
+    def get_rate_limit_state(self) -> Dict[str, Any]:
+        """Report the adaptive rate limiter state for each API host."""
+        return {
+            "enabled": bool(self.rate_limit and self.rate_limit > 0),
+            "hosts": {
+                host: limiter.snapshot()
+                for host, limiter in self._rate_limiters.items()
+            },
+        }
+
+    def get_client_stats(self) -> Dict[str, Any]:
+        """Collect client-side diagnostics (rate limiting, etc.)."""
+        return {
+            "rateLimits": self.get_rate_limit_state(),
+            "coalescing": {
+                "coalescedRequests": self.coalesced_requests,
+                "inFlight": len(self._inflight),
+            },
+            "cache": (
+                {"enabled": True, **self.cache.stats()}
+                if self.cache is not None
+                else {"enabled": False}
+            ),
+            "cdrSync": (
+                {"enabled": True, **self.cdr_sync.status()}
+                if self.cdr_sync is not None
+                else {"enabled": False}
+            ),
+            "cursors": self.cursors.stats(),
+            "search": self.search_stats,
+            "directory": (
+                {"enabled": True, **self.directory.status()}
+                if self.directory is not None
+                else {"enabled": False}
+            ),
+            "webhooks": (
+                {"enabled": True, **self.webhooks.stats()}
+                if self.webhooks is not None
+                else {"enabled": False}
+            ),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop every cached response (no-op when caching is disabled)."""
+        if self.cache is not None:
+            self.cache.clear()
+
     # ------------------------------------------------------------------ #
     # Core request helper
     # ------------------------------------------------------------------ #
@@ -124,54 +457,63 @@ class WebexClient:
         except (TypeError, ValueError):
             return None
 
-    async def _request(
+    async def _send(
         self,
         method: str,
+        url: str,
+        *,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-        *,
-        base_url: Optional[str] = None,
-    ) -> Any:
-        """Make an HTTP request to the Webex API with retries and backoff.
-
-        Retries transient failures (429/5xx and network errors) up to
-        ``self.max_retries`` times using exponential backoff with jitter,
-        honouring a ``Retry-After`` header when the server sends one.
-
-        ``base_url`` overrides the default host for a single call (used for the
-        analytics/CDR endpoints) without mutating shared client state, which
-        keeps concurrent requests safe.
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send one HTTP request with retries and backoff; return the response.
+
+        This is the shared retrying transport used by :meth:`_request` and by
+        every pagination hop in :meth:`iter_items`. Transient failures
+        (429/5xx and network errors) are retried up to ``self.max_retries``
+        times using exponential backoff with jitter, honouring a
+        ``Retry-After`` header when the server sends one. ``endpoint`` is only
+        used for log and error messages.
+
+        Each attempt first waits on the host's shared
+        :class:`~mcp_webexcalling.rate_limit.AdaptiveRateLimiter`, and every
+        response feeds back into it: successes raise the allowed rate, while a
+        429 or ``Retry-After`` header lowers it for all callers at once.
+
+        A ``304 Not Modified`` (only possible when the caller sent conditional
+        ``headers``) is returned as-is rather than treated as an error.
         """
-        root = (base_url or self.base_url).rstrip("/")
-        url = f"{root}{endpoint}"
         client = self._get_http_client()
+        limiter = self._limiter_for(url)
 
         attempt = 0
         last_exc: Optional[Exception] = None
 
         while attempt <= self.max_retries:
             try:
+                if limiter is not None:
+                    await limiter.acquire()
                 response = await client.request(
                     method=method,
                     url=url,
                     params=params,
                     json=json_data,
+                    headers=headers,
                 )
-                response.raise_for_status()
-
-                if response.status_code == 204 or not response.content:
-                    return {}
-                try:
-                    return response.json()
-                except ValueError:
-                    # Non-JSON success body (rare) — return raw text.
-                    return {"raw": response.text}
+                if response.status_code != 304:
+                    response.raise_for_status()
+                if limiter is not None:
+                    limiter.on_success()
+                return response
 
             except httpx.HTTPStatusError as e:
                 status = e.response.status_code
+                retry_after = self._retry_after_seconds(e.response)
+                if limiter is not None and (status == 429 or retry_after is not None):
+                    limiter.on_throttle(retry_after)
                 if status in _RETRYABLE_STATUS and attempt < self.max_retries:
-                    delay = self._retry_after_seconds(e.response)
+                    delay = retry_after
                     if delay is None:
                         delay = self.retry_backoff * (2 ** attempt) + random.uniform(
                             0, self.retry_backoff
@@ -213,6 +555,155 @@ class WebexClient:
             f"Request failed for {method} {endpoint}: {last_exc}"
         )
 
+    @staticmethod
+    def _decode_body(response: httpx.Response) -> Any:
+        """Decode a successful response body (``{}`` when empty)."""
+        if response.status_code == 204 or not response.content:
+            return {}
+        try:
+            return response.json()
+        except ValueError:
+            # Non-JSON success body (rare) — return raw text.
+            return {"raw": response.text}
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        *,
+        base_url: Optional[str] = None,
+    ) -> Any:
+        """Make an HTTP request to the Webex API with retries and backoff.
+
+        See :meth:`_send` for the retry policy.
+
+        ``base_url`` overrides the default host for a single call (used for the
+        analytics/CDR endpoints) without mutating shared client state, which
+        keeps concurrent requests safe.
+
+        GETs go through :meth:`_get_json`, which serves them from the response
+        cache when enabled and coalesces identical concurrent requests. Any
+        other method invalidates cached reads of the resource it touches.
+        """
+        root = (base_url or self.base_url).rstrip("/")
+        url = f"{root}{endpoint}"
+        if method.upper() == "GET" and json_data is None:
+            body, _ = await self._get_json(url, endpoint, params)
+            return body
+        try:
+            response = await self._send(
+                method, url, endpoint=endpoint, params=params, json_data=json_data
+            )
+        finally:
+            # Invalidate even on failure: the write may have partially applied.
+            if self.cache is not None:
+                self.cache.invalidate_path(endpoint)
+        return self._decode_body(response)
+
+    @staticmethod
+    def _request_key(
+        url: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """Build a hashable identity for a GET (URL + normalised params)."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return url, items
+
+    async def _fetch_json(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        cache_key: Optional[Hashable] = None,
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch one GET, revalidating a stale cache entry when possible.
+
+        When ``cache_key`` names a stale entry with an ``ETag`` or
+        ``Last-Modified`` validator, the request is made conditional; a
+        ``304 Not Modified`` then refreshes and returns the cached result
+        without transferring or decoding the body again.
+        """
+        cache = self.cache if cache_key is not None else None
+        conditional = cache.conditional_headers(cache_key) if cache is not None else {}
+        response = await self._send(
+            "GET", url, endpoint=endpoint, params=params, headers=conditional or None
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 304:
+            cached = None
+            if cache is not None:
+                cached = cache.revalidate(
+                    cache_key, etag=etag, last_modified=last_modified
+                )
+            if cached is not None:
+                return cached
+            # The entry vanished while we were revalidating; fetch it fresh.
+            response = await self._send("GET", url, endpoint=endpoint, params=params)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        next_link = response.links.get("next")
+        result = (self._decode_body(response), next_link.get("url") if next_link else None)
+        if cache is not None:
+            cache.set(
+                cache_key, endpoint, result, etag=etag, last_modified=last_modified
+            )
+        return result
+
+    async def _get_json(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        use_cache: bool = True,
+    ) -> Tuple[Any, Optional[str]]:
+        """GET ``url`` and return ``(decoded body, next page URL or None)``.
+
+        Fresh responses are served from the response cache (when enabled and
+        the endpoint family has a non-zero TTL). Otherwise the request joins an
+        identical one already in flight, if any, so concurrent callers share a
+        single round trip and JSON decode.
+        """
+        key = self._request_key(url, params)
+        cacheable = (
+            use_cache and self.cache is not None and self.cache.ttl_for(endpoint) > 0
+        )
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            # The fetch runs as its own task so one caller being cancelled
+            # doesn't fail everyone else waiting on the same response.
+            task = asyncio.ensure_future(
+                self._fetch_json(url, endpoint, params, key if cacheable else None)
+            )
+            flight = _Flight(task)
+            self._inflight[key] = flight
+
+            def _done(t: "asyncio.Future[Any]", key=key, flight=flight) -> None:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                if not t.cancelled():
+                    t.exception()  # mark retrieved even if every waiter left
+
+            task.add_done_callback(_done)
+        else:
+            self.coalesced_requests += 1
+
+        flight.waiters += 1
+        result = await asyncio.shield(flight.task)
+        # Callers routinely mutate what they get back (read-modify-write
+        # updates), so a shared or cached body is handed out as a copy.
+        if flight.waiters > 1 or cacheable:
+            return copy.deepcopy(result)
+        return result
+
     @staticmethod
     def _build_status_error(
         e: httpx.HTTPStatusError,
@@ -262,6 +753,83 @@ class WebexClient:
     # ------------------------------------------------------------------ #
     # Pagination helper
     # ------------------------------------------------------------------ #
+    async def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        max_results: int = 0,
+        base_url: Optional[str] = None,
+        items_key: str = "items",
+        resume_url: Optional[str] = None,
+        fields: Union[str, Sequence[str], None] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a collection endpoint item by item, following pagination.
+
+        Unlike :meth:`_get_items` this never holds more than one page in
+        memory: each page is yielded as soon as it arrives and the next
+        ``Link: rel="next"`` hop is only requested once the consumer asks for
+        more. Breaking out of the ``async for`` stops the crawl without
+        fetching the remaining pages. ``max_results=0`` (the default) streams
+        everything available.
+
+        Every page goes through the retrying transport (:meth:`_send`), so a
+        transient 429/5xx on page 37 is retried in place instead of failing
+        the crawl. If a page still fails once retries are exhausted, a
+        :class:`WebexPaginationError` is raised whose ``resume_url`` is the
+        last good ``next`` link; pass it back as ``resume_url`` to continue
+        the crawl from that page instead of starting over.
+
+        ``fields`` projects each item (see :mod:`.projection`) as its page is
+        decoded, so unused fields are dropped before anything is yielded.
+        """
+        fields = parse_fields(fields)
+        params = dict(params or {})
+        unlimited = max_results in (0, None)
+        page_size = _WEBEX_PAGE_LIMIT if unlimited else min(max_results, _WEBEX_PAGE_LIMIT)
+        params["max"] = page_size
+
+        yielded = 0
+        next_url: Optional[str]
+        next_params: Optional[Dict[str, Any]]
+        if resume_url:
+            # A saved Link URL already encodes the page size and filters.
+            next_url, next_params = resume_url, None
+        else:
+            root = (base_url or self.base_url).rstrip("/")
+            next_url, next_params = f"{root}{endpoint}", params
+
+        while next_url:
+            try:
+                # Bounded reads may be served from the response cache; full
+                # crawls bypass it so they don't flood it with every page.
+                body, next_page = await self._get_json(
+                    next_url, endpoint, next_params, use_cache=not unlimited
+                )
+            except WebexApiError as e:
+                failed_page = httpx.URL(next_url)
+                if next_params:
+                    failed_page = failed_page.copy_merge_params(next_params)
+                raise WebexPaginationError(
+                    str(e), status_code=e.status_code, resume_url=str(failed_page)
+                ) from e
+
+            page_items = body.get(items_key, []) if isinstance(body, dict) else []
+            # Drop our reference to the decoded body so only the page's items
+            # stay alive while the consumer works through them.
+            del body
+            if fields is not None:
+                page_items = [project(item, fields) for item in page_items]
+
+            for item in page_items:
+                yield item
+                yielded += 1
+                if not unlimited and yielded >= max_results:
+                    return
+
+            next_url = next_page
+            next_params = None  # absolute Link URLs carry their own query
+
     async def _get_items(
         self,
         endpoint: str,
@@ -270,50 +838,139 @@ class WebexClient:
         max_results: int = 100,
         base_url: Optional[str] = None,
         items_key: str = "items",
+        resume_url: Optional[str] = None,
+        fields: Union[str, Sequence[str], None] = None,
     ) -> List[Dict[str, Any]]:
         """GET a collection endpoint, transparently following pagination.
 
         Webex caps each page at ~100 items and returns a ``Link`` header with a
         ``rel="next"`` URL. This walks those links until ``max_results`` items
         are collected (or the data is exhausted). Pass ``max_results=0`` to
-        fetch every available item.
+        fetch every available item. Use :meth:`iter_items` to stream instead
+        of collecting everything into a list.
+
+        If the crawl fails part-way, the raised :class:`WebexPaginationError`
+        carries the items fetched so far in ``partial_items`` and the page to
+        continue from in ``resume_url``.
         """
-        params = dict(params or {})
-        unlimited = max_results in (0, None)
-        page_size = _WEBEX_PAGE_LIMIT if unlimited else min(max_results, _WEBEX_PAGE_LIMIT)
-        params["max"] = page_size
+        collected: List[Dict[str, Any]] = []
+        try:
+            async for item in self.iter_items(
+                endpoint,
+                params,
+                max_results=max_results,
+                base_url=base_url,
+                items_key=items_key,
+                resume_url=resume_url,
+                fields=fields,
+            ):
+                collected.append(item)
+        except WebexPaginationError as e:
+            e.partial_items = collected
+            raise
+        return collected
 
-        root = (base_url or self.base_url).rstrip("/")
-        url = f"{root}{endpoint}"
-        client = self._get_http_client()
+    # ------------------------------------------------------------------ #
+    # Streaming collection helpers
+    # ------------------------------------------------------------------ #
+    def iter_locations(
+        self, org_id: Optional[str] = None, max_results: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream locations page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if org_id:
+            params["orgId"] = org_id
+        return self.iter_items("/locations", params, max_results=max_results)
 
-        collected: List[Dict[str, Any]] = []
-        next_url: Optional[str] = url
-        next_params: Optional[Dict[str, Any]] = params
+    def iter_users(
+        self,
+        org_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        max_results: int = 0,
+        fields: Union[str, Sequence[str], None] = None,
+        resume_url: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream people page by page (see :meth:`iter_items`)."""
+        fields = parse_fields(fields)
+        params: Dict[str, Any] = {}
+        if org_id:
+            params["orgId"] = org_id
+        if location_id:
+            params["locationId"] = location_id
+        if fields is not None and _needs_calling_data(fields):
+            params["callingData"] = "true"
+        return self.iter_items(
+            "/people", params, max_results=max_results, fields=fields, resume_url=resume_url
+        )
 
-        while next_url:
-            # First hop uses _request (retries); subsequent hops use the
-            # absolute Link URL, which already encodes its params.
-            response = await client.request(
-                "GET", next_url, params=next_params, headers=self.headers
-            )
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                raise self._build_status_error(e, "GET", endpoint, next_url, next_params)
+    def iter_devices(
+        self,
+        person_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        max_results: int = 0,
+        fields: Union[str, Sequence[str], None] = None,
+        resume_url: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream devices page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if person_id:
+            params["personId"] = person_id
+        if location_id:
+            params["locationId"] = location_id
+        return self.iter_items(
+            "/devices", params, max_results=max_results, fields=fields, resume_url=resume_url
+        )
 
-            body = response.json() if response.content else {}
-            page_items = body.get(items_key, []) if isinstance(body, dict) else []
-            collected.extend(page_items)
+    def iter_phone_numbers(
+        self,
+        location_id: Optional[str] = None,
+        org_id: Optional[str] = None,
+        number: Optional[str] = None,
+        max_results: int = 0,
+        resume_url: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream phone numbers page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if location_id:
+            params["locationId"] = location_id
+        if org_id:
+            params["orgId"] = org_id
+        if number:
+            params["number"] = number
+        return self.iter_items(
+            "/telephony/config/numbers", params, max_results=max_results, resume_url=resume_url
+        )
 
-            if not unlimited and len(collected) >= max_results:
-                return collected[:max_results]
+    def iter_call_queues(
+        self, location_id: Optional[str] = None, max_results: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream call queues page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if location_id:
+            params["locationId"] = location_id
+        return self.iter_items(
+            "/telephony/config/queues", params, max_results=max_results
+        )
 
-            next_link = response.links.get("next")
-            next_url = next_link.get("url") if next_link else None
-            next_params = None  # absolute Link URLs carry their own query
+    def iter_hunt_groups(
+        self, location_id: Optional[str] = None, max_results: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream hunt groups page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if location_id:
+            params["locationId"] = location_id
+        return self.iter_items(
+            "/telephony/config/huntGroups", params, max_results=max_results
+        )
 
-        return collected
+    def iter_licenses(
+        self, org_id: Optional[str] = None, max_results: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream licenses page by page (see :meth:`iter_items`)."""
+        params: Dict[str, Any] = {}
+        if org_id:
+            params["orgId"] = org_id
+        return self.iter_items("/licenses", params, max_results=max_results)
 
     async def get_organization_info(self) -> Dict[str, Any]:
         """Get information about the organization"""
@@ -395,15 +1052,23 @@ class WebexClient:
         org_id: Optional[str] = None,
         location_id: Optional[str] = None,
         max_results: int = 100,
+        fields: Union[str, Sequence[str], None] = None,
     ) -> List[Dict[str, Any]]:
-        """List users in the organization"""
+        """List users in the organization
+
+        ``fields`` limits each user to the named fields; asking for calling
+        fields (extension, locationId, phoneNumbers) adds ``callingData=true``.
+        """
+        fields = parse_fields(fields)
         params = {"max": max_results}
         if org_id:
             params["orgId"] = org_id
         if location_id:
             params["locationId"] = location_id
+        if fields is not None and _needs_calling_data(fields):
+            params["callingData"] = "true"
 
-        return await self._get_items("/people", params, max_results=max_results)
+        return await self._get_items("/people", params, max_results=max_results, fields=fields)
 
     async def get_user_details(self, person_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific user"""
@@ -411,22 +1076,31 @@ class WebexClient:
 
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user information by email address"""
+        directory = self._local_directory()
+        if directory is not None:
+            person = directory.person_by_email(email)
+            if person is not None:
+                return person
         params = {"email": email}
         response = await self._request("GET", "/people", params=params)
         items = response.get("items", [])
         return items[0] if items else None
 
-    async def get_user_calling_settings(self, person_id: str) -> Dict[str, Any]:
+    async def get_user_calling_settings(
+        self, person_id: str, fields: Union[str, Sequence[str], None] = None
+    ) -> Dict[str, Any]:
         """Get calling settings for a user including extension data
         
         Uses GET /people/{personId} with callingData=true parameter
         See: https://developer.webex.com/calling/docs/api/v1/people/get-person-details
+
+        ``fields`` limits the result to the named fields; when none of them
+        is calling data, ``callingData=true`` is left off the request.
         """
-        return await self._request(
-            "GET", 
-            f"/people/{person_id}",
-            params={"callingData": "true"}
-        )
+        fields = parse_fields(fields)
+        params = {"callingData": "true"} if _needs_calling_data(fields) else None
+        result = await self._request("GET", f"/people/{person_id}", params=params)
+        return project(result, fields)
 
     async def list_call_queues(
         self, location_id: Optional[str] = None, max_results: int = 100
@@ -476,25 +1150,241 @@ class WebexClient:
         )
 
     async def search_users(
-        self, query: str, org_id: Optional[str] = None, max_results: int = 100
+        self,
+        query: str,
+        org_id: Optional[str] = None,
+        max_results: int = 100,
+        explain: bool = False,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Search for users by display name, email, extension, number or ID.
+
+        With the directory index built (and no ``org_id``), this is a ranked
+        fuzzy search over names, emails, extensions, numbers and location
+        names answered locally; the API is only asked when nothing matches.
+
+        Otherwise the lookups that fit the query's shape (person ID/UUID,
+        email, extension, phone number, display name) run concurrently and
+        their results are merged as each completes, de-duplicated by person
+        ID and listed in strategy order. A failing strategy does not fail the
+        search unless all of them do.
+
+        With ``explain``, returns ``{"items", "source", "strategies"}`` where
+        ``strategies`` gives each lookup's time, hit count and error.
+        """
+        query = query.strip()
+        timings: Dict[str, Dict[str, Any]] = {}
+
+        directory = self._local_directory() if not org_id else None
+        if directory is not None:
+            start = time.perf_counter()
+            people = directory.search_people(query, limit=max_results)
+            timings["directory"] = self._record_search(
+                "directory", time.perf_counter() - start, len(people)
+            )
+            if people:
+                return (
+                    {"items": people, "source": "directory", "strategies": timings}
+                    if explain
+                    else people
+                )
+
+        lookups = {
+            "id": self._search_by_id,
+            "email": self._search_by_email,
+            "extension": self._search_by_extension,
+            "phoneNumber": self._search_by_phone_number,
+            "displayName": self._search_by_display_name,
+        }
+
+        async def run(name: str) -> Tuple[str, List[Dict[str, Any]], float, Optional[Exception]]:
+            start = time.perf_counter()
+            try:
+                items = await lookups[name](query, org_id, max_results)
+                return name, items, time.perf_counter() - start, None
+            except Exception as e:
+                return name, [], time.perf_counter() - start, e
+
+        strategies = _search_strategies(query)
+        found: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        errors: List[Exception] = []
+        for next_done in asyncio.as_completed([run(name) for name in strategies]):
+            name, items, seconds, error = await next_done
+            rank = _SEARCH_STRATEGIES.index(name)
+            for position, item in enumerate(items):
+                key = item.get("id") or f"{name}:{position}"
+                if key not in found or found[key][:2] > (rank, position):
+                    found[key] = (rank, position, item)
+            timings[name] = self._record_search(name, seconds, len(items), error)
+            if error is not None:
+                errors.append(error)
+        if errors and len(errors) == len(strategies):
+            raise errors[0]
+
+        results = [item for _, _, item in sorted(found.values(), key=lambda f: f[:2])]
+        if max_results > 0:
+            results = results[:max_results]
+        if explain:
+            return {"items": results, "source": "api", "strategies": timings}
+        return results
+
+    def _record_search(
+        self, strategy: str, seconds: float, hits: int, error: Optional[Exception] = None
+    ) -> Dict[str, Any]:
+        """Fold one strategy run into :attr:`search_stats`; return its timing."""
+        stats = self.search_stats.setdefault(
+            strategy, {"calls": 0, "hits": 0, "errors": 0, "totalSeconds": 0.0}
+        )
+        stats["calls"] += 1
+        stats["hits"] += hits
+        stats["errors"] += error is not None
+        stats["totalSeconds"] = round(stats["totalSeconds"] + seconds, 6)
+        timing: Dict[str, Any] = {"ms": round(seconds * 1000, 3), "count": hits}
+        if error is not None:
+            timing["error"] = str(error)
+        return timing
+
+    async def _search_people(
+        self, params: Dict[str, Any], org_id: Optional[str], max_results: int
     ) -> List[Dict[str, Any]]:
-        """Search for users by display name or email"""
-        params = {"displayName": query, "max": max_results}
         if org_id:
             params["orgId"] = org_id
+        return await self._get_items("/people", params, max_results=max_results)
 
-        response = await self._request("GET", "/people", params=params)
-        # Also try searching by email
-        email_response = await self._request("GET", "/people", params={"email": query, "max": max_results})
-        
-        # Combine and deduplicate results
-        results = {}
-        for item in response.get("items", []):
-            results[item.get("id")] = item
-        for item in email_response.get("items", []):
-            results[item.get("id")] = item
-        
-        return list(results.values())
+    async def _search_by_display_name(
+        self, query: str, org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        return await self._search_people({"displayName": query}, org_id, max_results)
+
+    async def _search_by_email(
+        self, query: str, org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        return await self._search_people({"email": query}, org_id, max_results)
+
+    async def _search_by_id(
+        self, query: str, org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        return await self._search_people({"id": _webex_person_id(query)}, org_id, max_results)
+
+    async def _search_by_number_owner(
+        self, params: Dict[str, Any], org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        """People owning the ``/telephony/config/numbers`` records matching ``params``."""
+        if org_id:
+            params["orgId"] = org_id
+        records = await self._get_items("/telephony/config/numbers", params, max_results=0)
+        person_ids = list(dict.fromkeys(
+            owner["id"]
+            for owner in (record.get("owner") or {} for record in records)
+            if owner.get("id") and owner.get("type") == "PEOPLE"
+        ))
+        if not person_ids:
+            return []
+        # One /people call resolves up to a page of owners.
+        return await self._search_people(
+            {"id": ",".join(person_ids[:_WEBEX_PAGE_LIMIT]), "callingData": "true"},
+            org_id,
+            max_results,
+        )
+
+    async def _search_by_extension(
+        self, query: str, org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        extension = "".join(ch for ch in query if ch.isdigit())
+        return await self._search_by_number_owner({"extension": extension}, org_id, max_results)
+
+    async def _search_by_phone_number(
+        self, query: str, org_id: Optional[str], max_results: int
+    ) -> List[Dict[str, Any]]:
+        digits = e164_digits(query)
+        params = {"phoneNumber": f"+{digits}" if digits else query}
+        return await self._search_by_number_owner(params, org_id, max_results)
+
+    # ========== Directory Lookups ==========
+
+    def _local_directory(self) -> Optional[DirectoryIndex]:
+        """The directory index if it can answer lookups.
+
+        Starts a background rebuild when the snapshot is missing or stale;
+        until the first one completes, lookups go to the API.
+        """
+        directory = self.directory
+        if directory is None:
+            return None
+        if directory.stale:
+            directory.refresh_in_background(self)
+        return directory if directory.ready else None
+
+    async def refresh_directory(self) -> Dict[str, Any]:
+        """Rebuild the directory snapshot now and report its status."""
+        if self.directory is None:
+            raise ValueError(
+                "The directory index is disabled; set WEBEX_DIRECTORY_ENABLED=true"
+            )
+        await self.directory.refresh(self)
+        return self.directory.status()
+
+    async def find_by_extension(
+        self, extension: str, location_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Find who owns an extension (people, call queues, hunt groups, ...).
+
+        Extensions are unique per location only, so several owners may be
+        returned unless ``location_id`` narrows it down.
+        """
+        directory = self._local_directory()
+        if directory is not None:
+            owners = directory.owners_by_extension(extension, location_id)
+            if owners:
+                return owners
+        params: Dict[str, Any] = {"extension": extension}
+        if location_id:
+            params["locationId"] = location_id
+        records = await self._get_items("/telephony/config/numbers", params, max_results=0)
+        return [_number_owner(r) for r in records if (r.get("owner") or {}).get("id")]
+
+    async def find_phone_number_owner(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Find who a phone number (any common format) is assigned to."""
+        directory = self._local_directory()
+        if directory is not None:
+            owner = directory.owner_by_number(phone_number)
+            if owner is not None:
+                return owner
+        digits = e164_digits(phone_number)
+        params = {"phoneNumber": f"+{digits}" if digits else phone_number}
+        records = await self._get_items("/telephony/config/numbers", params, max_results=0)
+        for record in records:
+            if (record.get("owner") or {}).get("id"):
+                return _number_owner(record)
+        return None
+
+    async def find_device_by_mac(self, mac: str) -> Optional[Dict[str, Any]]:
+        """Find a device by MAC address (separators and case are ignored)."""
+        directory = self._local_directory()
+        if directory is not None:
+            device = directory.device_by_mac(mac)
+            if device is not None:
+                return device
+        response = await self._request("GET", "/devices", params={"mac": normalize_mac(mac)})
+        items = response.get("items", [])
+        return items[0] if items else None
+
+    async def list_location_members(self, location_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """List the people, devices, call queues and hunt groups at a location."""
+        directory = self._local_directory()
+        if directory is not None:
+            return directory.location_members(location_id)
+        people, devices, queues, hunt_groups = await asyncio.gather(
+            self.list_users(location_id=location_id, max_results=0),
+            self.list_devices(location_id=location_id, max_results=0),
+            self.list_call_queues(location_id=location_id, max_results=0),
+            self.list_hunt_groups(location_id=location_id, max_results=0),
+        )
+        return {
+            "people": people,
+            "devices": devices,
+            "callQueues": queues,
+            "huntGroups": hunt_groups,
+        }
 
     # ========== License Management ==========
     
@@ -545,15 +1435,16 @@ class WebexClient:
         person_id: Optional[str] = None,
         location_id: Optional[str] = None,
         max_results: int = 100,
+        fields: Union[str, Sequence[str], None] = None,
     ) -> List[Dict[str, Any]]:
-        """List devices"""
+        """List devices (``fields`` limits each device to the named fields)"""
         params = {"max": max_results}
         if person_id:
             params["personId"] = person_id
         if location_id:
             params["locationId"] = location_id
 
-        return await self._get_items("/devices", params, max_results=max_results)
+        return await self._get_items("/devices", params, max_results=max_results, fields=fields)
 
     async def get_device_details(self, device_id: str) -> Dict[str, Any]:
         """Get details about a specific device"""
@@ -814,6 +1705,12 @@ class WebexClient:
         Base URL: https://analytics.webexapis.com/v1
         
         Requires: "Webex Calling Detailed Call History API access" role assigned by an administrator.
+
+        Every window follows the feed's ``Link`` pagination, so busy periods are
+        not truncated at one page. When more than one page is wanted
+        (``max_results`` of 0 or above the page cap) the range is split into
+        ``cdr_shard_minutes`` sub-windows fetched concurrently, and the merged
+        records are de-duplicated and ordered by start time.
         """
         # Required parameters
         if not start_time:
@@ -908,161 +1805,63 @@ class WebexClient:
         
         # API REQUIRES ISO 8601 format with milliseconds: YYYY-MM-DDTHH:MM:SS.mmmZ
         # According to API docs: "Must be formatted as YYYY-MM-DDTHH:MM:SS.mmmZ"
-        # Example: "2022-06-08T21:27:00.604Z"
-        # DO NOT use formats without milliseconds - API will reject them
-        
-        # Format with actual milliseconds (REQUIRED by API - no exceptions)
-        start_time_iso_ms = format_date_for_api(start_time, format_type='iso_ms')
-        end_time_iso_ms = format_date_for_api(end_time, format_type='iso_ms')
-        
-        # Build base parameters (using ISO format WITH milliseconds - API REQUIRES this)
-        base_params = {
-            "startTime": start_time_iso_ms,
-            "endTime": end_time_iso_ms,
-        }
-        
-        # Optional filters
-        if location_id:
-            # API uses "locations" parameter (may accept comma-separated list)
-            base_params["locations"] = location_id
-        
-        if max_results:
-            base_params["max"] = max_results
-        
-        # Try different parameter variations
-        # API REQUIRES: YYYY-MM-DDTHH:MM:SS.mmmZ format (ISO 8601 with milliseconds)
-        # DO NOT try formats without milliseconds - API will reject with "Invalid input string"
-        param_variations = [
-            # 1. Minimal parameters with ISO format WITH milliseconds (REQUIRED by API) - try this first
-            {
-                "startTime": start_time_iso_ms,
-                "endTime": end_time_iso_ms,
-            },
-            # 2. Standard format with all parameters (ISO with ms)
-            base_params.copy(),
-            # 3. Without max parameter
-            {k: v for k, v in base_params.items() if k != "max"},
-            # 4. Without location parameter
-            {k: v for k, v in base_params.items() if k != "locations"},
-            # Note: We do NOT try without milliseconds - API explicitly requires .mmm format
-        ]
+        # Example: "2022-06-08T21:27:00.604Z"
+        # DO NOT use formats without milliseconds - API will reject them
+        
+        # Format with actual milliseconds (REQUIRED by API - no exceptions)
+        start_time_iso_ms = format_date_for_api(start_time, format_type='iso_ms')
+        end_time_iso_ms = format_date_for_api(end_time, format_type='iso_ms')
         
         # Note: person_id is not directly supported by /cdr_feed endpoint
         # We'll filter by person_id after retrieving records if needed
-        
-        # Use the correct endpoint and base URL
-        # Base URL: https://analytics.webexapis.com/v1
-        # Endpoint: /cdr_feed
+
+        # The CDR feed lives on a different host (analytics_base_url); requests
+        # pass it per-call rather than mutating self.base_url so concurrent
+        # calls stay isolated.
         endpoint = "/cdr_feed"
-        # The CDR feed lives on a different host. We pass it per-request rather
-        # than mutating self.base_url so concurrent calls stay isolated.
         analytics_base_url = self.analytics_base_url
-        last_error = None
 
         try:
-            # Try different parameter variations
-            response = None
-            attempt_count = 0
-            for param_set in param_variations:
-                attempt_count += 1
-                try:
-                    response = await self._request(
-                        "GET", endpoint, params=param_set, base_url=analytics_base_url
+            # Large pulls are split into time shards fetched concurrently
+            # (bounded by cdr_max_concurrency); each shard follows the feed's
+            # Link pagination, so a busy window is never truncated at one page.
+            windows = self._cdr_windows(start_time_iso_ms, end_time_iso_ms, max_results)
+            semaphore = asyncio.Semaphore(max(1, self.cdr_max_concurrency))
+
+            async def fetch_window(window_start: str, window_end: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_cdr_window(
+                        window_start,
+                        window_end,
+                        location_id=location_id,
+                        max_results=max_results,
                     )
-                    # If successful, break out of loop
-                    break
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e)
-                    # If it's a 400 error about invalid input/string, try next parameter variation
-                    # (but all variations use milliseconds format as required by API)
-                    if "400" in error_str and ("invalid" in error_str.lower() or "input" in error_str.lower() or "string" in error_str.lower()):
-                        # Try next variation (different parameter combinations, but all with milliseconds)
-                        if attempt_count < len(param_variations):
-                            continue
-                    # For other errors (401, 403, etc.), raise immediately
-                    raise
-            
-            if response is None and last_error:
-                # All parameter variations failed
-                # Provide helpful error message with what we tried
-                error_msg = str(last_error)
-                
-                # Check if dates are in valid range (API requires 5 minutes to 48 hours ago)
-                from datetime import datetime, timezone, timedelta
-                now = datetime.now(timezone.utc)
-                min_time = now - timedelta(hours=48)
-                max_time = now - timedelta(minutes=5)
-                
-                try:
-                    start_dt = datetime.fromisoformat(start_time_iso_ms.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end_time_iso_ms.replace('Z', '+00:00'))
-                    
-                    date_range_issues = []
-                    if start_dt < min_time:
-                        date_range_issues.append(f"startTime ({start_time_iso_ms}) is more than 48 hours ago")
-                    if start_dt > max_time:
-                        date_range_issues.append(f"startTime ({start_time_iso_ms}) is less than 5 minutes ago")
-                    if end_dt < min_time:
-                        date_range_issues.append(f"endTime ({end_time_iso_ms}) is more than 48 hours ago")
-                    if end_dt > max_time:
-                        date_range_issues.append(f"endTime ({end_time_iso_ms}) is less than 5 minutes ago")
-                    if start_dt > end_dt:
-                        date_range_issues.append(f"startTime must be before endTime")
-                    
-                    if date_range_issues:
-                        range_msg = "\n".join([f"  - {issue}" for issue in date_range_issues])
-                        raise Exception(
-                            f"Failed to retrieve call detail records. "
-                            f"Date range validation failed:\n{range_msg}\n\n"
-                            f"API requires: startTime and endTime must be between 5 minutes ago and 48 hours ago. "
-                            f"Last API error: {error_msg}"
-                        )
-                except:
-                    pass  # If we can't parse dates, just show the original error
-                
-                raise Exception(
-                    f"Failed to retrieve call detail records after trying {len(param_variations)} different parameter combinations. "
-                    f"Last error: {error_msg}. "
-                    f"\n\nDate format used: {start_time_iso_ms} to {end_time_iso_ms} "
-                    f"(ISO 8601 with milliseconds as required by API). "
-                    f"\n\nNote: API requires dates to be between 5 minutes ago and 48 hours ago. "
-                    f"If dates are in range, the format may still be incorrect. "
-                    f"Please check the API documentation for the exact expected format."
-                )
-            
-            # The API returns a list of call records directly
-            records = []
-            if isinstance(response, list):
-                records = response
-            elif isinstance(response, dict):
-                # Try common response structures
-                if "items" in response:
-                    records = response.get("items", [])
-                elif "data" in response:
-                    records = response.get("data", [])
-                elif "calls" in response:
-                    records = response.get("calls", [])
-                elif "cdr" in response:
-                    records = response.get("cdr", [])
-                else:
-                    # Return the response as a single-item list if unexpected structure
-                    records = [response] if response else []
-            
+
+            # Until we know which parameter shape the feed accepts, fetch the
+            # first shard alone so the others don't all probe in parallel.
+            first: List[List[Dict[str, Any]]] = []
+            if len(windows) > 1 and not self.has_learned_cdr_variation():
+                first.append(await fetch_window(*windows[0]))
+                windows = windows[1:]
+
+            tasks = [
+                asyncio.ensure_future(fetch_window(ws, we)) for ws, we in windows
+            ]
+            try:
+                shards = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            records = _merge_cdr_records(first + list(shards))
+
             # Filter by person_id if provided (since API doesn't support it directly)
             if person_id and records:
-                # Filter records where the person matches
-                filtered_records = []
-                for record in records:
-                    # Check various fields where person_id might appear
-                    from_person = record.get("from", {}).get("personId") if isinstance(record.get("from"), dict) else None
-                    to_person = record.get("to", {}).get("personId") if isinstance(record.get("to"), dict) else None
-                    record_person_id = record.get("personId") or record.get("person_id")
-                    
-                    if person_id in [from_person, to_person, record_person_id]:
-                        filtered_records.append(record)
-                records = filtered_records
-            
+                records = [r for r in records if _cdr_matches_person(r, person_id)]
+
+            if max_results:
+                records = records[:max_results]
             return records
             
         except Exception as e:
@@ -1095,6 +1894,250 @@ class WebexClient:
                     f"Ensure you have the 'Webex Calling Detailed Call History API access' role assigned."
                 )
 
+    async def _local_cdr_window(
+        self, start_time: Optional[str], end_time: Optional[str]
+    ) -> Optional[Tuple[int, int]]:
+        """Return the window in epoch ms if the local CDR store can answer it.
+
+        The window is synced incrementally first if it isn't covered yet.
+        Returns None without the store, or if the window can't be covered
+        (e.g. it is older than the feed's 48 hours and was never synced).
+        """
+        if self.cdr_sync is None or self.cdr_store is None:
+            return None
+        start_ms = parse_cdr_time(start_time)
+        end_ms = parse_cdr_time(end_time)
+        if start_ms is None or end_ms is None:
+            return None
+        if not await self.cdr_sync.ensure_covered(start_ms, end_ms):
+            return None
+        return start_ms, end_ms
+
+    @contextlib.asynccontextmanager
+    async def _cdr_scope(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        person_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        max_results: int = 1000,
+    ) -> AsyncIterator[Tuple[Union[CdrStore, CdrBatch], Dict[str, Any]]]:
+        """Yield the window's CDRs as a queryable store, plus its filters.
+
+        The filters are keyword arguments for the store's query methods. With
+        the local store covering the window that is the shared SQLite store
+        plus the window/location/person filters; otherwise the CDRs are
+        fetched (the API already applies the filters) into a columnar
+        :class:`CdrBatch`, which answers the same queries in memory.
+        """
+        window = await self._local_cdr_window(start_time, end_time)
+        if window is not None:
+            yield self.cdr_store, {
+                "start_ms": window[0],
+                "end_ms": window[1],
+                "location": location_id,
+                "person_id": person_id,
+            }
+            return
+        records = await self.get_call_detail_records(
+            start_time=start_time,
+            end_time=end_time,
+            person_id=person_id,
+            location_id=location_id,
+            max_results=max_results,
+        )
+        # Only the detail listings (first 100 matching rows) need raw records.
+        yield CdrBatch.from_records(records, sample_size=_CDR_SAMPLE_SIZE), {}
+
+    def _cdr_windows(
+        self, start_iso: str, end_iso: str, max_results: int
+    ) -> List[Tuple[str, str]]:
+        """Split ``[start_iso, end_iso]`` into sub-windows for parallel fetches.
+
+        Small, capped pulls (``max_results`` within a single page) stay as one
+        window so they still cost a single request.
+        """
+        from datetime import timedelta
+
+        shard = timedelta(minutes=self.cdr_shard_minutes)
+        if (
+            self.cdr_shard_minutes <= 0
+            or (max_results and max_results <= _CDR_PAGE_LIMIT)
+        ):
+            return [(start_iso, end_iso)]
+        try:
+            start_dt = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
+            end_dt = datetime.fromisoformat(end_iso.replace("Z", "+00:00"))
+        except ValueError:
+            return [(start_iso, end_iso)]
+        if end_dt - start_dt <= shard:
+            return [(start_iso, end_iso)]
+
+        windows: List[Tuple[str, str]] = []
+        cursor = start_dt
+        while cursor < end_dt:
+            window_end = min(cursor + shard, end_dt)
+            windows.append((_format_cdr_time(cursor), _format_cdr_time(window_end)))
+            cursor = window_end
+        return windows
+
+    async def _fetch_cdr_window(
+        self,
+        start_iso: str,
+        end_iso: str,
+        *,
+        location_id: Optional[str] = None,
+        max_results: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Fetch every CDR in one time window, following ``Link`` pagination."""
+        page_size = min(max_results, _CDR_PAGE_LIMIT) if max_results else _CDR_PAGE_LIMIT
+
+        # Build base parameters (using ISO format WITH milliseconds - API REQUIRES this)
+        base_params = {
+            "startTime": start_iso,
+            "endTime": end_iso,
+        }
+        
+        # Optional filters
+        if location_id:
+            # API uses "locations" parameter (may accept comma-separated list)
+            base_params["locations"] = location_id
+        
+        base_params["max"] = page_size
+        
+        # Try different parameter variations
+        # API REQUIRES: YYYY-MM-DDTHH:MM:SS.mmmZ format (ISO 8601 with milliseconds)
+        # DO NOT try formats without milliseconds - API will reject with "Invalid input string"
+        param_variations = [
+            # 1. Minimal parameters with ISO format WITH milliseconds (REQUIRED by API) - try this first
+            ("minimal", {
+                "startTime": start_iso,
+                "endTime": end_iso,
+            }),
+            # 2. Standard format with all parameters (ISO with ms)
+            ("full", base_params.copy()),
+            # 3. Without max parameter
+            ("no_max", {k: v for k, v in base_params.items() if k != "max"}),
+            # 4. Without location parameter
+            ("no_locations", {k: v for k, v in base_params.items() if k != "locations"}),
+            # Note: We do NOT try without milliseconds - API explicitly requires .mmm format
+        ]
+
+        # Go straight to the shape this org/host accepted last time.
+        variation_key = await self._cdr_variation_key()
+        learned = self._cdr_variations.get(variation_key)
+        param_variations.sort(key=lambda variation: variation[0] != learned)
+
+        endpoint = "/cdr_feed"
+        url = f"{self.analytics_base_url}{endpoint}"
+        last_error = None
+        response = None
+        next_url: Optional[str] = None
+        attempt_count = 0
+        for variation_name, param_set in param_variations:
+            attempt_count += 1
+            try:
+                response, next_url = await self._get_json(
+                    url, endpoint, param_set, use_cache=False
+                )
+                if variation_name != learned:
+                    self._cdr_variations.set(variation_key, variation_name)
+                # If successful, break out of loop
+                break
+            except Exception as e:
+                last_error = e
+                error_str = str(e)
+                # If it's a 400 error about invalid input/string, try next parameter variation
+                # (but all variations use milliseconds format as required by API)
+                if "400" in error_str and ("invalid" in error_str.lower() or "input" in error_str.lower() or "string" in error_str.lower()):
+                    # Try next variation (different parameter combinations, but all with milliseconds)
+                    if attempt_count < len(param_variations):
+                        continue
+                # For other errors (401, 403, etc.), raise immediately
+                raise
+
+        if response is None and last_error:
+            raise self._cdr_variations_error(start_iso, end_iso, last_error, len(param_variations))
+
+        records = _extract_cdr_records(response)
+        while next_url and not (max_results and len(records) >= max_results):
+            page, next_url = await self._get_json(next_url, endpoint, None, use_cache=False)
+            records.extend(_extract_cdr_records(page))
+        return records
+
+    async def _cdr_variation_key(self) -> str:
+        """Identify the (analytics host, org) pair a learned CDR shape is for."""
+        if self._org_id is None:
+            try:
+                me = await self.get_my_info()
+                self._org_id = (me.get("orgId") if isinstance(me, dict) else None) or ""
+            except Exception as e:
+                logger.debug("Could not resolve orgId for CDR variation cache: %s", e)
+                self._org_id = ""
+        host = httpx.URL(self.analytics_base_url).host
+        return f"{host}|{self._org_id or '*'}"
+
+    def has_learned_cdr_variation(self) -> bool:
+        """Whether a working ``/cdr_feed`` parameter shape is already known."""
+        if self._org_id is None:
+            return False
+        return self._cdr_variations.get(
+            f"{httpx.URL(self.analytics_base_url).host}|{self._org_id or '*'}"
+        ) is not None
+
+    @staticmethod
+    def _cdr_variations_error(
+        start_time_iso_ms: str,
+        end_time_iso_ms: str,
+        last_error: Exception,
+        attempts: int,
+    ) -> Exception:
+        """Explain why every CDR parameter variation was rejected."""
+        # Provide helpful error message with what we tried
+        error_msg = str(last_error)
+
+        # Check if dates are in valid range (API requires 5 minutes to 48 hours ago)
+        from datetime import datetime, timezone, timedelta
+        now = datetime.now(timezone.utc)
+        min_time = now - timedelta(hours=48)
+        max_time = now - timedelta(minutes=5)
+
+        try:
+            start_dt = datetime.fromisoformat(start_time_iso_ms.replace('Z', '+00:00'))
+            end_dt = datetime.fromisoformat(end_time_iso_ms.replace('Z', '+00:00'))
+            date_range_issues = []
+            if start_dt < min_time:
+                date_range_issues.append(f"startTime ({start_time_iso_ms}) is more than 48 hours ago")
+            if start_dt > max_time:
+                date_range_issues.append(f"startTime ({start_time_iso_ms}) is less than 5 minutes ago")
+            if end_dt < min_time:
+                date_range_issues.append(f"endTime ({end_time_iso_ms}) is more than 48 hours ago")
+            if end_dt > max_time:
+                date_range_issues.append(f"endTime ({end_time_iso_ms}) is less than 5 minutes ago")
+            if start_dt > end_dt:
+                date_range_issues.append(f"startTime must be before endTime")
+        except ValueError:
+            date_range_issues = []  # If we can't parse dates, just show the original error
+
+        if date_range_issues:
+            range_msg = "\n".join([f"  - {issue}" for issue in date_range_issues])
+            return Exception(
+                f"Failed to retrieve call detail records. "
+                f"Date range validation failed:\n{range_msg}\n\n"
+                f"API requires: startTime and endTime must be between 5 minutes ago and 48 hours ago. "
+                f"Last API error: {error_msg}"
+            )
+
+        return Exception(
+            f"Failed to retrieve call detail records after trying {attempts} different parameter combinations. "
+            f"Last error: {error_msg}. "
+            f"\n\nDate format used: {start_time_iso_ms} to {end_time_iso_ms} "
+            f"(ISO 8601 with milliseconds as required by API). "
+            f"\n\nNote: API requires dates to be between 5 minutes ago and 48 hours ago. "
+            f"If dates are in range, the format may still be incorrect. "
+            f"Please check the API documentation for the exact expected format."
+        )
+
     async def get_call_analytics(
         self,
         start_time: str,
@@ -1102,40 +2145,35 @@ class WebexClient:
         location_id: Optional[str] = None,
         org_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get call analytics and statistics"""
-        params = {
-            "startTime": start_time,
-            "endTime": end_time,
-        }
-        if location_id:
-            params["locationId"] = location_id
-        if org_id:
-            params["orgId"] = org_id
+        """Get call analytics and statistics
 
+        Includes p50/p95/p99 call duration and wait time, computed with
+        streaming quantile sketches rather than by holding every record.
+        """
         # Aggregate call history data for analytics
-        call_history = await self.get_call_detail_records(
+        async with self._cdr_scope(
             start_time=start_time,
             end_time=end_time,
             location_id=location_id,
             max_results=1000
-        )
+        ) as (store, scope):
+            summary = aggregate(store, **scope)["summary"]
+            call_history = store.records_between(limit=100, **scope)
 
         # Calculate basic analytics
-        total_calls = len(call_history)
-        completed_calls = sum(1 for call in call_history if call.get("status") == "completed")
-        missed_calls = sum(1 for call in call_history if call.get("status") == "missed")
-        total_duration = sum(
-            call.get("duration", 0) for call in call_history
-            if call.get("duration")
-        )
+        completed_calls = summary["answeredCalls"]
+        total_duration = summary["totalDuration"]
 
         return {
-            "totalCalls": total_calls,
+            "totalCalls": summary["calls"],
             "completedCalls": completed_calls,
-            "missedCalls": missed_calls,
+            "missedCalls": summary["calls"] - completed_calls,
+            "answerRate": summary["answerRate"],
             "totalDuration": total_duration,
             "averageDuration": total_duration / completed_calls if completed_calls > 0 else 0,
-            "callHistory": call_history[:100],  # Return first 100 for details
+            "durationPercentiles": summary["durationPercentiles"],
+            "waitTimePercentiles": summary["waitTimePercentiles"],
+            "callHistory": call_history,  # Return first 100 for details
         }
 
     async def get_queue_analytics(
@@ -1144,34 +2182,33 @@ class WebexClient:
         start_time: str,
         end_time: str,
     ) -> Dict[str, Any]:
-        """Get analytics for a specific call queue"""
-        params = {
-            "startTime": start_time,
-            "endTime": end_time,
-        }
+        """Get analytics for a specific call queue
 
+        Includes p50/p95/p99 call duration and queue wait time.
+        """
         # Get queue details
         queue_details = await self.get_call_queue_details(queue_id)
         
         # Get call history filtered by queue
-        # Note: This may require additional API endpoints depending on Webex API
-        call_history = await self.get_call_detail_records(
+        async with self._cdr_scope(
             start_time=start_time,
             end_time=end_time,
             max_results=1000
-        )
-
-        # Filter calls related to this queue (if queue information is in call history)
-        queue_calls = [
-            call for call in call_history
-            if queue_id in str(call.get("queueId", ""))
-        ]
+        ) as (store, scope):
+            # Filter calls related to this queue (if queue information is in call history)
+            scope = dict(scope, queue_id=queue_id)
+            summary = aggregate(store, **scope)["summary"]
+            queue_calls = store.records_between(limit=100, **scope)
 
         return {
             "queueId": queue_id,
             "queueName": queue_details.get("name"),
-            "totalCalls": len(queue_calls),
-            "calls": queue_calls[:100],
+            "totalCalls": summary["calls"],
+            "answeredCalls": summary["answeredCalls"],
+            "answerRate": summary["answerRate"],
+            "durationPercentiles": summary["durationPercentiles"],
+            "waitTimePercentiles": summary["waitTimePercentiles"],
+            "calls": queue_calls,
         }
 
     # ========== Additional Data Retrieval ==========
@@ -1524,6 +2561,11 @@ class WebexClient:
 
     async def list_queue_agents(self, queue_id: str) -> List[Dict[str, Any]]:
         """List all agents in a call queue"""
+        directory = self._local_directory()
+        if directory is not None:
+            agents = directory.queue_agents(queue_id)
+            if agents is not None:
+                return agents
         queue = await self.get_call_queue_details(queue_id)
         return queue.get("agents", [])
 
@@ -1827,22 +2869,19 @@ class WebexClient:
         response = await self._request("GET", "/telephony/calls/metrics", params=params)
         return response.get("metrics", {})
 
-    async def get_call_statistics_from_cdr(
-        self,
-        person_id: Optional[str] = None,
-        location_id: Optional[str] = None,
-        start_time: Optional[str] = None,
-        end_time: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get call statistics for a person or location from call detail records
-        
-        Calculates total minutes and seconds from all call detail records.
-        
-        If start_time or end_time are not provided, automatically calculates a range
-        within the last 48 hours (API requirement: dates must be between 5 minutes and 48 hours ago).
+    @staticmethod
+    def _resolve_cdr_window(
+        start_time: Optional[str], end_time: Optional[str]
+    ) -> Tuple[str, str]:
+        """Default and clamp a CDR query window to what the feed serves.
+
+        Missing times default to the 24 hours ending 1 hour ago. The API
+        requires the end to be at least 5 minutes ago and the start to be
+        within the last 48 hours, so the window is clamped accordingly.
+        Returns both times formatted as ``YYYY-MM-DDTHH:MM:SS.000Z``.
         """
-        from datetime import datetime, timezone, timedelta
-        
+        from datetime import timedelta
+
         # If times not provided, calculate a default range
         # API requires: end time must be at least 5 minutes ago, and start time must be within 48 hours
         now = datetime.now(timezone.utc)
@@ -1896,16 +2935,38 @@ class WebexClient:
         # Format dates using the simpler format from test script: YYYY-MM-DDTHH:MM:SS.000Z
         start_time_str = start_time_dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
         end_time_str = end_time_dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        return start_time_str, end_time_str
+
+    async def get_call_statistics_from_cdr(
+        self,
+        person_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get call statistics for a person or location from call detail records
+        
+        Calculates total minutes and seconds from all call detail records.
+        
+        If start_time or end_time are not provided, automatically calculates a range
+        within the last 48 hours (API requirement: dates must be between 5 minutes and 48 hours ago).
+        """
+        start_time_str, end_time_str = self._resolve_cdr_window(start_time, end_time)
         
         # Get call detail records
         try:
-            call_records = await self.get_call_detail_records(
+            async with self._cdr_scope(
                 person_id=person_id,
                 location_id=location_id,
                 start_time=start_time_str,
                 end_time=end_time_str,
                 max_results=1000
-            )
+            ) as (store, scope):
+                # Count all calls with duration > 0 (completed calls)
+                total_calls, total_seconds = store.duration_totals(**scope)
+                completed_calls = store.records_between(
+                    limit=100, answered_only=True, **scope
+                )
         except Exception as e:
             error_msg = str(e)
             # Handle rate limiting
@@ -1916,20 +2977,6 @@ class WebexClient:
                 )
             raise
         
-        # Calculate statistics for all calls
-        total_minutes = 0
-        total_seconds = 0
-        completed_calls = []
-        
-        for call in call_records:
-            # Use actual field names from API response
-            call_duration = call.get("Duration", 0) or call.get("duration", 0)  # in seconds
-            
-            # Count all calls with duration > 0 (completed calls)
-            if call_duration > 0:
-                completed_calls.append(call)
-                total_seconds += call_duration
-        
         # Convert seconds to minutes
         total_minutes = total_seconds / 60.0
         
@@ -1940,8 +2987,8 @@ class WebexClient:
             "endTime": end_time_str,
             "totalMinutes": round(total_minutes, 2),
             "totalSeconds": total_seconds,
-            "totalCalls": len(completed_calls),
-            "calls": completed_calls[:100]  # Return first 100 for details
+            "totalCalls": total_calls,
+            "calls": completed_calls  # Return first 100 for details
         }
 
     async def get_call_statistics_by_state(
@@ -1973,10 +3020,7 @@ class WebexClient:
         from .area_codes import (
             get_area_codes_for_state,
             normalize_state_name,
-            extract_area_code,
         )
-        from datetime import datetime, timezone, timedelta
-        
         # Normalize state name
         normalized_state = normalize_state_name(state)
         if not normalized_state:
@@ -1988,51 +3032,33 @@ class WebexClient:
             raise ValueError(f"No area codes found for state: {normalized_state}")
         
         # Calculate time range if not provided
-        now = datetime.now(timezone.utc)
-        
-        if not end_time:
-            end_time_dt = now - timedelta(hours=1)
-        else:
-            if isinstance(end_time, str):
-                try:
-                    end_time_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                except:
-                    end_time_dt = now - timedelta(hours=1)
-            else:
-                end_time_dt = end_time
-        
-        if not start_time:
-            start_time_dt = end_time_dt - timedelta(hours=24)
-        else:
-            if isinstance(start_time, str):
-                try:
-                    start_time_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                except:
-                    start_time_dt = end_time_dt - timedelta(hours=24)
-            else:
-                start_time_dt = start_time
-        
-        # Ensure times meet API requirements
-        min_end_time = now - timedelta(minutes=5)
-        max_start_time = now - timedelta(hours=48)
-        
-        if end_time_dt > min_end_time:
-            end_time_dt = min_end_time
-        if start_time_dt < max_start_time:
-            start_time_dt = max_start_time
-        if start_time_dt >= end_time_dt:
-            start_time_dt = end_time_dt - timedelta(hours=24)
-        
-        start_time_str = start_time_dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        end_time_str = end_time_dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        start_time_str, end_time_str = self._resolve_cdr_window(start_time, end_time)
         
-        # Get all call detail records
+        # Count calls to/from the state's area codes
         try:
-            call_records = await self.get_call_detail_records(
+            async with self._cdr_scope(
                 start_time=start_time_str,
                 end_time=end_time_str,
                 max_results=1000
-            )
+            ) as (store, scope):
+                # One pass buckets every state; pick out the requested one
+                totals = store.state_totals(**scope).get(normalized_state) or {
+                    "callsTo": 0, "secondsTo": 0, "callsFrom": 0, "secondsFrom": 0
+                }
+                want_to = direction is None or direction.lower() == "to"
+                want_from = direction is None or direction.lower() == "from"
+                calls_to_state = totals["callsTo"] if want_to else 0
+                calls_from_state = totals["callsFrom"] if want_from else 0
+                total_seconds_to = totals["secondsTo"] if want_to else 0
+                total_seconds_from = totals["secondsFrom"] if want_from else 0
+
+                sample: List[Dict[str, Any]] = []
+                if want_to:
+                    sample = store.area_code_records(area_codes, "called", limit=100, **scope)
+                if want_from:
+                    sample += store.area_code_records(
+                        area_codes, "calling", limit=100 - len(sample), **scope
+                    )
         except Exception as e:
             error_msg = str(e)
             if "429" in error_msg or "Too Many Requests" in error_msg:
@@ -2042,61 +3068,8 @@ class WebexClient:
                 )
             raise
         
-        # Filter calls by state area codes
-        calls_to_state = []
-        calls_from_state = []
-        total_seconds_to = 0
-        total_seconds_from = 0
-        
-        for call in call_records:
-            # Get phone numbers from the call record
-            # CDR records use "Called number" and "Calling number" in E.164 format (e.g., "+12039247239")
-            calling_number = (
-                call.get("Calling number") or
-                call.get("calling_number") or
-                call.get("Caller ID number") or
-                call.get("caller_id_number") or
-                call.get("Calling line ID") or 
-                call.get("calling_line_id") or 
-                call.get("From") or 
-                call.get("from") or
-                ""
-            )
-            
-            called_number = (
-                call.get("Called number") or
-                call.get("called_number") or
-                call.get("User number") or
-                call.get("user_number") or
-                call.get("Called line ID") or 
-                call.get("called_line_id") or 
-                call.get("To") or 
-                call.get("to") or
-                ""
-            )
-            
-            # Extract area codes
-            calling_area_code = extract_area_code(str(calling_number))
-            called_area_code = extract_area_code(str(called_number))
-            
-            call_duration = call.get("Duration", 0) or call.get("duration", 0)
-            
-            # Check if call is TO the state (called number matches)
-            if called_area_code and called_area_code in area_codes:
-                if direction is None or direction.lower() == "to":
-                    calls_to_state.append(call)
-                    if call_duration > 0:
-                        total_seconds_to += call_duration
-            
-            # Check if call is FROM the state (calling number matches)
-            if calling_area_code and calling_area_code in area_codes:
-                if direction is None or direction.lower() == "from":
-                    calls_from_state.append(call)
-                    if call_duration > 0:
-                        total_seconds_from += call_duration
-        
         # Calculate totals
-        total_calls = len(calls_to_state) + len(calls_from_state)
+        total_calls = calls_to_state + calls_from_state
         total_seconds = total_seconds_to + total_seconds_from
         total_minutes = total_seconds / 60.0
         
@@ -2108,12 +3081,94 @@ class WebexClient:
             "totalCalls": total_calls,
             "totalMinutes": round(total_minutes, 2),
             "totalSeconds": total_seconds,
-            "callsToState": len(calls_to_state),
-            "callsFromState": len(calls_from_state),
+            "callsToState": calls_to_state,
+            "callsFromState": calls_from_state,
             "minutesToState": round(total_seconds_to / 60.0, 2),
             "minutesFromState": round(total_seconds_from / 60.0, 2),
-            "calls": (calls_to_state + calls_from_state)[:100]  # Return first 100 for details
+            "calls": sample  # Return first 100 for details
+        }
+
+    async def get_call_statistics_by_country(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        direction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get call statistics broken down by country of the phone numbers
+
+        Numbers are classified by E.164 country code, and within +1 by area
+        code (US, Canada, US territories, Caribbean NANP countries).
+
+        Args:
+            start_time: Optional start time (ISO 8601). Defaults to 24 hours before end_time
+            end_time: Optional end time (ISO 8601). Defaults to 1 hour ago
+            direction: "to" (country of the called number), "from" (country
+                      of the calling number), or None (both)
+        """
+        return await self._call_statistics_by_geo("country", start_time, end_time, direction)
+
+    async def get_call_statistics_by_region(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        direction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get call statistics broken down by world region of the phone numbers
+
+        Regions are North America, Caribbean, Central/South America, Europe,
+        Africa, Middle East, Asia, Oceania and International (satellite and
+        global services). Arguments are as for
+        :meth:`get_call_statistics_by_country`.
+        """
+        return await self._call_statistics_by_geo("region", start_time, end_time, direction)
+
+    async def _call_statistics_by_geo(
+        self,
+        dimension: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        direction: Optional[str],
+    ) -> Dict[str, Any]:
+        direction = direction.lower() if direction else None
+        if direction not in (None, "to", "from"):
+            raise ValueError(f"Invalid direction: {direction}. Use 'to', 'from', or omit it.")
+        sides = []
+        if direction in (None, "to"):
+            sides.append(("byCalledNumber", dimension))
+        if direction in (None, "from"):
+            sides.append(("byCallingNumber", "calling_" + dimension))
+
+        start_time_str, end_time_str = self._resolve_cdr_window(start_time, end_time)
+        try:
+            async with self._cdr_scope(
+                start_time=start_time_str,
+                end_time=end_time_str,
+                max_results=1000
+            ) as (store, scope):
+                result = aggregate(store, [dim for _, dim in sides], **scope)
+        except Exception as e:
+            error_msg = str(e)
+            if "429" in error_msg or "Too Many Requests" in error_msg:
+                raise Exception(
+                    f"Rate limit exceeded (429). Please wait a few minutes before retrying. "
+                    f"Original error: {error_msg}"
+                )
+            raise
+
+        summary = result["summary"]
+        response: Dict[str, Any] = {
+            "startTime": start_time_str,
+            "endTime": end_time_str,
+            "totalCalls": summary["calls"],
+            "totalMinutes": round(summary["totalDuration"] / 60.0, 2),
         }
+        for key, dim in sides:
+            groups = result["groups"][dim]
+            if dimension == "country":
+                for group in groups:
+                    group["name"] = country_name(group["key"])
+            response[key] = groups
+        return response
 
     async def get_call_statistics(
         self,
@@ -2121,14 +3176,24 @@ class WebexClient:
         end_time: str,
         location_id: Optional[str] = None,
         group_by: Optional[str] = None,
+        person_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get detailed call statistics with grouping"""
+        """Get detailed call statistics with grouping
+
+        ``group_by`` is one dimension or a comma-separated list (user,
+        location, queue, direction, hour, area_code, state, ...). If the
+        statistics endpoint is unavailable, the statistics are computed
+        locally from call detail records, every dimension in a single pass
+        (see :mod:`mcp_webexcalling.cdr_aggregate`).
+        """
         params = {
             "startTime": start_time,
             "endTime": end_time,
         }
         if location_id:
             params["locationId"] = location_id
+        if person_id:
+            params["personId"] = person_id
         if group_by:
             params["groupBy"] = group_by
 
@@ -2137,28 +3202,35 @@ class WebexClient:
             return response.get("statistics", {})
         except Exception:
             # Fallback: calculate from call detail records
-            call_records = await self.get_call_detail_records(
+            dimensions = parse_dimensions(group_by)
+            async with self._cdr_scope(
                 start_time=start_time,
                 end_time=end_time,
                 location_id=location_id,
+                person_id=person_id,
                 max_results=1000
-            )
-            return {
-                "totalCalls": len(call_records),
-                "calls": call_records[:100]
-            }
+            ) as (store, scope):
+                result = aggregate(store, dimensions, **scope)
+                return {
+                    "source": "callDetailRecords",
+                    "totalCalls": result["summary"]["calls"],
+                    **result,
+                    "calls": store.records_between(limit=100, **scope)
+                }
 
     async def get_user_call_statistics(
         self,
         person_id: str,
         start_time: str,
         end_time: str,
+        group_by: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get call statistics for a specific user"""
         return await self.get_call_statistics(
             start_time=start_time,
             end_time=end_time,
-            group_by="user",
+            group_by=group_by or "user",
+            person_id=person_id,
         )
 
     # ========== Webhook & Event Management ==========
@@ -0,0 +1,251 @@
+"""Local receiver for webhook events, used to keep caches fresh.
+
+With ``WEBEX_WEBHOOK_ENABLED=true`` the server listens on
+``WEBEX_WEBHOOK_HOST:WEBEX_WEBHOOK_PORT`` (a plain ``asyncio`` HTTP/1.1
+listener; put it behind a tunnel or reverse proxy if the sender is remote)
+and accepts notifications POSTed to ``WEBEX_WEBHOOK_PATH``, signed with
+``WEBEX_WEBHOOK_SECRET``.
+
+Every request must carry a valid ``X-Spark-Signature`` header — the HMAC-SHA1
+of the raw body keyed with the webhook secret — or it is rejected with 401.
+
+Only directory change notices posted by your own tooling keep the cache
+fresh. Webex has no webhooks for people, devices, locations, call queues,
+hunt groups or numbers. The resources it does emit (``telephony_calls``,
+``telephony_mwi``, ``convergedRecordings``, ``messages``, ``meetings``, ...)
+concern real-time data this server never caches (see
+:data:`~mcp_webexcalling.cache.DEFAULT_TTLS`), so Webex events are
+acknowledged and counted as ignored.
+
+Your provisioning tooling (a SCIM bridge, onboarding scripts, a relay of
+Control Hub admin audit events) POSTs notices in the Webex webhook envelope
+(``{"resource", "event", "data": {...}}``), signed with the same secret, with
+``resource`` set to ``people``, ``devices``, ``locations``, ``callQueues``,
+``huntGroups`` or ``numbers``, ``event`` to ``created``/``updated``/``deleted``
+and ``data.id`` to the object ID. The cache drops that object and the
+collections containing it. The directory index re-reads a created/updated
+object and swaps it in, or drops a deleted one. Number changes, which can't
+be applied piecemeal, schedule a background refresh.
+
+With changes pushed this way, the cache TTLs (``WEBEX_CACHE_TTLS``) and
+directory max age can be raised well above their polling-friendly defaults.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("mcp_webexcalling")
+
+# Largest request body accepted; webhook notifications are a few KB.
+_MAX_BODY_BYTES = 1 << 20
+
+# Directory change notices (sent by your own tooling, not by Webex; see the
+# module docstring): resource -> (API collection path, directory collection).
+_DIRECTORY_RESOURCES: Dict[str, Tuple[str, str]] = {
+    "people": ("/people", "people"),
+    "devices": ("/devices", "devices"),
+    "locations": ("/locations", "locations"),
+    "callqueues": ("/telephony/config/queues", "call_queues"),
+    "huntgroups": ("/telephony/config/huntGroups", "hunt_groups"),
+    "numbers": ("/telephony/config/numbers", "numbers"),
+}
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Return the ``X-Spark-Signature`` value for ``body``."""
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha1).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Whether ``signature`` is the HMAC-SHA1 of ``body`` under ``secret``."""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body), signature.strip().lower())
+
+
+class WebhookReceiver:
+    """Minimal HTTP listener turning webhook events into cache invalidations.
+
+    Args:
+        client: The :class:`WebexClient` whose cache and directory to update.
+        secret: Shared webhook secret used to verify signatures.
+        host: Interface to listen on.
+        port: TCP port (0 picks a free one; see :attr:`port` after start).
+        path: URL path events are POSTed to.
+    """
+
+    def __init__(
+        self, client: Any, secret: str, host: str = "127.0.0.1", port: int = 8765,
+        path: str = "/webex/events",
+    ):
+        if not secret:
+            raise ValueError(
+                "A webhook secret is required; set WEBEX_WEBHOOK_SECRET and use "
+                "the same secret when creating the webhook"
+            )
+        self.client = client
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.received = 0
+        self.rejected = 0
+        self.invalidations = 0
+        self.directory_updates = 0
+        self.ignored = 0
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Webhook receiver listening on http://%s:%d%s", self.host, self.port, self.path)
+
+    async def stop(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    # ------------------------------------------------------------------ #
+    # HTTP
+    # ------------------------------------------------------------------ #
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        event = None
+        try:
+            status, event = await self._read_request(reader)
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                "Content-Length: 0\r\nConnection: close\r\n\r\n".encode("ascii")
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+            logger.debug("Dropping malformed webhook request: %s", e)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+        # Acknowledge first (Webex expects a prompt 2xx), then do the work.
+        if event is not None:
+            try:
+                await self.handle_event(event)
+            except Exception as e:
+                logger.warning("Failed to apply webhook event: %s", e)
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if len(request_line) < 2:
+            raise ValueError("bad request line")
+        method, target = request_line[0], request_line[1]
+        if target.split("?", 1)[0] != self.path:
+            return 404, None
+        if method != "POST":
+            return 405, None
+        length = int(headers.get("content-length") or 0)
+        if length > _MAX_BODY_BYTES:
+            return 413, None
+        body = await reader.readexactly(length)
+        if not verify_signature(self.secret, body, headers.get("x-spark-signature")):
+            self.rejected += 1
+            logger.warning("Rejected webhook request with a missing or bad signature")
+            return 401, None
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400, None
+        if not isinstance(event, dict):
+            return 400, None
+        return 200, event
+
+    # ------------------------------------------------------------------ #
+    # Events
+    # ------------------------------------------------------------------ #
+    async def handle_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one (already verified) webhook notification.
+
+        Returns a summary of what was invalidated/updated.
+        """
+        self.received += 1
+        resource = str(event.get("resource") or "")
+        action = str(event.get("event") or "").lower()
+        data = event.get("data") if isinstance(event.get("data"), dict) else {}
+        key = resource.lower()
+        summary: Dict[str, Any] = {"resource": resource, "event": action}
+
+        if key not in _DIRECTORY_RESOURCES:
+            self.ignored += 1
+            summary["ignored"] = True
+            return summary
+
+        path, collection = _DIRECTORY_RESOURCES[key]
+        item_id = data.get("id")
+        summary["id"] = item_id
+        cache = self.client.cache
+        if cache is not None:
+            removed = cache.invalidate_path(f"{path}/{item_id}" if item_id else path)
+            self.invalidations += removed
+            summary["cacheInvalidations"] = removed
+        directory = self.client.directory
+        if directory is not None and directory.ready:
+            summary["directory"] = await self._update_directory(
+                directory, collection, path, action, item_id
+            )
+        return summary
+
+    async def _update_directory(
+        self, directory: Any, collection: str, path: str, action: str, item_id: Optional[str]
+    ) -> str:
+        if collection == "numbers" or not item_id:
+            directory.refresh_in_background(self.client)
+            return "refreshScheduled"
+        if action == "deleted":
+            directory.apply_change(collection, item_id)
+            self.directory_updates += 1
+            return "removed"
+        params = {"callingData": "true"} if collection == "people" else None
+        try:
+            item = await self.client._request("GET", f"{path}/{item_id}", params=params)
+        except Exception as e:
+            logger.info("Could not re-read %s/%s after event (%s); refreshing", path, item_id, e)
+            directory.refresh_in_background(self.client)
+            return "refreshScheduled"
+        if isinstance(item, dict):
+            item.setdefault("id", item_id)
+            directory.apply_change(collection, item_id, item)
+            self.directory_updates += 1
+        return "updated"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "url": f"http://{self.host}:{self.port}{self.path}" if self.running else None,
+            "received": self.received,
+            "rejected": self.rejected,
+            "ignored": self.ignored,
+            "cacheInvalidations": self.invalidations,
+            "directoryUpdates": self.directory_updates,
+        }
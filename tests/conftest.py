@@ -0,0 +1,28 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from mcp_webexcalling import config, server
+
+from tests.test_webex_client import make_client
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state_dir(monkeypatch, tmp_path):
+    """Keep persisted client state out of the real user cache directory."""
+    monkeypatch.setenv("WEBEX_STATE_DIR", str(tmp_path / "state"))
+    config.reset_settings_cache()
+    yield
+    config.reset_settings_cache()
+
+
+@pytest.fixture
+def mock_server_client(monkeypatch):
+    """Install a mock-transport WebexClient as the server's shared client."""
+
+    def install(handler):
+        client = make_client(handler)
+        monkeypatch.setattr(server, "webex_client", client)
+        return client
+
+    return install
@@ -0,0 +1,47 @@
+"""Tests for the area-code lookup table and batch classifier."""
+
+import pytest
+
+from mcp_webexcalling.area_codes import (
+    AREA_CODE_TO_STATE,
+    STATE_NAMES,
+    classify_numbers,
+    extract_area_code,
+    state_for_area_code,
+    state_for_number,
+)
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        ("+17045550100", "704"),
+        ("1-704-555-0100", "704"),
+        ("(704) 555.0100", "704"),
+        ("17045550100", "704"),
+        ("7045550100", "704"),
+        ("+442071234567", None),
+        ("+1", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_extract_area_code(number, expected):
+    assert extract_area_code(number) == expected
+
+
+def test_lookup_table_agrees_with_mapping():
+    for area_code, state in AREA_CODE_TO_STATE.items():
+        assert state_for_area_code(area_code) == state
+    assert state_for_area_code("000") is None
+    assert state_for_area_code(None) is None
+
+
+def test_classify_numbers_buckets_every_state_in_one_pass():
+    numbers = ["+17045550100", "+14155550100", "+442071234567", None, "+13365550199"]
+    ids = classify_numbers(numbers)
+    assert len(ids) == len(numbers)
+    assert [STATE_NAMES[i] for i in ids] == [
+        "North Carolina", "California", None, None, "North Carolina",
+    ]
+    assert state_for_number("+14155550100") == "California"
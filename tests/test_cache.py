@@ -0,0 +1,130 @@
+"""Tests for the TTL + LRU response cache and its WebexClient integration."""
+
+import httpx
+import pytest
+
+from mcp_webexcalling.cache import ResponseCache
+from mcp_webexcalling.webex_client import WebexClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_family_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"/locations": 10}, clock=clock)
+    cache.set("k", "/locations/L1", {"id": "L1"})
+    assert cache.get("k") == {"id": "L1"}
+    clock.now = 11
+    assert cache.get("k") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_zero_ttl_families_are_never_stored():
+    cache = ResponseCache()
+    assert cache.ttl_for("/telephony/calls/metrics") == 0
+    cache.set("k", "/cdr_feed", [1, 2, 3])
+    assert len(cache) == 0
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "/people/a", 1)
+    cache.set("b", "/people/b", 2)
+    cache.get("a")
+    cache.set("c", "/people/c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_write_invalidates_resource_children_parents_and_aliases():
+    cache = ResponseCache()
+    cache.set("queue", "/telephony/config/queues/Q1", {})
+    cache.set("queue-list", "/telephony/config/queues", [])
+    cache.set("other-queue", "/telephony/config/queues/Q2", {})
+    cache.set("person", "/people/P1", {})
+    cache.set("licenses", "/people/P1/licenses", [])
+
+    assert cache.invalidate_path("/telephony/config/queues/Q1") == 2
+    assert cache.get("other-queue") == {}
+
+    # Telephony person config and /people address the same resource.
+    assert cache.invalidate_path("/telephony/config/people/P1") == 2
+
+
+@pytest.mark.asyncio
+async def test_client_serves_repeat_reads_from_cache_until_write():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.method == "GET":
+            return httpx.Response(200, json={"id": "Q1", "name": "Support", "agents": []})
+        return httpx.Response(200, json={})
+
+    client = WebexClient(access_token="t", retry_backoff=0.0, cache_enabled=True)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    first = await client.get_call_queue_details("Q1")
+    first["agents"].append({"personId": "mutated"})  # must not poison the cache
+    second = await client.get_call_queue_details("Q1")
+    assert second["agents"] == []
+    assert len(calls) == 1
+
+    await client.update_call_queue("Q1", name="Sales")
+    await client.get_call_queue_details("Q1")
+    assert [m for m, _ in calls] == ["GET", "PUT", "GET"]
+
+    stats = client.get_client_stats()["cache"]
+    assert stats["enabled"] is True
+    assert stats["hits"] == 2  # second read + the read inside update_call_queue
+    assert stats["invalidations"] >= 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_etag():
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"id": "L1", "name": "HQ"}, headers={"ETag": '"v1"'})
+
+    clock = FakeClock()
+    client = WebexClient(access_token="t", retry_backoff=0.0, cache_enabled=True)
+    client.cache = ResponseCache(clock=clock)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert (await client.get_location_details("L1"))["name"] == "HQ"
+    clock.now += 10 ** 4  # well past the /locations TTL
+    assert (await client.get_location_details("L1"))["name"] == "HQ"
+    assert seen_headers == [None, '"v1"']
+
+    # The 304 refreshed the entry, so the next read is a plain hit.
+    await client.get_location_details("L1")
+    assert len(seen_headers) == 2
+    stats = client.cache.stats()
+    assert stats["revalidations"] == 1
+    assert stats["hits"] == 2
+    await client.aclose()
+
+
+def test_expired_entries_without_validators_are_dropped():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.set("plain", "/locations/L1", {})
+    cache.set("tagged", "/locations/L2", {}, etag='"x"')
+    clock.now += 10 ** 4
+    assert cache.get("plain") is None
+    assert cache.get("tagged") is None
+    assert len(cache) == 1
+    assert cache.conditional_headers("tagged") == {"If-None-Match": '"x"'}
@@ -0,0 +1,143 @@
+"""Tests for the single-pass CDR group-by engine."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from mcp_webexcalling.cdr_aggregate import aggregate, parse_dimensions
+from mcp_webexcalling.cdr_batch import CdrBatch
+from mcp_webexcalling.cdr_store import CdrStore
+
+from tests.test_cdr_batch import RECORDS
+from tests.test_webex_client import make_client
+
+
+def test_parse_dimensions_normalises_and_validates():
+    assert parse_dimensions("User, hour-of-day,areaCode,user") == ["user", "hour", "area_code"]
+    assert parse_dimensions(None) == []
+    with pytest.raises(ValueError, match="Unknown group_by"):
+        parse_dimensions("weather")
+
+
+def test_duration_percentiles_cover_answered_calls_only():
+    records = [
+        {"Report ID": str(i), "Duration": 300 + i, "Answered": "true", "Location": "HQ"}
+        for i in range(40)
+    ] + [
+        {"Report ID": f"m{i}", "Duration": 0, "Answered": "false", "Location": "HQ",
+         "Queue time": 20}
+        for i in range(60)
+    ]
+    result = aggregate(CdrBatch.from_records(records), "location")
+    summary = result["summary"]
+    assert summary["calls"] == 100 and summary["answeredCalls"] == 40
+    # Most calls were missed, yet the percentiles reflect talk time.
+    assert summary["durationPercentiles"]["p50"] == pytest.approx(320, rel=0.03)
+    assert summary["durationPercentiles"]["p95"] == pytest.approx(338, rel=0.03)
+    [hq] = result["groups"]["location"]
+    assert hq["durationPercentiles"] == summary["durationPercentiles"]
+    # Missed calls still count towards wait times.
+    assert summary["waitTimePercentiles"]["p50"] == pytest.approx(20, rel=0.03)
+
+    assert aggregate(CdrBatch.from_records(records[40:]))["summary"]["durationPercentiles"] is None
+
+
+@pytest.mark.parametrize("make_source", [
+    lambda: CdrBatch.from_records(RECORDS),
+    lambda: _store(RECORDS),
+])
+def test_aggregate_groups_every_dimension_in_one_pass(make_source):
+    result = aggregate(make_source(), "location,hour,state,direction")
+
+    assert result["summary"]["calls"] == 4
+    assert result["summary"]["totalDuration"] == 165
+    assert result["summary"]["answeredCalls"] == 3
+    assert result["summary"]["minDuration"] == 0
+    assert result["summary"]["maxDuration"] == 120
+
+    by_location = {g["key"]: g for g in result["groups"]["location"]}
+    assert by_location["HQ"]["calls"] == 2
+    assert by_location["HQ"]["averageDuration"] == 75.0
+    assert by_location["loc-2"]["answerRate"] == 0.0
+    assert by_location["unknown"]["calls"] == 1
+
+    by_hour = {g["key"]: g["calls"] for g in result["groups"]["hour"]}
+    assert by_hour == {10: 1, 11: 1, 12: 1, "unknown": 1}
+
+    by_state = {g["key"]: g["calls"] for g in result["groups"]["state"]}
+    assert by_state["North Carolina"] == 2
+    # Largest group first.
+    assert result["groups"]["state"][0]["key"] == "North Carolina"
+
+
+def _store(records):
+    store = CdrStore()
+    store.add_records(records)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_call_statistics_fallback_groups_locally():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    records = [
+        {"Report ID": "a", "Start time": recent, "Duration": 60, "User UUID": "p1",
+         "Direction": "ORIGINATING"},
+        {"Report ID": "b", "Start time": recent, "Duration": 0, "User UUID": "p2",
+         "Direction": "TERMINATING"},
+    ]
+
+    def handler(request):
+        if request.url.path.endswith("/telephony/calls/statistics"):
+            return httpx.Response(404, json={"message": "not found"})
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        return httpx.Response(200, json={"items": records})
+
+    client = make_client(handler)
+    start = (now - timedelta(hours=3)).isoformat()
+    end = (now - timedelta(hours=1)).isoformat()
+
+    stats = await client.get_call_statistics(start, end, group_by="user,direction")
+    assert stats["totalCalls"] == 2
+    assert {g["key"] for g in stats["groups"]["user"]} == {"p1", "p2"}
+    assert len(stats["calls"]) == 2
+
+    user_stats = await client.get_user_call_statistics("p1", start, end, group_by="direction")
+    assert user_stats["totalCalls"] == 1
+    assert user_stats["groups"]["direction"][0]["key"] == "ORIGINATING"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_queue_analytics_reports_percentiles():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    records = [
+        {"Report ID": str(i), "Start time": recent, "Duration": 10 * (i + 1),
+         "Ring duration": i, "queueId": "q1" if i < 100 else "q2"}
+        for i in range(120)
+    ]
+
+    def handler(request):
+        if request.url.path.endswith("/telephony/config/queues/q1"):
+            return httpx.Response(200, json={"name": "Support"})
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        return httpx.Response(200, json={"items": records})
+
+    client = make_client(handler)
+    start = (now - timedelta(hours=3)).isoformat()
+    end = (now - timedelta(hours=1)).isoformat()
+    result = await client.get_queue_analytics("q1", start, end)
+
+    assert result["queueName"] == "Support"
+    assert result["totalCalls"] == 100
+    assert result["durationPercentiles"]["p50"] == pytest.approx(500, rel=0.02)
+    assert result["waitTimePercentiles"]["p99"] == pytest.approx(98, rel=0.02)
+
+    analytics = await client.get_call_analytics(start, end)
+    assert analytics["totalCalls"] == 120
+    assert analytics["durationPercentiles"]["p95"] == pytest.approx(1140, rel=0.02)
+    await client.aclose()
@@ -0,0 +1,97 @@
+"""Tests for the columnar in-memory CDR batch."""
+
+import pytest
+
+from mcp_webexcalling.cdr_batch import CdrBatch
+from mcp_webexcalling.cdr_store import CdrStore, parse_cdr_time
+
+
+RECORDS = [
+    {"Report ID": "a", "Start time": "2024-05-01T10:00:00.000Z", "Duration": 120,
+     "Location": "HQ", "Direction": "ORIGINATING",
+     "Calling number": "+13365550100", "Called number": "+14155550100"},
+    {"Report ID": "b", "Start time": "2024-05-01T11:00:00.000Z", "Duration": 0,
+     "Site UUID": "loc-2", "Direction": "TERMINATING",
+     "Calling number": "+14155550101", "Called number": "+17045550100"},
+    {"Report ID": "c", "Start time": "2024-05-01T12:00:00.000Z", "Duration": 30,
+     "Location": "HQ", "User UUID": "p1", "queueId": "q1",
+     "Calling number": "+13365550102", "Called number": "+13365550103"},
+    {"Report ID": "d", "Duration": 15},
+]
+
+
+def _ids(rows):
+    return [r["Report ID"] for r in rows]
+
+
+@pytest.fixture
+def both():
+    store = CdrStore()
+    store.add_records(RECORDS)
+    yield CdrBatch.from_records(RECORDS, keep_raw=True), store
+    store.close()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"location": "HQ"},
+        {"location": "loc-2"},
+        {"person_id": "p1"},
+        {"queue_id": "q1"},
+        {"location": "nowhere"},
+        {"start_ms": parse_cdr_time("2024-05-01T10:30:00Z"),
+         "end_ms": parse_cdr_time("2024-05-01T12:00:00Z")},
+    ],
+)
+def test_batch_matches_sql_store(both, filters):
+    batch, store = both
+    assert batch.count(**filters) == store.count(**filters)
+    assert batch.duration_totals(**filters) == store.duration_totals(**filters)
+    assert sorted(_ids(batch.records_between(**filters))) == sorted(
+        _ids(store.records_between(**filters))
+    )
+    assert batch.state_totals(**filters) == store.state_totals(**filters)
+    codes = ["336", "704"]
+    assert batch.area_code_totals(codes, **filters) == store.area_code_totals(codes, **filters)
+    for column in ("called", "calling"):
+        assert sorted(_ids(batch.area_code_records(codes, column, **filters))) == sorted(
+            _ids(store.area_code_records(codes, column, **filters))
+        )
+
+
+def test_batch_without_raw_is_compact():
+    records = [
+        dict(RECORDS[0], **{"Report ID": str(i)}) for i in range(1000)
+    ]
+    batch = CdrBatch.from_records(records)
+    assert len(batch) == 1000
+    assert batch.records_between() == []
+    assert batch.duration_totals() == (1000, 120000)
+    # Typed columns cost tens of bytes per record, not a dict per record.
+    assert batch.nbytes() < 50 * len(batch)
+    assert len(batch.locations.values) == 2
+
+
+def test_sampled_batch_keeps_only_the_detail_rows():
+    records = [
+        {"Report ID": str(i), "Start time": "2024-05-01T10:00:00.000Z",
+         "Duration": 0 if i % 3 else 60, "queueId": "q1" if i % 50 == 0 else None,
+         "Calling number": "+13365550100" if i % 7 else "+17045550100",
+         "Called number": "+14155550100"}
+        for i in range(20000)
+    ]
+    batch = CdrBatch.from_records(records, sample_size=100)
+    full = CdrBatch.from_records(records, keep_raw=True)
+    assert len(batch) == 20000
+    assert batch.raw_count() < 1000
+    for filters in ({}, {"answered_only": True}, {"queue_id": "q1"},
+                    {"queue_id": "q1", "answered_only": True}):
+        assert _ids(batch.records_between(limit=100, **filters)) == _ids(
+            full.records_between(limit=100, **filters)
+        )
+    for column in ("calling", "called"):
+        assert _ids(batch.area_code_records(["704"], column)) == _ids(
+            full.area_code_records(["704"], column)
+        )
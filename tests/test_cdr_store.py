@@ -0,0 +1,168 @@
+"""Tests for the local CDR store and its incremental sync engine."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from mcp_webexcalling.cdr_store import CdrStore, parse_cdr_time
+from mcp_webexcalling.cdr_sync import CdrSyncEngine
+
+from tests.test_webex_client import make_client
+
+
+def _cdr(report_id, start, **extra):
+    record = {"Report ID": report_id, "Start time": start, "Duration": 60}
+    record.update(extra)
+    return record
+
+
+def test_store_dedupes_and_queries_by_time():
+    store = CdrStore()
+    added = store.add_records([
+        _cdr("a", "2024-05-01T10:00:00.000Z"),
+        _cdr("b", "2024-05-01T11:00:00.000Z"),
+        _cdr("a", "2024-05-01T10:00:00.000Z"),
+    ])
+    assert added == 2
+    assert store.add_records([_cdr("b", "2024-05-01T11:00:00.000Z")]) == 0
+
+    start = parse_cdr_time("2024-05-01T10:30:00Z")
+    end = parse_cdr_time("2024-05-01T12:00:00Z")
+    assert [r["Report ID"] for r in store.records_between(start, end)] == ["b"]
+
+
+def test_store_tracks_covered_intervals_and_prunes():
+    store = CdrStore()
+    store.mark_covered(0, 100)
+    store.mark_covered(100, 200)
+    store.mark_covered(300, 400)
+    assert store.covered_intervals() == [(0, 200), (300, 400)]
+    assert store.covers(50, 150)
+    assert not store.covers(150, 350)
+    assert store.high_water_mark == 400
+
+    store.prune_before(150)
+    assert store.covered_intervals() == [(150, 200), (300, 400)]
+
+
+def _feed_handler(records, calls):
+    def handler(request):
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        calls.append(dict(request.url.params))
+        return httpx.Response(200, json={"items": list(records)})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_sync_advances_high_water_mark_incrementally():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    calls = []
+    client = make_client(_feed_handler([_cdr("a", recent)], calls))
+    store = CdrStore()
+    engine = CdrSyncEngine(client, store)
+
+    first = await engine.sync_once()
+    assert first["added"] == 1
+    assert store.high_water_mark is not None
+
+    second = await engine.sync_once()
+    assert second["added"] == 0
+    # The second pass only re-reads the overlap, not the whole 48 hours.
+    first_start = parse_cdr_time(calls[0]["startTime"])
+    second_start = parse_cdr_time(calls[-1]["startTime"])
+    assert second_start - first_start > timedelta(hours=40).total_seconds() * 1000
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_statistics_are_served_from_the_store(monkeypatch):
+    monkeypatch.setenv("WEBEX_CDR_STORE_ENABLED", "true")
+    monkeypatch.setenv("WEBEX_CDR_STORE_PATH", ":memory:")
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    calls = []
+    client = make_client(_feed_handler([_cdr("a", recent, Answered="true")], calls))
+    assert client.cdr_sync is not None
+
+    first = await client.get_call_statistics_from_cdr()
+    fetches = len(calls)
+    second = await client.get_call_statistics_from_cdr()
+
+    for stats in (first, second):
+        stats.pop("startTime", None)
+        stats.pop("endTime", None)
+    assert first == second
+    assert fetches >= 1
+    assert len(calls) == fetches
+    assert client.get_client_stats()["cdrSync"]["store"]["records"] == 1
+    await client.aclose()
+
+
+def test_store_normalizes_and_aggregates_in_sql():
+    store = CdrStore()
+    store.add_records([
+        _cdr("a", "2024-05-01T10:00:00.000Z", Duration=120, Location="HQ",
+             **{"Calling number": "+19195550100", "Called number": "+14155550100"}),
+        _cdr("b", "2024-05-01T11:00:00.000Z", Duration=0, Location="HQ",
+             **{"Calling number": "+14155550101", "Called number": "+17045550100"}),
+        _cdr("c", "2024-05-01T12:00:00.000Z", Duration=30, Location="Branch",
+             **{"User UUID": "p1", "Calling number": "+19195550102",
+                "Called number": "+19195550103"}),
+    ])
+
+    assert store.duration_totals() == (3 - 1, 150)
+    assert store.duration_totals(location="HQ") == (1, 120)
+    assert store.duration_totals(person_id="p1") == (1, 30)
+    assert store.count(location="HQ") == 2
+
+    nc = store.area_code_totals(["919", "704"])
+    assert nc == {"callsTo": 2, "secondsTo": 30, "callsFrom": 2, "secondsFrom": 150}
+    called = store.area_code_records(["919", "704"], "called")
+    assert [r["Report ID"] for r in called] == ["b", "c"]
+
+
+def test_old_schema_is_rebuilt(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "cdr.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE cdrs (key TEXT PRIMARY KEY, start_ms INTEGER, raw TEXT NOT NULL);"
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        "INSERT INTO meta VALUES ('covered', '[[0, 100]]');"
+    )
+    conn.commit()
+    conn.close()
+
+    store = CdrStore(path)
+    assert store.covered_intervals() == []
+    assert store.add_records([_cdr("a", "2024-05-01T10:00:00.000Z")]) == 1
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_state_statistics_without_local_store():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    records = [
+        _cdr("a", recent, Duration=90, **{"Called number": "+13365550100",
+                                         "Calling number": "+14155550100"}),
+        _cdr("b", recent, Duration=60, **{"Called number": "+14155550101",
+                                         "Calling number": "+17045550100"}),
+    ]
+    client = make_client(_feed_handler(records, []))
+
+    stats = await client.get_call_statistics_by_state("NC")
+    assert stats["callsToState"] == 1
+    assert stats["callsFromState"] == 1
+    assert stats["totalSeconds"] == 150
+    assert [c["Report ID"] for c in stats["calls"]] == ["a", "b"]
+
+    to_only = await client.get_call_statistics_by_state("NC", direction="to")
+    assert to_only["totalCalls"] == 1
+    assert to_only["minutesToState"] == 1.5
+    await client.aclose()
@@ -0,0 +1,197 @@
+"""Tests for budgeted list pages and continuation cursors."""
+
+import json
+
+import pytest
+
+from mcp_webexcalling import server
+from mcp_webexcalling.cursors import CursorStore
+
+from tests.test_webex_client import _paged_handler
+
+
+async def _numbers(n):
+    for i in range(n):
+        yield {"id": i, "name": "x" * 20}
+
+
+@pytest.mark.asyncio
+async def test_row_budget_resumes_where_the_previous_page_stopped():
+    store = CursorStore()
+    page = await store.read_page(_numbers(5), max_rows=2)
+    assert [i["id"] for i in page["items"]] == [0, 1]
+    page = await store.read_page(cursor=page["nextCursor"], max_rows=2)
+    assert [i["id"] for i in page["items"]] == [2, 3]
+    page = await store.read_page(cursor=page["nextCursor"], max_rows=2)
+    assert [i["id"] for i in page["items"]] == [4]
+    assert page["nextCursor"] is None
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_resuming_with_only_the_cursor_keeps_the_page_budget():
+    store = CursorStore()
+    page = await store.read_page(_numbers(1000), max_rows=10)
+    page = await store.read_page(cursor=page["nextCursor"])
+    assert [i["id"] for i in page["items"]] == list(range(10, 20))
+    # An explicit budget on a later call replaces the saved one.
+    page = await store.read_page(cursor=page["nextCursor"], max_rows=3)
+    page = await store.read_page(cursor=page["nextCursor"])
+    assert [i["id"] for i in page["items"]] == [23, 24, 25]
+
+    item_size = len(json.dumps({"id": 100, "name": "x" * 20}, separators=(",", ":")))
+    page = await store.read_page(_numbers(1000), max_bytes=3 * item_size + 4)
+    page = await store.read_page(cursor=page["nextCursor"])
+    assert page["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_keeps_the_overflowing_item_for_the_next_page():
+    store = CursorStore()
+    item_size = len(json.dumps({"id": 0, "name": "x" * 20}, separators=(",", ":")))
+    page = await store.read_page(_numbers(5), max_bytes=2 * item_size + 10)
+    assert page["count"] == 2
+    assert len(json.dumps(page["items"], separators=(",", ":"))) <= 2 * item_size + 10
+    page = await store.read_page(cursor=page["nextCursor"], max_bytes=1)
+    # At least one item per page, even over budget.
+    assert [i["id"] for i in page["items"]] == [2]
+
+
+@pytest.mark.asyncio
+async def test_unknown_expired_and_evicted_cursors_are_rejected():
+    store = CursorStore(ttl=0.0)
+    page = await store.read_page(_numbers(5), max_rows=1)
+    with pytest.raises(ValueError, match="Unknown or expired cursor"):
+        await store.read_page(cursor=page["nextCursor"])
+
+    store = CursorStore(max_cursors=1)
+    first = await store.read_page(_numbers(5), max_rows=1)
+    await store.read_page(_numbers(5), max_rows=1)
+    with pytest.raises(ValueError):
+        await store.read_page(cursor=first["nextCursor"])
+    assert store.stats()["expiredCursors"] == 1
+
+
+class _PageFailed(Exception):
+    resume_url = "page-2"
+
+
+async def _failing_after(n, resumed):
+    for i in range(n):
+        yield {"id": i}
+    resumed.append(None)
+    raise _PageFailed("page 2 failed")
+
+
+@pytest.mark.asyncio
+async def test_a_failed_page_keeps_the_cursor_for_a_retry():
+    resumes = []
+
+    def resume(resume_url, taken):
+        resumes.append((resume_url, taken))
+        return _numbers(5) if len(resumes) > 1 else _failing_after(0, [])
+
+    store = CursorStore()
+    page = await store.read_page(_failing_after(2, []), max_rows=2, resume=resume)
+    assert [i["id"] for i in page["items"]] == [0, 1]
+    # The next page fails before any item: the error propagates, the cursor stays.
+    cursor = page["nextCursor"]
+    with pytest.raises(_PageFailed):
+        await store.read_page(cursor=cursor)
+    # The retry resumes again (and fails once more, after nothing) ...
+    with pytest.raises(_PageFailed):
+        await store.read_page(cursor=cursor)
+    # ... then succeeds from the failed page.
+    page = await store.read_page(cursor=cursor)
+    assert [i["id"] for i in page["items"]] == [0, 1]
+    assert resumes == [("page-2", 2), ("page-2", 2)]
+
+    # Without a way to resume, the partial page is returned with the error.
+    page = await store.read_page(_failing_after(1, []), max_rows=5)
+    assert page["items"] == [{"id": 0}] and page["nextCursor"] is None
+    assert page["error"] == "page 2 failed"
+
+
+@pytest.mark.asyncio
+async def test_budgets_below_one_are_rejected():
+    store = CursorStore()
+    for budget in ({"max_rows": 0}, {"max_bytes": 0}, {"max_rows": -1}):
+        with pytest.raises(ValueError, match="at least 1"):
+            await store.read_page(_numbers(5), **budget)
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_dropped_cursors_close_their_iterators():
+    closed = []
+
+    async def crawl():
+        try:
+            for i in range(10):
+                yield {"id": i}
+        finally:
+            closed.append(True)
+
+    store = CursorStore(max_cursors=1)
+    await store.read_page(crawl(), max_rows=1)
+    await store.read_page(crawl(), max_rows=1)
+    assert closed == [True]
+
+    store = CursorStore(ttl=0.0)
+    await store.read_page(crawl(), max_rows=1)
+    await store.read_page(_numbers(1), max_rows=1)
+    assert closed == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_list_users_resumes_after_a_failed_pagination_hop(mock_server_client):
+    handler, state = _paged_handler([[1, 2, 3], [4, 5, 6], [7]], fail_on=2, failures=100)
+    client = mock_server_client(handler)
+
+    [content] = await server.call_tool("list_users", {"page_size": 2})
+    page = json.loads(content.text)
+    [content] = await server.call_tool("list_users", {"cursor": page["nextCursor"]})
+    page = json.loads(content.text)
+    # Page 2 failed after retries: item 3 (already read) comes back with the error.
+    assert [u["id"] for u in page["items"]] == [3] and "error" in page
+
+    state["failures"] = 100  # page 2 recovers
+    ids = []
+    while page["nextCursor"]:
+        [content] = await server.call_tool("list_users", {"cursor": page["nextCursor"]})
+        page = json.loads(content.text)
+        ids += [u["id"] for u in page["items"]]
+    assert ids == [4, 5, 6, 7]
+    # Page 1 was never fetched again.
+    assert state["calls"].count(1) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_users_pages_without_refetching(mock_server_client):
+    handler, state = _paged_handler([[1, 2, 3], [4, 5, 6], [7]])
+    client = mock_server_client(handler)
+
+    [content] = await server.call_tool("list_users", {"page_size": 2})
+    page = json.loads(content.text)
+    assert [u["id"] for u in page["items"]] == [1, 2]
+    assert state["calls"] == [1]
+
+    ids = [u["id"] for u in page["items"]]
+    while page["nextCursor"]:
+        # The cursor alone carries on with the original page size.
+        [content] = await server.call_tool("list_users", {"cursor": page["nextCursor"]})
+        page = json.loads(content.text)
+        assert page["count"] <= 2
+        ids += [u["id"] for u in page["items"]]
+    assert ids == [1, 2, 3, 4, 5, 6, 7]
+    # Each API page was requested exactly once across all the tool calls.
+    assert state["calls"] == [1, 2, 3]
+
+    # Without a budget the tool still returns a plain list.
+    [content] = await server.call_tool("list_users", {"max_results": 2})
+    assert [u["id"] for u in json.loads(content.text)] == [1, 2]
+
+    [content] = await server.call_tool("list_users", {"cursor": "nope"})
+    assert "Unknown or expired cursor" in content.text
+    await client.aclose()
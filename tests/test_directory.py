@@ -0,0 +1,251 @@
+"""Tests for the in-memory directory index."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mcp_webexcalling.directory import (
+    COLLECTIONS,
+    DirectoryIndex,
+    read_snapshot_file,
+    write_snapshot_file,
+)
+
+from tests.test_webex_client import make_client
+
+
+SNAPSHOT = {
+    "people": [
+        {"id": "p1", "displayName": "Ada Lovelace", "emails": ["Ada@Example.com"],
+         "extension": "1001", "locationId": "loc1",
+         "phoneNumbers": [{"type": "work", "value": "+1 (415) 555-0100"}]},
+        {"id": "p2", "displayName": "Bob Smith", "emails": ["bob@example.com"],
+         "extension": "1001", "locationId": "loc2"},
+    ],
+    "locations": [{"id": "loc1", "name": "HQ"}, {"id": "loc2", "name": "Raleigh"}],
+    "numbers": [
+        {"phoneNumber": "+19195550100", "extension": "2000",
+         "owner": {"id": "q1", "type": "CALL_QUEUE"}, "location": {"id": "loc2"}},
+        {"phoneNumber": "+19195550199"},
+    ],
+    "devices": [{"id": "d1", "mac": "aa:bb:cc:dd:ee:ff", "personId": "p1"}],
+    "call_queues": [{"id": "q1", "name": "Support", "locationId": "loc2",
+                     "agents": [{"id": "p2"}]}],
+    "hunt_groups": [{"id": "h1", "name": "Sales", "locationId": "loc1",
+                     "extension": "3000", "phoneNumber": "4155550111"}],
+}
+
+
+def test_indexes_answer_point_lookups():
+    index = DirectoryIndex()
+    index.load(SNAPSHOT, built_at=1.0)
+
+    assert index.person_by_email("ada@example.COM")["id"] == "p1"
+    assert {o["ownerId"] for o in index.owners_by_extension("1001")} == {"p1", "p2"}
+    [owner] = index.owners_by_extension("1001", location_id="loc2")
+    assert owner["owner"]["displayName"] == "Bob Smith"
+
+    assert index.owner_by_number("415-555-0100")["ownerId"] == "p1"
+    queue = index.owner_by_number("+1 919 555 0100")
+    assert queue["ownerType"] == "CALL_QUEUE" and queue["owner"]["name"] == "Support"
+    assert index.owner_by_number("+19195550199") is None
+    assert index.owner_by_number("4155550111")["ownerId"] == "h1"
+
+    assert index.device_by_mac("AABB.CCDD.EEFF")["id"] == "d1"
+    members = index.location_members("loc1")
+    assert [p["id"] for p in members["people"]] == ["p1"]
+    # Devices inherit their owner's location.
+    assert [d["id"] for d in members["devices"]] == ["d1"]
+    assert [h["id"] for h in members["huntGroups"]] == ["h1"]
+    assert index.queue_agents("q1") == [{"id": "p2"}]
+    assert index.queues_by_agent == {"p2": ["q1"]}
+
+
+def _directory_handler(calls):
+    collections = {
+        "/people": SNAPSHOT["people"],
+        "/locations": SNAPSHOT["locations"],
+        "/telephony/config/numbers": SNAPSHOT["numbers"],
+        "/devices": SNAPSHOT["devices"],
+        "/telephony/config/queues": [{"id": "q1", "name": "Support", "locationId": "loc2"}],
+        "/telephony/config/huntGroups": SNAPSHOT["hunt_groups"],
+    }
+
+    def handler(request):
+        path = request.url.path.removeprefix("/v1")
+        calls.append((path, dict(request.url.params)))
+        if path == "/telephony/config/queues/q1":
+            return httpx.Response(200, json={"id": "q1", "agents": [{"id": "p2"}]})
+        if path == "/people" and "email" in request.url.params:
+            return httpx.Response(200, json={"items": []})
+        return httpx.Response(200, json={"items": collections.get(path, [])})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_client_lookups_use_the_index_once_built(monkeypatch):
+    monkeypatch.setenv("WEBEX_DIRECTORY_ENABLED", "true")
+    calls = []
+    client = make_client(_directory_handler(calls))
+
+    # Cold: answered by the API while a background build starts.
+    assert await client.get_user_by_email("ada@example.com") is None
+    assert ("/people", {"email": "ada@example.com"}) in calls
+    await asyncio.sleep(0.05)
+    assert client.directory.ready
+    assert client.directory.call_queues["q1"]["agents"] == [{"id": "p2"}]
+
+    calls.clear()
+    assert (await client.get_user_by_email("ada@example.com"))["id"] == "p1"
+    assert (await client.find_phone_number_owner("+14155550100"))["ownerId"] == "p1"
+    assert (await client.find_device_by_mac("AA-BB-CC-DD-EE-FF"))["id"] == "d1"
+    assert await client.list_queue_agents("q1") == [{"id": "p2"}]
+    assert len((await client.list_location_members("loc2"))["people"]) == 1
+    assert calls == []
+
+    # A miss in the snapshot still asks the API (the user may be new).
+    assert await client.get_user_by_email("new@example.com") is None
+    assert calls == [("/people", {"email": "new@example.com"})]
+
+    status = client.get_client_stats()["directory"]
+    assert status["enabled"] and status["counts"]["people"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lookups_fall_back_to_the_api_when_disabled():
+    calls = []
+    client = make_client(_directory_handler(calls))
+    assert client.directory is None
+
+    [owner] = await client.find_by_extension("2000")
+    assert owner["ownerType"] == "CALL_QUEUE"
+    assert calls[-1] == ("/telephony/config/numbers", {"extension": "2000", "max": "100"})
+
+    await client.find_phone_number_owner("(919) 555-0100")
+    assert calls[-1][1]["phoneNumber"] == "+19195550100"
+
+    with pytest.raises(ValueError, match="WEBEX_DIRECTORY_ENABLED"):
+        await client.refresh_directory()
+    await client.aclose()
+
+
+def test_snapshot_file_round_trips(tmp_path):
+    path = tmp_path / "directory.snapshot"
+    etag = write_snapshot_file(path, SNAPSHOT, built_at=123.0)
+    assert write_snapshot_file(tmp_path / "again", SNAPSHOT, built_at=456.0) == etag
+
+    header, snapshot = read_snapshot_file(path)
+    assert header["etag"] == etag and header["builtAt"] == 123.0
+    assert header["counts"]["people"] == 2
+    assert snapshot == {name: SNAPSHOT[name] for name in COLLECTIONS}
+
+    assert read_snapshot_file(tmp_path / "missing") is None
+    (tmp_path / "junk").write_bytes(b"not a snapshot")
+    assert read_snapshot_file(tmp_path / "junk") is None
+    data = path.read_bytes().replace(b'"version":1', b'"version":9', 1)
+    (tmp_path / "future").write_bytes(data)
+    assert read_snapshot_file(tmp_path / "future") is None
+
+
+@pytest.mark.asyncio
+async def test_warm_start_loads_the_persisted_snapshot(tmp_path):
+    path = tmp_path / "directory.snapshot"
+    write_snapshot_file(path, SNAPSHOT, built_at=time.time())
+    calls = []
+    client = make_client(_directory_handler(calls))
+
+    index = DirectoryIndex(path=path)
+    await index.warm_start(client)
+    assert index.ready and index.loaded_from_disk and not index.stale
+    assert index.person_by_email("bob@example.com")["id"] == "p2"
+    assert calls == []  # fresh enough: no crawl
+
+    # An old snapshot is served at once and refreshed in the background,
+    # which rewrites the file.
+    write_snapshot_file(path, SNAPSHOT, built_at=time.time() - 7200)
+    index = DirectoryIndex(max_age=3600, path=path)
+    await index.warm_start(client)
+    assert index.ready and index.stale
+    await asyncio.sleep(0.05)
+    assert index.refreshes == 1 and not index.stale
+    header, _ = read_snapshot_file(path)
+    assert header["builtAt"] == index.built_at
+    assert index.status()["etag"] == header["etag"]
+    await client.aclose()
+
+
+def _index_state(index):
+    return (
+        index.people, index.locations, index.devices, index.call_queues, index.hunt_groups,
+        index.by_email, {k: sorted(v) for k, v in index.by_extension.items()}, index.by_number,
+        index.by_mac, {loc: {k: sorted(v) for k, v in m.items() if v}
+                       for loc, m in index.by_location.items() if any(m.values())},
+        index.queues_by_agent,
+    )
+
+
+def test_apply_change_patches_only_the_changed_entries(monkeypatch):
+    index = DirectoryIndex()
+    index.load(SNAPSHOT, built_at=1.0)
+    # Nothing is rebuilt: neither the hash indexes nor the search index.
+    monkeypatch.setattr(index, "load", None)
+    monkeypatch.setattr("mcp_webexcalling.directory.TrigramIndex", None)
+
+    changes = [
+        ("people", "p1", {"id": "p1", "displayName": "Ada King", "emails": ["ada@example.com"],
+                          "extension": "1002", "locationId": "loc2",
+                          "phoneNumbers": [{"value": "+14155550101"}]}),
+        ("people", "p2", None),
+        ("people", "p3", {"id": "p3", "displayName": "Cy Young", "extension": "2000",
+                          "locationId": "loc1", "phoneNumbers": [{"value": "+19195550100"}]}),
+        ("call_queues", "q1", {"id": "q1", "name": "Support", "locationId": "loc1",
+                               "extension": "2001", "agents": [{"id": "p3"}]}),
+        ("hunt_groups", "h1", None),
+        ("devices", "d2", {"id": "d2", "mac": "00-11-22-33-44-55", "personId": "p3"}),
+        ("locations", "loc2", {"id": "loc2", "name": "Durham"}),
+    ]
+    snapshot = {name: [dict(i) for i in items] for name, items in SNAPSHOT.items()}
+    for collection, item_id, item in changes:
+        assert index.apply_change(collection, item_id, item)
+        kept = [i for i in snapshot[collection] if i["id"] != item_id]
+        snapshot[collection] = kept + ([item] if item else [])
+
+    monkeypatch.undo()
+    rebuilt = DirectoryIndex()
+    rebuilt.load(snapshot, built_at=1.0)
+    assert _index_state(index) == _index_state(rebuilt)
+    # The inventory still owns its number and extension; p1's device moved with p1.
+    assert index.owner_by_number("+19195550100")["ownerId"] == "q1"
+    assert {o["ownerId"] for o in index.owners_by_extension("2000")} == {"q1", "p3"}
+    assert [d["id"] for d in index.location_members("loc2")["devices"]] == ["d1"]
+    assert [p["id"] for p in index.search_people("ada durham")] == ["p1"]
+    assert index.built_at == 1.0 and index.changes_applied == len(changes)
+
+
+@pytest.mark.asyncio
+async def test_lookups_return_copies_of_the_snapshot(monkeypatch):
+    monkeypatch.setenv("WEBEX_DIRECTORY_ENABLED", "true")
+    client = make_client(_directory_handler([]))
+    index = client.directory
+    index.load(SNAPSHOT, built_at=time.time())
+
+    person = await client.get_user_by_email("ada@example.com")
+    person["emails"].append("evil@example.com")
+    person["extension"] = "9999"
+    (await client.search_users("ada lovelace"))[0]["displayName"] = "Mallory"
+    index.location_members("loc1")["people"][0]["locationId"] = "loc2"
+    index.owners_by_extension("3000")[0]["owner"]["name"] = "Changed"
+    index.device_by_mac("aa:bb:cc:dd:ee:ff")["mac"] = "00"
+    index.queue_agents("q1").append({"id": "p1"})
+
+    assert index.people["p1"] == SNAPSHOT["people"][0]
+    assert index.person_by_email("evil@example.com") is None
+    assert [o["ownerId"] for o in index.owners_by_extension("1001")] == ["p1", "p2"]
+    assert index.hunt_groups["h1"]["name"] == "Sales"
+    assert index.device_by_mac("aa:bb:cc:dd:ee:ff")["mac"] == "aa:bb:cc:dd:ee:ff"
+    assert index.queue_agents("q1") == [{"id": "p2"}]
+    await client.aclose()
@@ -0,0 +1,82 @@
+"""Tests for E.164 / NANP number geolocation."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from mcp_webexcalling import number_geo
+from mcp_webexcalling.number_geo import e164_digits, locate_number, locate_numbers
+
+from tests.test_webex_client import make_client
+
+
+@pytest.mark.parametrize(
+    "number, country, subdivision",
+    [
+        ("+442071234567", "GB", None),
+        ("00 33 1 23 45 67 89", "FR", None),
+        ("011 49 30 1234567", "DE", None),
+        ("+1 (416) 555-0100", "CA", "Ontario"),
+        ("7045550100", "US", "North Carolina"),
+        ("+17875550100", "PR", None),
+        ("+18765550100", "JM", None),
+        ("+18005550100", "NANP", None),
+        ("+77011234567", "KZ", None),
+        ("+79161234567", "RU", None),
+    ],
+)
+def test_locate_number(number, country, subdivision):
+    location = locate_number(number)
+    assert location.country == country
+    assert location.subdivision == subdivision
+
+
+def test_unroutable_numbers():
+    assert e164_digits("1001") is None
+    assert locate_number("1001") is None
+    assert locate_number("+999") is None
+    assert locate_number(None) is None
+
+
+def test_batch_lookup_and_regions():
+    results = locate_numbers(["+442071234567", "+442071234567", "+61212345678", "x"])
+    assert [r.region if r else None for r in results] == ["Europe", "Europe", "Oceania", None]
+    assert number_geo.region_for_country("DO") == "Caribbean"
+    assert number_geo.country_name("CA") == "Canada"
+
+
+@pytest.mark.asyncio
+async def test_call_statistics_by_country_and_region():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    records = [
+        {"Report ID": "a", "Start time": recent, "Duration": 60,
+         "Calling number": "+17045550100", "Called number": "+442071234567"},
+        {"Report ID": "b", "Start time": recent, "Duration": 120,
+         "Calling number": "+17045550100", "Called number": "+14165550100"},
+        {"Report ID": "c", "Start time": recent, "Duration": 30,
+         "Calling number": "+33123456789", "Called number": "+17045550101"},
+    ]
+
+    def handler(request):
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        return httpx.Response(200, json={"items": records})
+
+    client = make_client(handler)
+    by_country = await client.get_call_statistics_by_country()
+    called = {g["key"]: g for g in by_country["byCalledNumber"]}
+    assert set(called) == {"GB", "CA", "US"}
+    assert called["GB"]["name"] == "United Kingdom"
+    calling = {g["key"]: g["calls"] for g in by_country["byCallingNumber"]}
+    assert calling == {"US": 2, "FR": 1}
+
+    by_region = await client.get_call_statistics_by_region(direction="to")
+    assert "byCallingNumber" not in by_region
+    regions = {g["key"]: g["calls"] for g in by_region["byCalledNumber"]}
+    assert regions == {"North America": 2, "Europe": 1}
+
+    with pytest.raises(ValueError):
+        await client.get_call_statistics_by_region(direction="sideways")
+    await client.aclose()
@@ -0,0 +1,87 @@
+"""Tests for field projection of list and detail results."""
+
+import httpx
+import pytest
+
+from mcp_webexcalling.projection import parse_fields, project
+
+from tests.test_webex_client import make_client
+
+
+PERSON = {
+    "id": "p1",
+    "displayName": "Ada",
+    "emails": ["ada@example.com"],
+    "extension": "1001",
+    "phoneNumbers": [{"type": "work", "value": "+14155550100"}],
+    "location": {"id": "loc1", "name": "HQ"},
+    "avatar": "https://example.com/a.png",
+}
+
+
+def test_parse_fields_accepts_lists_and_comma_strings():
+    assert parse_fields(None) is None
+    assert parse_fields([]) is None
+    assert parse_fields("id, displayName,id") == ("id", "displayName")
+    assert parse_fields(["emails"]) == ("emails",)
+
+
+def test_project_selects_top_level_and_nested_fields():
+    assert project(PERSON, ("id", "emails", "missing")) == {
+        "id": "p1",
+        "emails": ["ada@example.com"],
+    }
+    assert project(PERSON, ("location.id", "phoneNumbers.value")) == {
+        "location": {"id": "loc1"},
+        "phoneNumbers": [{"value": "+14155550100"}],
+    }
+    assert project(PERSON, None) is PERSON
+
+
+@pytest.mark.asyncio
+async def test_list_users_projects_pages_and_pushes_down_calling_data():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"items": [PERSON, dict(PERSON, id="p2")]})
+
+    client = make_client(handler)
+
+    users = await client.list_users(fields=["id", "displayName"])
+    assert users == [{"id": "p1", "displayName": "Ada"}, {"id": "p2", "displayName": "Ada"}]
+    assert "callingData" not in requests[-1].url.params
+
+    users = await client.list_users(fields="id,extension")
+    assert users[0] == {"id": "p1", "extension": "1001"}
+    assert requests[-1].url.params["callingData"] == "true"
+
+    streamed = [u async for u in client.iter_users(fields=["id"])]
+    assert streamed == [{"id": "p1"}, {"id": "p2"}]
+
+    devices = await client.list_devices(fields=["id"])
+    assert devices == [{"id": "p1"}, {"id": "p2"}]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_calling_settings_omit_calling_data_when_not_needed():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=PERSON)
+
+    client = make_client(handler)
+
+    assert await client.get_user_calling_settings("p1", fields=["displayName"]) == {
+        "displayName": "Ada"
+    }
+    assert "callingData" not in requests[-1].url.params
+
+    settings = await client.get_user_calling_settings("p1", fields=["extension"])
+    assert settings == {"extension": "1001"}
+    assert requests[-1].url.params["callingData"] == "true"
+
+    assert await client.get_user_calling_settings("p1") == PERSON
+    await client.aclose()
@@ -0,0 +1,56 @@
+"""Tests for the mergeable quantile sketch."""
+
+import random
+
+import pytest
+
+from mcp_webexcalling.quantiles import QuantileSketch
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(4, 1.2) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.extend(values)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert sketch.quantile(0) == pytest.approx(min(values), rel=0.011)
+    assert sketch.quantile(1) == pytest.approx(max(values), rel=0.011)
+    # Log buckets: memory tracks the value range, not the count.
+    assert len(sketch._bins) < 1000
+
+
+def test_merged_shards_equal_single_sketch():
+    rng = random.Random(3)
+    values = [rng.randint(0, 3600) for _ in range(5000)]
+    whole = QuantileSketch()
+    whole.extend(values)
+
+    shards = [QuantileSketch() for _ in range(4)]
+    for i, value in enumerate(values):
+        shards[i % 4].add(value)
+    merged = QuantileSketch()
+    for shard in shards:
+        merged.merge(shard)
+
+    assert merged.count == whole.count
+    assert merged.percentiles() == whole.percentiles()
+
+
+def test_empty_sketch_and_zeros():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None
+    assert sketch.percentiles() is None
+    sketch.extend([0, 0, 0, 10])
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(10, rel=0.01)
+
+    with pytest.raises(ValueError):
+        sketch.merge(QuantileSketch(relative_accuracy=0.02))
@@ -0,0 +1,72 @@
+"""Tests for the adaptive (AIMD) token-bucket rate limiter."""
+
+import httpx
+import pytest
+
+from mcp_webexcalling.rate_limit import AdaptiveRateLimiter
+from mcp_webexcalling.webex_client import WebexClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_throttle_halves_rate_and_success_probes_back_up():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(
+        10.0, min_rate=1.0, max_rate=12.0, increase_step=1.0, clock=clock
+    )
+    limiter.on_throttle(retry_after=5)
+    state = limiter.snapshot()
+    assert state["rate"] == 5.0
+    assert state["throttleEvents"] == 1
+    assert state["pausedForSeconds"] == 5.0
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.rate == 12.0  # capped at max_rate
+
+
+def test_rate_never_drops_below_floor():
+    limiter = AdaptiveRateLimiter(1.0, min_rate=0.5, clock=FakeClock())
+    for _ in range(10):
+        limiter.on_throttle()
+    assert limiter.rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_acquire_consumes_burst_without_waiting():
+    limiter = AdaptiveRateLimiter(1000.0, burst=5)
+    for _ in range(5):
+        await limiter.acquire()
+    state = limiter.snapshot()
+    assert state["totalAcquired"] == 5
+    assert state["totalWaitSeconds"] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_client_feeds_429_into_host_limiter():
+    calls = {"n": 0}
+
+    def handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+    client = WebexClient(access_token="t", retry_backoff=0.0, rate_limit=1000.0)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await client._request("GET", "/people")
+
+    stats = client.get_client_stats()["rateLimits"]
+    assert stats["enabled"] is True
+    host = stats["hosts"]["webexapis.com"]
+    assert host["throttleEvents"] == 1
+    assert host["totalAcquired"] == 2
+    # The analytics host has its own, untouched bucket.
+    assert stats["hosts"]["analytics.webexapis.com"]["throttleEvents"] == 0
+    await client.aclose()
@@ -0,0 +1,75 @@
+"""Tests for the trigram people-search index."""
+
+import time
+
+import pytest
+
+from mcp_webexcalling.search_index import TrigramIndex, normalize_query, trigrams
+
+from tests.test_directory import SNAPSHOT, _directory_handler
+from tests.test_webex_client import make_client
+
+
+PEOPLE = {
+    "p1": {"id": "p1", "displayName": "John Smith", "firstName": "John",
+           "lastName": "Smith", "emails": ["jsmith@example.com"], "extension": "1001",
+           "locationId": "loc1"},
+    "p2": {"id": "p2", "displayName": "Bob Jones", "firstName": "Bob",
+           "lastName": "Jones", "emails": ["bob.jones@example.com"], "locationId": "loc2",
+           "phoneNumbers": [{"type": "work", "value": "+1 919-555-0142"}]},
+    "p3": {"id": "p3", "displayName": "Robert Bobson", "emails": ["rbobson@example.com"],
+           "locationId": "loc1"},
+    "p4": {"id": "p4", "displayName": "Zoë Ångström", "emails": ["zoe@example.com"]},
+}
+LOCATIONS = {"loc1": {"id": "loc1", "name": "HQ"}, "loc2": {"id": "loc2", "name": "Raleigh"}}
+
+
+def _ids(hits):
+    return [person_id for person_id, _ in hits]
+
+
+def test_trigrams_and_query_normalisation():
+    assert trigrams("bob") == {"  b", " bo", "bob", "ob "}
+    assert normalize_query("(919) 555-0142") == "9195550142"
+    assert normalize_query("  Zoë  Ångström ") == "zoe angstrom"
+
+
+def test_ranked_fuzzy_search():
+    index = TrigramIndex(PEOPLE, LOCATIONS)
+    assert _ids(index.search("jon smyth")) == ["p1"]  # typos
+    assert _ids(index.search("bob"))[:2] == ["p2", "p3"]  # exact first name ranks first
+    assert _ids(index.search("bob raleigh"))[0] == "p2"  # name + location
+    assert _ids(index.search("jsmith@example.com")) == ["p1"]
+    assert _ids(index.search("1001")) == ["p1"]
+    assert _ids(index.search("919 555 0142")) == ["p2"]
+    assert _ids(index.search("zoe angstrom")) == ["p4"]
+    assert index.search("nobody") == []
+    assert len(index.search("example", limit=1)) <= 1
+    assert index.stats()["documents"] == 4
+
+
+@pytest.mark.asyncio
+async def test_search_users_answers_locally_and_falls_back_on_a_miss(monkeypatch):
+    monkeypatch.setenv("WEBEX_DIRECTORY_ENABLED", "true")
+    calls = []
+    client = make_client(_directory_handler(calls))
+    client.directory.load(SNAPSHOT, built_at=time.time())
+
+    assert [p["id"] for p in await client.search_users("ada lovlace")] == ["p1"]
+    assert [p["id"] for p in await client.search_users("bob raleigh")][0] == "p2"
+    assert calls == []
+
+    await client.search_users("zz top")
+    assert [path for path, _ in calls] == ["/people"]
+    await client.aclose()
+
+
+def test_people_can_be_replaced_and_discarded():
+    index = TrigramIndex(PEOPLE, LOCATIONS)
+    index.add("p1", {"id": "p1", "displayName": "Kim Park", "extension": "1009"})
+    assert _ids(index.search("john smith")) == []
+    assert _ids(index.search("kim park")) == ["p1"]
+    assert _ids(index.search("1001")) == [] and _ids(index.search("1009")) == ["p1"]
+    index.discard("p2")
+    assert _ids(index.search("bob"))[:1] == ["p3"]
+    assert len(index) == 3
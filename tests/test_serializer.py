@@ -0,0 +1,66 @@
+"""Tests for tool response serialization."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from mcp_webexcalling import config, serializer, server
+
+
+@dataclass
+class Point:
+    x: int
+
+
+PAYLOAD = {
+    "name": "Zoë",
+    "when": datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc),
+    "point": Point(1),
+    "counts": {1: "one"},
+    "items": [1, 2.5, None, True],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serializer, "orjson", None)
+    elif serializer.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_compact_by_default_and_backend_independent(encoder):
+    text = serializer.dumps(PAYLOAD)
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text) == {
+        "name": "Zoë",
+        "when": "2024-05-01 10:00:00+00:00",
+        "point": "Point(x=1)",
+        "counts": {"1": "one"},
+        "items": [1, 2.5, None, True],
+    }
+    assert json.loads(serializer.dumps(PAYLOAD, indent=2)) == json.loads(text)
+    assert serializer.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_values_orjson_rejects_fall_back_to_stdlib():
+    assert json.loads(serializer.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+    assert serializer.dumps([1], indent=4) == "[\n    1\n]"
+
+
+@pytest.mark.asyncio
+async def test_per_tool_indent_override(monkeypatch, mock_server_client):
+    client = mock_server_client(lambda request: httpx.Response(200, json={"id": "p1"}))
+
+    [content] = await server.call_tool("get_user_details", {"person_id": "p1"})
+    assert content.text == '{"id":"p1"}'
+
+    monkeypatch.setenv("WEBEX_JSON_INDENT_OVERRIDES", '{"get_user_details": 2}')
+    config.reset_settings_cache()
+    [content] = await server.call_tool("get_user_details", {"person_id": "p1"})
+    assert content.text == '{\n  "id": "p1"\n}'
+    await client.aclose()
@@ -0,0 +1,96 @@
+"""Tests for the tool registry and the server's registry-based dispatch."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from mcp.types import ListToolsRequest
+
+from mcp_webexcalling import server
+from mcp_webexcalling.tool_registry import ToolRegistry
+
+
+def test_catalog_comes_from_the_registry():
+    tools = asyncio.run(server.list_tools())
+    names = [tool.name for tool in tools]
+    assert len(names) == len(set(names)) == len(server.registry) == 98
+    assert names[0] == "test_connection"
+    assert all(name in server.registry for name in names)
+    spec = server.registry.get("get_user_details")
+    assert spec.input_schema["required"] == ["person_id"]
+
+
+def test_catalog_is_built_once():
+    assert server.registry.catalog() is server.registry.catalog()
+
+    handler = server.server.request_handlers[ListToolsRequest]
+    request = ListToolsRequest(method="tools/list")
+    first = asyncio.run(handler(request))
+    assert asyncio.run(handler(request)) is first
+    assert len(first.root.tools) == len(server.registry)
+
+    registry = ToolRegistry()
+    registry.tool(name="a", description="", input_schema={})(None)
+    before = registry.catalog()
+    registry.tool(name="b", description="", input_schema={})(None)
+    assert [tool.name for tool in registry.catalog()] == ["a", "b"]
+    assert len(before) == 1
+
+
+def test_duplicate_registration_is_rejected():
+    registry = ToolRegistry()
+
+    @registry.tool(name="ping", description="", input_schema={"type": "object"})
+    async def ping(client, arguments):
+        return "pong"
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.tool(name="ping", description="", input_schema={})(ping)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_dispatches_and_formats(mock_server_client):
+    def handler(request):
+        if request.url.path.endswith("/people"):
+            return httpx.Response(200, json={"items": []})
+        return httpx.Response(200, json={"id": "p1", "displayName": "Ada"})
+
+    client = mock_server_client(handler)
+
+    [content] = await server.call_tool("get_user_details", {"person_id": "p1"})
+    assert json.loads(content.text)["displayName"] == "Ada"
+
+    # Handlers returning a string are passed through verbatim.
+    [content] = await server.call_tool("get_user_by_email", {"email": "x@example.com"})
+    assert content.text == "User with email x@example.com not found"
+
+    [content] = await server.call_tool("no_such_tool", {})
+    assert content.text == "Unknown tool: no_such_tool"
+
+    [content] = await server.call_tool("get_user_details", {})
+    assert content.text.startswith("Error calling get_user_details:")
+
+    stats = server.registry.get("get_user_details").stats()
+    assert stats["calls"] >= 2 and stats["errors"] >= 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_parallel_invocations():
+    registry = ToolRegistry()
+    active = {"now": 0, "peak": 0}
+
+    @registry.tool(name="slow", description="", input_schema={}, max_concurrency=2)
+    async def slow(client, arguments):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return arguments["i"]
+
+    spec = registry.get("slow")
+    results = await asyncio.gather(*(spec.invoke(None, {"i": i}) for i in range(6)))
+    assert results == list(range(6))
+    assert active["peak"] == 2
+    assert registry.stats()["slow"]["calls"] == 6
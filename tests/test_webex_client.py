@@ -3,10 +3,16 @@
 These use httpx.MockTransport so no network access is required.
 """
 
+import base64
+
 import httpx
 import pytest
 
-from mcp_webexcalling.webex_client import WebexClient, WebexApiError
+from mcp_webexcalling.webex_client import (
+    WebexClient,
+    WebexApiError,
+    WebexPaginationError,
+)
 
 
 def make_client(handler, **kwargs):
@@ -205,3 +211,326 @@ async def test_test_connection_handles_bad_token():
     assert result["status_code"] == 401
     assert "hint" in result
     await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_items_streams_and_stops_early():
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params.get("page", "1"))
+        requested.append(page)
+        next_url = str(request.url.copy_set_param("page", str(page + 1)))
+        return httpx.Response(
+            200,
+            json={"items": [{"id": page * 10 + i} for i in range(3)]},
+            headers={"Link": f'<{next_url}>; rel="next"'},
+        )
+
+    client = make_client(handler)
+    seen = []
+    async for item in client.iter_users():
+        seen.append(item["id"])
+        if len(seen) == 4:
+            break
+    assert seen == [10, 11, 12, 20]
+    # Only the pages actually consumed were fetched.
+    assert requested == [1, 2]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_items_respects_max_results():
+    def handler(request):
+        next_url = str(request.url.copy_set_param("page", "2"))
+        return httpx.Response(
+            200,
+            json={"items": [{"id": 1}, {"id": 2}, {"id": 3}]},
+            headers={"Link": f'<{next_url}>; rel="next"'},
+        )
+
+    client = make_client(handler)
+    items = [i async for i in client.iter_devices(max_results=5)]
+    assert len(items) == 5
+    await client.aclose()
+
+
+def _paged_handler(pages, fail_on=None, failures=1):
+    """Serve ``pages`` of ids via Link headers, failing page ``fail_on``."""
+    state = {"failures": 0, "calls": []}
+
+    def handler(request):
+        page = int(request.url.params.get("page", "1"))
+        state["calls"].append(page)
+        if page == fail_on and state["failures"] < failures:
+            state["failures"] += 1
+            return httpx.Response(502, json={"message": "bad gateway"})
+        headers = {}
+        if page < len(pages):
+            next_url = str(request.url.copy_set_param("page", str(page + 1)))
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(
+            200, json={"items": [{"id": i} for i in pages[page - 1]]}, headers=headers
+        )
+
+    return handler, state
+
+
+@pytest.mark.asyncio
+async def test_pagination_hop_is_retried():
+    handler, state = _paged_handler([[1, 2], [3, 4], [5]], fail_on=2)
+    client = make_client(handler, max_retries=2)
+    items = await client._get_items("/people", {}, max_results=0)
+    assert [i["id"] for i in items] == [1, 2, 3, 4, 5]
+    assert state["calls"] == [1, 2, 2, 3]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pagination_failure_is_resumable():
+    handler, state = _paged_handler([[1, 2], [3, 4], [5]], fail_on=3, failures=10)
+    client = make_client(handler, max_retries=1)
+    with pytest.raises(WebexPaginationError) as exc:
+        await client._get_items("/people", {}, max_results=0)
+    assert [i["id"] for i in exc.value.partial_items] == [1, 2, 3, 4]
+    assert "page=3" in exc.value.resume_url
+
+    # The outage clears; resuming fetches only the remaining page.
+    handler_ok, state_ok = _paged_handler([[1, 2], [3, 4], [5]])
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler_ok), headers=client.headers
+    )
+    rest = await client._get_items(
+        "/people", max_results=0, resume_url=exc.value.resume_url
+    )
+    assert [i["id"] for i in rest] == [5]
+    assert state_ok["calls"] == [3]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_are_coalesced():
+    import asyncio
+
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "p1", "features": {}})
+
+    client = make_client(handler)
+    results = await asyncio.gather(
+        client.get_user_calling_settings("p1"),
+        client.get_user_calling_settings("p1"),
+        client.get_user_calling_settings("p1"),
+        client.get_user_details("p1"),  # different params -> own request
+    )
+    assert len(calls) == 2
+    assert client.get_client_stats()["coalescing"]["coalescedRequests"] == 2
+
+    # Each caller gets an independent copy it can safely mutate.
+    results[0]["features"]["callPark"] = True
+    assert results[1]["features"] == {}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_get_shares_errors_and_does_not_stick():
+    import asyncio
+
+    calls = {"n": 0}
+
+    async def handler(request):
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, json={"message": "missing"})
+
+    client = make_client(handler, max_retries=0)
+    results = await asyncio.gather(
+        client.get_user_details("x"),
+        client.get_user_details("x"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, WebexApiError) for r in results)
+    assert calls["n"] == 1
+
+    # A later call is not served from the finished flight.
+    with pytest.raises(WebexApiError):
+        await client.get_user_details("x")
+    assert calls["n"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cdr_fetch_shards_window_and_follows_pagination():
+    windows = []
+
+    def handler(request):
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        assert request.url.host == "analytics.webexapis.com"
+        params = request.url.params
+        if "page" not in params:
+            windows.append((params["startTime"], params["endTime"]))
+        start = params["startTime"]
+        page = params.get("page")
+        if page is None:
+            next_url = str(request.url.copy_set_param("page", "2"))
+            return httpx.Response(
+                200,
+                json={"items": [
+                    {"Report ID": f"{start}-a", "Start time": start},
+                    # Same record reported at a window boundary.
+                    {"Report ID": "boundary", "Start time": "2024-01-01T02:00:00.000Z"},
+                ]},
+                headers={"Link": f'<{next_url}>; rel="next"'},
+            )
+        return httpx.Response(
+            200, json={"items": [{"Report ID": f"{start}-b", "Start time": start}]}
+        )
+
+    client = make_client(handler)
+    client.cdr_shard_minutes = 120
+    records = await client.get_call_detail_records(
+        start_time="2024-01-01T00:00:00.000Z",
+        end_time="2024-01-01T06:00:00.000Z",
+        max_results=0,
+    )
+    assert sorted(windows) == [
+        ("2024-01-01T00:00:00.000Z", "2024-01-01T02:00:00.000Z"),
+        ("2024-01-01T02:00:00.000Z", "2024-01-01T04:00:00.000Z"),
+        ("2024-01-01T04:00:00.000Z", "2024-01-01T06:00:00.000Z"),
+    ]
+    ids = [r["Report ID"] for r in records]
+    # 3 windows x 2 pages, with the shared boundary record kept once.
+    assert len(ids) == 7
+    assert ids.count("boundary") == 1
+    starts = [r["Start time"] for r in records]
+    assert starts == sorted(starts)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_small_cdr_pull_is_a_single_request():
+    calls = {"n": 0}
+
+    def handler(request):
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        calls["n"] += 1
+        return httpx.Response(200, json={"items": [{"Report ID": str(i)} for i in range(5)]})
+
+    client = make_client(handler)
+    records = await client.get_call_detail_records(
+        start_time="2024-01-01T00:00:00.000Z",
+        end_time="2024-01-02T00:00:00.000Z",
+        max_results=3,
+    )
+    assert len(records) == 3
+    assert calls["n"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_working_cdr_variation_is_learned_and_persisted():
+    cdr_calls = []
+
+    def handler(request):
+        if request.url.path.endswith("/people/me"):
+            return httpx.Response(200, json={"orgId": "org1"})
+        params = dict(request.url.params)
+        cdr_calls.append(params)
+        # This org only accepts requests that carry an explicit page size.
+        if "max" not in params:
+            return httpx.Response(400, json={"message": "Invalid input string"})
+        return httpx.Response(200, json={"items": []})
+
+    window = dict(
+        start_time="2024-01-01T00:00:00.000Z",
+        end_time="2024-01-01T01:00:00.000Z",
+    )
+    client = make_client(handler)
+    await client.get_call_detail_records(**window)
+    assert len(cdr_calls) == 2  # "minimal" rejected, "full" accepted
+    await client.aclose()
+
+    # A fresh client (e.g. after a restart) goes straight to the working shape.
+    cdr_calls.clear()
+    client = make_client(handler)
+    await client.get_call_detail_records(**window)
+    assert len(cdr_calls) == 1
+    assert "max" in cdr_calls[0]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_users_runs_strategies_concurrently_and_merges():
+    import asyncio
+
+    in_flight = {"now": 0, "max": 0}
+    calls = []
+
+    async def handler(request):
+        path = request.url.path.removeprefix("/v1")
+        params = dict(request.url.params)
+        calls.append((path, params))
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if path == "/telephony/config/numbers":
+            owner = "p1" if "extension" in params else "p2"
+            return httpx.Response(200, json={"items": [
+                {"owner": {"id": owner, "type": "PEOPLE"}},
+                {"owner": {"id": "q1", "type": "CALL_QUEUE"}},
+            ]})
+        if path == "/people" and "id" in params:
+            return httpx.Response(200, json={"items": [
+                {"id": i, "displayName": i} for i in params["id"].split(",")
+            ]})
+        return httpx.Response(200, json={"items": []})
+
+    client = make_client(handler)
+    # 7-10 digits: could be an extension or a phone number -> both, at once.
+    result = await client.search_users("5550100", explain=True)
+    assert [p["id"] for p in result["items"]] == ["p1", "p2"]  # extension first
+    assert result["source"] == "api"
+    assert set(result["strategies"]) == {"extension", "phoneNumber"}
+    assert result["strategies"]["extension"]["count"] == 1
+    assert in_flight["max"] == 2
+    assert ("/telephony/config/numbers", {"phoneNumber": "+5550100"}) not in calls
+
+    calls.clear()
+    await client.search_users("ada@example.com")
+    await client.search_users("Ada")
+    assert [sorted(p) for _, p in calls] == [["email", "max"], ["displayName", "max"]]
+
+    calls.clear()
+    uuid = "0f4e1d5e-3b2a-4c5d-8e9f-0a1b2c3d4e5f"
+    await client.search_users(uuid)
+    [(_, params)] = calls
+    assert base64.b64decode(params["id"] + "==").decode().endswith(uuid)
+
+    stats = client.get_client_stats()["search"]
+    assert stats["extension"]["calls"] == 1 and stats["displayName"]["calls"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_users_survives_one_failing_strategy():
+    def handler(request):
+        if "extension" in request.url.params:
+            return httpx.Response(400, json={"message": "bad extension"})
+        if request.url.path.endswith("/numbers"):
+            return httpx.Response(200, json={"items": [{"owner": {"id": "p2", "type": "PEOPLE"}}]})
+        return httpx.Response(200, json={"items": [{"id": "p2"}]})
+
+    client = make_client(handler)
+    result = await client.search_users("4155550100", explain=True)
+    assert [p["id"] for p in result["items"]] == ["p2"]
+    assert "error" in result["strategies"]["extension"]
+
+    with pytest.raises(WebexApiError):
+        await client.search_users("1234")  # extension only, and it fails
+    await client.aclose()
@@ -0,0 +1,137 @@
+"""Tests for the webhook receiver."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from mcp_webexcalling.directory import DirectoryIndex
+from mcp_webexcalling.webhooks import WebhookReceiver, sign, verify_signature
+
+from tests.test_directory import SNAPSHOT
+from tests.test_webex_client import make_client
+
+
+SECRET = "s3cret"
+
+
+def test_signature_verification():
+    body = b'{"resource":"people"}'
+    signature = sign(SECRET, body)
+    assert verify_signature(SECRET, body, signature)
+    assert verify_signature(SECRET, body, signature.upper())
+    assert not verify_signature(SECRET, body + b" ", signature)
+    assert not verify_signature("other", body, signature)
+    assert not verify_signature(SECRET, body, None)
+
+
+def test_secret_is_required():
+    with pytest.raises(ValueError, match="WEBEX_WEBHOOK_SECRET"):
+        WebhookReceiver(client=None, secret="")
+
+
+async def _post(port, body, signature=None, path="/webex/events", method="POST"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    headers = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if signature is not None:
+        headers += f"X-Spark-Signature: {signature}\r\n"
+    writer.write(headers.encode() + b"\r\n" + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+    return int(status_line.split()[1])
+
+
+@pytest.mark.asyncio
+async def test_events_invalidate_cache_and_patch_directory():
+    people = {"p1": {"id": "p1", "displayName": "Ada King", "emails": ["ada@example.com"]}}
+    calls = []
+
+    def handler(request):
+        path = request.url.path.removeprefix("/v1")
+        calls.append(path)
+        if path.startswith("/people/"):
+            return httpx.Response(200, json=people[path.rsplit("/", 1)[1]])
+        return httpx.Response(200, json={"items": []})
+
+    client = make_client(handler, cache_enabled=True)
+    client.directory = DirectoryIndex()
+    client.directory.load(SNAPSHOT, built_at=1.0)
+    await client._request("GET", "/people/p1")
+    await client._request("GET", "/people")
+    assert len(client.cache) == 2
+
+    receiver = WebhookReceiver(client, SECRET, port=0)
+    await receiver.start()
+    try:
+        event = json.dumps(
+            {"resource": "people", "event": "updated", "data": {"id": "p1"}}
+        ).encode()
+        assert await _post(receiver.port, event, "bad") == 401
+        assert await _post(receiver.port, event) == 401
+        assert await _post(receiver.port, b"{}", sign(SECRET, b"{}"), path="/x") == 404
+        assert await _post(receiver.port, event, sign(SECRET, event)) == 200
+        await asyncio.sleep(0.05)
+    finally:
+        await receiver.stop()
+
+    # Both cached entries were dropped; only the re-read object is cached again.
+    assert len(client.cache) == 1 and calls.count("/people/p1") == 2
+    assert client.directory.people["p1"]["displayName"] == "Ada King"
+    assert client.directory.person_by_email("ada@example.com")["id"] == "p1"
+    assert [p["id"] for p in client.directory.search_people("ada king")] == ["p1"]
+    assert client.directory.built_at == 1.0  # patched, not rebuilt
+
+    summary = await receiver.handle_event(
+        {"resource": "people", "event": "deleted", "data": {"id": "p2"}}
+    )
+    assert summary["directory"] == "removed"
+    assert client.directory.person_by_email("bob@example.com") is None
+    assert client.directory.search_people("bob smith") == []
+
+    # Real Webex messaging events don't touch anything this server caches.
+    assert (await receiver.handle_event(
+        {"resource": "messages", "event": "created", "data": {"id": "m1", "roomId": "r1"}}
+    ))["ignored"]
+    stats = receiver.stats()
+    assert stats["rejected"] == 2 and stats["directoryUpdates"] == 2
+    assert stats["ignored"] == 1 and not stats["running"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_only_directory_notices_remove_cached_responses():
+    def handler(request):
+        return httpx.Response(200, json={"id": "p1", "items": []})
+
+    client = make_client(handler, cache_enabled=True)
+    # Cached through the client, with the default TTLs: voicemail isn't cached.
+    for path in ("/people/p1", "/people", "/telephony/voicemail/messages"):
+        await client._request("GET", path)
+    assert len(client.cache) == 2
+    receiver = WebhookReceiver(client, SECRET, port=0)
+
+    # Payload shapes as delivered by Webex: none of them touch cached data.
+    for event in (
+        {"id": "wh1", "name": "recordings", "targetUrl": "https://example.com/webex/events",
+         "resource": "convergedRecordings", "event": "deleted", "orgId": "org1",
+         "createdBy": "p9", "appId": "app1", "ownedBy": "org", "status": "active",
+         "actorId": "p9", "data": {"id": "rec1", "orgId": "org1", "ownerId": "p1"}},
+        {"id": "wh2", "name": "calls", "resource": "telephony_calls", "event": "updated",
+         "orgId": "org1", "actorId": "p1",
+         "data": {"eventType": "disconnected", "callId": "c1", "callSessionId": "s1",
+                  "personality": "originator", "state": "disconnected", "personId": "p1"}},
+        {"resource": "telephony_mwi", "event": "updated",
+         "data": {"personId": "p1", "messageSummary": {"newMessages": 1}}},
+    ):
+        assert (await receiver.handle_event(event))["ignored"]
+    assert len(client.cache) == 2
+
+    # A directory notice from provisioning tooling drops the real entries.
+    summary = await receiver.handle_event(
+        {"resource": "people", "event": "updated", "data": {"id": "p1"}}
+    )
+    assert summary["cacheInvalidations"] == 2 and len(client.cache) == 0
+    assert receiver.stats()["ignored"] == 3
+    await client.aclose()